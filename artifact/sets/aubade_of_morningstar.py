@@ -100,6 +100,22 @@ class AubadeOfMorningstarSet(BaseArtifactSet):
             self.on_field_timer = 0
             self._effect_active = True
 
+    def next_wakeup(self, frame: int) -> float:
+        """[快进协议] 场上计时仅影响伤害结算时的判定，空闲帧内无需唤醒。"""
+        return float("inf")
+
+    def fast_forward(self, frames: int) -> None:
+        """[快进协议] 按空闲帧数推进场上计时。"""
+        if not self.char:
+            return
+        if self.char.on_field:
+            self.on_field_timer += frames
+            if self.on_field_timer >= self.ON_FIELD_THRESHOLD:
+                self._effect_active = False
+        else:
+            self.on_field_timer = 0
+            self._effect_active = True
+
     def _apply_lunar_bonus(self, event: GameEvent) -> None:
         """
         在伤害计算前注入月曜反应伤害加成。
@@ -139,6 +139,9 @@ class FurinaFanfareEffect(BaseEffect):
     def on_tick(self, target: Any):
         pass
 
+    def next_wakeup(self, frame: int) -> float:
+        return super().next_wakeup(frame)
+
 
 class FurinaCenterOfAttentionHeal(BaseEffect):
     """C6 荒性分支产生的全队持续治疗效果。"""
@@ -153,6 +156,17 @@ class FurinaCenterOfAttentionHeal(BaseEffect):
             self._do_team_heal()
             self.timer = 0
 
+    def next_wakeup(self, frame: int) -> float:
+        wake = super().next_wakeup(frame)
+        if not self.is_active:
+            return wake
+        return min(wake, frame + max(1, 60 - self.timer))
+
+    def fast_forward(self, frames: int) -> None:
+        super().fast_forward(frames)
+        if self.is_active:
+            self.timer += frames
+
     def _do_team_heal(self):
         hp = AttributeCalculator.get_val_by_name(self.owner, "生命值")
         heal_val = hp * 0.04
@@ -1,6 +1,6 @@
-﻿from typing import Any
+﻿from typing import Any, cast
 
-from core.entities.base_entity import CombatEntity, Faction
+from core.entities.base_entity import BaseEntity, CombatEntity, EntityState, Faction
 from core.systems.contract.attack import (
     AttackConfig,
     HitboxConfig,
@@ -84,7 +84,7 @@ class SalonMember(FurinaSummonBase):
             "海薇玛夫人伤害": "SKILL_CHEVALMARIN_INTERVAL",
             "谢贝蕾妲小姐伤害": "SKILL_CRABALETTA_INTERVAL",
         }[attack_name]
-        self.interval = MECHANISM_CONFIG[interval_key]
+        self.interval = cast(int, MECHANISM_CONFIG[interval_key])
 
         # 预载配置
         self.attack_config = self._build_attack_config(attack_name)
@@ -119,6 +119,19 @@ class SalonMember(FurinaSummonBase):
             self.execute_attack()
             self.timer = 0
 
+    def next_wakeup(self, frame: int) -> float:
+        # 沙龙成员不驱动附着与效果，仅按攻击间隔唤醒
+        wake = BaseEntity.next_wakeup(self, frame)
+        if self.state != EntityState.ACTIVE:
+            return wake
+        return min(wake, frame + max(1, self.interval - self.timer))
+
+    def fast_forward(self, frames: int) -> None:
+        if self.state != EntityState.ACTIVE:
+            return
+        BaseEntity.fast_forward(self, frames)
+        self.timer += frames
+
     def execute_attack(self) -> None:
         # 处理全队生命值消耗并获取伤害提升比例 (0.1 ~ 0.4)
         bonus_ratio = self._process_hp_consumption_ratio()
@@ -187,8 +200,8 @@ class SingerOfManyWaters(FurinaSummonBase):
 
     def __init__(self, owner: Any, context: Any) -> None:
         super().__init__("众水的歌者", owner, context)
-        self.first_heal = MECHANISM_CONFIG["SKILL_FIRST_HEAL_FRAME"]
-        self.current_interval = MECHANISM_CONFIG["SKILL_HEAL_INTERVAL"]
+        self.first_heal = cast(int, MECHANISM_CONFIG["SKILL_FIRST_HEAL_FRAME"])
+        self.current_interval = cast(int, MECHANISM_CONFIG["SKILL_HEAL_INTERVAL"])
         self.timer = 0
         self.has_first_healed = False
 
@@ -205,15 +218,35 @@ class SingerOfManyWaters(FurinaSummonBase):
             self.execute_healing()
             self.timer = 0
 
+    def next_wakeup(self, frame: int) -> float:
+        wake = BaseEntity.next_wakeup(self, frame)
+        if self.state != EntityState.ACTIVE:
+            return wake
+        if not self.has_first_healed:
+            steps = self.first_heal - self.current_frame
+        else:
+            steps = self.current_interval - self.timer
+        return min(wake, frame + max(1, steps))
+
+    def fast_forward(self, frames: int) -> None:
+        if self.state != EntityState.ACTIVE:
+            return
+        BaseEntity.fast_forward(self, frames)
+        if self.has_first_healed:
+            self.timer += frames
+
     def execute_healing(self) -> None:
         if not self.ctx.space or not self.ctx.space.team:
             return
 
         # 动态更新间隔 (天赋二驱动)
-        self.current_interval = getattr(
-            self.owner,
-            "singer_interval_override",
-            MECHANISM_CONFIG["SKILL_HEAL_INTERVAL"],
+        self.current_interval = cast(
+            int,
+            getattr(
+                self.owner,
+                "singer_interval_override",
+                MECHANISM_CONFIG["SKILL_HEAL_INTERVAL"],
+            ),
         )
 
         mult_info = ELEMENTAL_SKILL_DATA["众水的歌者治疗量"]
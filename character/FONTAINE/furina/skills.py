@@ -89,7 +89,12 @@ class FurinaElementalSkill(SkillBase):
     def to_action_data(
         self, intent: Optional[Dict[str, Any]] = None
     ) -> ActionFrameData:
-        mode = self.caster.arkhe_mode
+        return self.compiled_action(self.caster.arkhe_mode)
+
+    def action_variants(self) -> List[str]:
+        return ["荒", "芒"]
+
+    def build_action(self, mode: str) -> ActionFrameData:
         # 统一命名规范：使用原生中文 Key
         frame_key = "元素战技-荒" if mode == "荒" else "元素战技-芒"
         f = ACTION_FRAME_DATA[frame_key]
@@ -165,6 +170,12 @@ class FurinaElementalSkill(SkillBase):
         if self.remaining_frames > 0:
             self.remaining_frames -= 1
 
+    def next_wakeup(self, frame: int) -> float:
+        return float("inf")
+
+    def fast_forward(self, frames: int) -> None:
+        self.remaining_frames = max(0, self.remaining_frames - frames)
+
 
 class FurinaElementalBurst(EnergySkill):
     """元素爆发：万众狂欢。"""
@@ -172,6 +183,12 @@ class FurinaElementalBurst(EnergySkill):
     def to_action_data(
         self, intent: Optional[Dict[str, Any]] = None
     ) -> ActionFrameData:
+        return self.compiled_action()
+
+    def action_variants(self) -> List[Any]:
+        return [None]
+
+    def build_action(self, variant: Any) -> ActionFrameData:
         # 统一命名规范：使用 '元素爆发'
         f = ACTION_FRAME_DATA["元素爆发"]
         p = ATTACK_DATA["元素爆发"]
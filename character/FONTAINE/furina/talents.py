@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import cast
+
 from core.effect.common import TalentEffect
 from core.event import EventType, GameEvent
 from core.systems.contract.healing import Healing, HealingType
@@ -48,6 +50,19 @@ class EndlessWaltz(TalentEffect):
             self._execute_team_healing()
             self.heal_timer = 0
 
+    def next_wakeup(self, frame: int) -> float:
+        if not self.is_active or self.active_timer <= 0:
+            return float("inf")
+        steps = 120 - self.heal_timer
+        return frame + max(1, steps) if steps <= self.active_timer else float("inf")
+
+    def fast_forward(self, frames: int) -> None:
+        if not self.is_active or self.active_timer <= 0:
+            return
+        elapsed = min(frames, self.active_timer)
+        self.active_timer -= elapsed
+        self.heal_timer += elapsed
+
     def _execute_team_healing(self):
         """为全队恢复 2% 最大生命值。"""
         ctx = getattr(self.character, "ctx", None)
@@ -117,13 +132,20 @@ class UnheardConfession(TalentEffect):
         if not self.is_active or not self.character:
             return
 
-        reduction_perc = self._calculate_heal_interval_reduction()
-        base_interval = MECHANISM_CONFIG["SKILL_HEAL_INTERVAL"]
-        setattr(
-            self.character,
-            "singer_interval_override",
-            int(base_interval * (1 - reduction_perc))
-        )
+        setattr(self.character, "singer_interval_override", self._expected_heal_interval())
+
+    def next_wakeup(self, frame: int) -> float:
+        # 间隔覆盖值仅随生命值变化，已同步时空闲帧内无需重算
+        if not self.is_active or not self.character:
+            return float("inf")
+        if getattr(self.character, "singer_interval_override", None) != self._expected_heal_interval():
+            return frame + 1
+        return float("inf")
+
+    def _expected_heal_interval(self) -> int:
+        """按当前生命值计算众水的歌者的治疗间隔。"""
+        base_interval = cast(int, MECHANISM_CONFIG["SKILL_HEAL_INTERVAL"])
+        return int(base_interval * (1 - self._calculate_heal_interval_reduction()))
 
     def _calculate_dmg_bonus(self) -> float:
         """每 1000 点提升 0.7%，上限 28%。"""
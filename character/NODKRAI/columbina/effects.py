@@ -46,6 +46,18 @@ class CrescentSignEffect(BaseEffect):
             self.owner.add_gravity(20, self.lunar_type)
             self.accumulate_timer = 0
 
+    def next_wakeup(self, frame: int) -> float:
+        """按积攒间隔唤醒。"""
+        wake = super().next_wakeup(frame)
+        if not self.is_active:
+            return wake
+        return min(wake, frame + max(1, self.accumulate_interval - self.accumulate_timer))
+
+    def fast_forward(self, frames: int) -> None:
+        super().fast_forward(frames)
+        if self.is_active:
+            self.accumulate_timer += frames
+
     def on_stack_added(self, other: "BaseEffect") -> None:
         """
         刷新效果时更新月曜类型。
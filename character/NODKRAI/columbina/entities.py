@@ -176,6 +176,21 @@ class GravityRipple(CombatEntity):
             self._execute_periodic_damage()
             self.damage_timer = 0
 
+    def next_wakeup(self, frame: int) -> float:
+        """按周期伤害间隔唤醒 (跟随坐标在空闲帧内保持不变)。"""
+        wake = super().next_wakeup(frame)
+        if not self.is_active:
+            return wake
+        if self.owner and self.pos != list(self.owner.pos):
+            return frame + 1
+        return min(wake, frame + max(1, self.damage_interval - self.damage_timer))
+
+    def fast_forward(self, frames: int) -> None:
+        if not self.is_active:
+            return
+        super().fast_forward(frames)
+        self.damage_timer += frames
+
     def _follow_active_character(self) -> None:
         """跟随角色（队伍角色坐标同步）。"""
         if self.owner:
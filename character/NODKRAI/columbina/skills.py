@@ -1,6 +1,5 @@
 """哥伦比娅技能实现。"""
 
-import random
 from typing import Any, Dict, Optional
 
 from core.logger import get_emulation_logger
@@ -14,7 +13,8 @@ from core.action.action_data import ActionFrameData
 from core.systems.contract.attack import AttackConfig, HitboxConfig, AOEShape, StrikeType
 from core.systems.contract.damage import Damage
 from core.event import GameEvent, EventType
-from core.tool import get_current_time
+from core.rng import PROC_STREAM
+from core.tool import get_current_time, get_rng
 from core.mechanics.aura import Element
 from core.systems.lunar_system import LunarReactionSystem
 from character.NODKRAI.columbina.data import (
@@ -79,7 +79,13 @@ class ColumbinaChargedAttack(ChargedAttackSkill):
             if lunar_system:
                 has_grass_dew = lunar_system.can_consume_grass_dew(1)
 
-        if has_grass_dew:
+        return self.compiled_action("月露涤荡" if has_grass_dew else "重击")
+
+    def action_variants(self) -> list[str]:
+        return ["月露涤荡", "重击"]
+
+    def build_action(self, variant: str) -> ActionFrameData:
+        if variant == "月露涤荡":
             # 使用月露涤荡数据
             f = ACTION_FRAME_DATA["月露涤荡"]
             return ActionFrameData(
@@ -249,6 +255,12 @@ class ColumbinaElementalSkill(SkillBase):
     def to_action_data(
         self, intent: Optional[Dict[str, Any]] = None
     ) -> ActionFrameData:
+        return self.compiled_action()
+
+    def action_variants(self) -> list[Any]:
+        return [None]
+
+    def build_action(self, variant: Any) -> ActionFrameData:
         f = ACTION_FRAME_DATA["元素战技"]
 
         return ActionFrameData(
@@ -312,7 +324,7 @@ class ColumbinaElementalSkill(SkillBase):
 
         # 随机决定微粒数量
         rates: tuple[float, float] = MECHANISM_CONFIG["ENERGY_PARTICLE_RATES"]  # type: ignore[assignment]
-        num_particles = 1 if random.random() < rates[0] else 2
+        num_particles = 1 if get_rng(PROC_STREAM, self.caster).random() < rates[0] else 2
 
         # 产球
         from core.factory.entity_factory import EntityFactory
@@ -350,7 +362,7 @@ class ColumbinaElementalSkill(SkillBase):
 
         self.last_particle_frame = current_frame
         rates: tuple[float, float] = MECHANISM_CONFIG["ENERGY_PARTICLE_RATES"]  # type: ignore[assignment]
-        num_particles = 1 if random.random() < rates[0] else 2
+        num_particles = 1 if get_rng(PROC_STREAM, self.caster).random() < rates[0] else 2
 
         from core.factory.entity_factory import EntityFactory
         EntityFactory.spawn_energy(
@@ -389,6 +401,12 @@ class ColumbinaElementalSkill(SkillBase):
         if self.remaining_frames > 0:
             self.remaining_frames -= 1
 
+    def next_wakeup(self, frame: int) -> float:
+        return float("inf")
+
+    def fast_forward(self, frames: int) -> None:
+        self.remaining_frames = max(0, self.remaining_frames - frames)
+
     def _build_attack_config(self, name: str) -> AttackConfig:
         """构建攻击配置。"""
         p = ATTACK_DATA[name]
@@ -433,6 +451,12 @@ class ColumbinaElementalBurst(EnergySkill):
     def to_action_data(
         self, intent: Optional[Dict[str, Any]] = None
     ) -> ActionFrameData:
+        return self.compiled_action()
+
+    def action_variants(self) -> list[Any]:
+        return [None]
+
+    def build_action(self, variant: Any) -> ActionFrameData:
         f = ACTION_FRAME_DATA["元素爆发"]
 
         return ActionFrameData(
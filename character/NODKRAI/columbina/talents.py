@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import random
-
 from core.effect.common import TalentEffect, MoonsignTalent
 from core.event import EventType, GameEvent
-from core.tool import get_current_time
+from core.rng import PROC_STREAM
+from core.tool import get_current_time, get_rng
 from core.systems.utils import AttributeCalculator
 from core.action.attack_tag_resolver import AttackTagResolver
 from core.systems.lunar_system import LunarReactionSystem
@@ -101,7 +100,7 @@ class MoonsDomainGrace(TalentEffect):
         if event.data.get("is_extra_attack"):
             return
 
-        if random.random() < 0.33:
+        if get_rng(PROC_STREAM, self.character).random() < 0.33:
             # 获取攻击参数
             cage = event.data.get("cage")
             target = event.data.get("target")
@@ -152,7 +151,7 @@ class MoonsDomainGrace(TalentEffect):
         if event.data.get("is_extra_strike"):
             return
 
-        if random.random() < 0.33:
+        if get_rng(PROC_STREAM, self.character).random() < 0.33:
             # 获取攻击参数
             cloud = event.data.get("cloud")
             target = event.data.get("target")
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from core.skills.base import SkillBase, EnergySkill
 from core.skills.common import NormalAttackSkill, ChargedAttackSkill, PlungingAttackSkill
 from core.action.action_data import ActionFrameData
@@ -100,6 +100,12 @@ class TestCharElementalSkill(SkillBase):
 
     def to_action_data(self, intent: Optional[Dict[str, Any]] = None) -> ActionFrameData:
         element_type = intent.get("element_type", "雷") if intent else "雷"
+        return self.compiled_action(element_type)
+
+    def action_variants(self) -> List[str]:
+        return list(self.ELEMENT_MAP)
+
+    def build_action(self, element_type: str) -> ActionFrameData:
         f = ACTION_FRAME_DATA["元素战技"]
         attack_key = "元素战技"
 
@@ -166,6 +172,12 @@ class TestCharElementalBurst(EnergySkill):
 
     def to_action_data(self, intent: Optional[Dict[str, Any]] = None) -> ActionFrameData:
         element_type = intent.get("element_type", "雷") if intent else "雷"
+        return self.compiled_action(element_type)
+
+    def action_variants(self) -> List[str]:
+        return list(self.ELEMENT_MAP)
+
+    def build_action(self, element_type: str) -> ActionFrameData:
         f = ACTION_FRAME_DATA["元素爆发"]
         attack_key = "元素爆发"
 
@@ -14,7 +14,7 @@ from core.effect.common import TalentEffect, ConstellationEffect
 from core.mechanics.aura import Element
 from core.mechanics.energy import ElementalEnergy
 from core.mechanics.infusion import InfusionManager
-from core.tool import get_current_time
+from core.tool import get_current_time, get_next_wakeup
 
 
 class Character(CombatEntity, ABC):
@@ -204,6 +204,53 @@ class Character(CombatEntity, ABC):
             if c:
                 c.on_frame_update()
 
+    def next_wakeup(self, frame: int) -> float:
+        """[快进协议] 汇总武器、动作状态机、技能与天赋命座的唤醒帧。"""
+        if not self.is_active:
+            return super().next_wakeup(frame)
+
+        # 动作状态机最常处于唤醒态，优先查询以便尽早短路
+        wake = get_next_wakeup(self.action_manager, frame)
+        if wake <= frame + 1:
+            return wake
+        wake = min(wake, super().next_wakeup(frame))
+
+        components: list[Any] = list(self.skills.values())
+        if self.weapon:
+            components.append(self.weapon)
+        components.extend(t for t in self.talents if t)
+        components.extend(c for c in self.constellations if c)
+
+        for comp in components:
+            if wake <= frame + 1:
+                return wake
+            wake = min(wake, get_next_wakeup(comp, frame))
+
+        # 上一帧内发生的最大生命值变动需在下一帧完成同比缩放
+        from core.systems.utils import AttributeCalculator
+
+        if AttributeCalculator.get_final_hp(self) != self._last_max_hp and self._last_max_hp > 0:
+            return frame + 1
+        return wake
+
+    def fast_forward(self, frames: int) -> None:
+        """[快进协议] 同步推进角色下挂组件的计时器。"""
+        if not self.is_active:
+            return
+        super().fast_forward(frames)
+
+        if self.weapon:
+            self.weapon.fast_forward(frames)
+        self.action_manager.fast_forward(frames)
+        for skill in self.skills.values():
+            skill.fast_forward(frames)
+        for t in self.talents:
+            if t:
+                t.fast_forward(frames)
+        for c in self.constellations:
+            if c:
+                c.fast_forward(frames)
+
     # -----------------------------------------------------
     # 动作与协议 (保持不变，仅重定向内部调用)
     # -----------------------------------------------------
@@ -340,6 +387,16 @@ class Character(CombatEntity, ABC):
         })
         return data
 
+    def _state_signature(self) -> tuple:
+        """扩展角色在场、能量与生命值签名"""
+        return super()._state_signature() + (
+            self.level,
+            self.constellation_level,
+            self.on_field,
+            self.elemental_energy.current_energy if self.elemental_energy else 0,
+            self.current_hp,
+        )
+
     def export_state(self) -> dict:
         """导出角色特有状态"""
 
@@ -1,4 +1,6 @@
-from dataclasses import dataclass, field
+import copy
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
 from enum import Enum, auto
 from typing import Any
 
@@ -42,13 +44,41 @@ class ActionFrameData:
     action_type: str = "normal_attack"
     combo_index: int = 0
 
-    hit_frames: list[int] = field(default_factory=list)
+    # 编译后为元组，运行期视为只读序列
+    hit_frames: Sequence[int] = field(default_factory=list)
     interrupt_frames: dict[str, int] = field(default_factory=dict)
 
     horizontal_dist: float = 0.0
     vertical_dist: float = 0.0
 
     attack_config: AttackConfig | None = None
-    tags: list[str] = field(default_factory=list)
+    tags: Sequence[str] = field(default_factory=list)
     origin_skill: Any | None = None
     data: dict[str, Any] = field(default_factory=dict)
+
+    # [V3.3] 编译模板：命中帧升序元组，ActionInstance 直接引用而不再复制排序
+    sorted_hits: tuple[int, ...] | None = field(default=None, repr=False, compare=False)
+    compiled: bool = field(default=False, repr=False, compare=False)
+
+    def compile(self) -> "ActionFrameData":
+        """[V3.3] 编译为只读模板。
+
+        列表容器转为元组、命中帧预排序，字典与 AttackConfig 在所有绑定副本间共享
+        (约定只读)，并解除与技能实例的绑定。
+        """
+        return replace(
+            self,
+            hit_frames=tuple(self.hit_frames),
+            interrupt_frames=dict(self.interrupt_frames),
+            tags=tuple(self.tags),
+            data=dict(self.data),
+            origin_skill=None,
+            sorted_hits=tuple(sorted(self.hit_frames)),
+            compiled=True,
+        )
+
+    def bind(self, skill: Any) -> "ActionFrameData":
+        """将编译模板绑定到技能实例 (浅拷贝，共享全部只读字段)。"""
+        bound = copy.copy(self)
+        bound.origin_skill = skill
+        return bound
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from typing import Any, TYPE_CHECKING
 
 from core.action.action_data import ActionFrameData
@@ -5,17 +6,30 @@ from core.logger import get_emulation_logger
 
 if TYPE_CHECKING:
     from core.context import SimulationContext
+    from core.timer_wheel import TimerHandle
 
 
 class ActionInstance:
     """正在物理运行的动作实例。"""
 
+    __slots__ = ("data", "elapsed_frames", "hits", "hit_cursor", "is_finished")
+
     def __init__(self, data: ActionFrameData) -> None:
         self.data: ActionFrameData = data
         self.elapsed_frames: int = 0
-        self.hit_frames_pending: list[int] = sorted(data.hit_frames.copy())
+        # 升序命中帧 (编译模板直接引用) 与下一个待触发命中的下标
+        hits = data.sorted_hits
+        self.hits: tuple[int, ...] = hits if hits is not None else tuple(sorted(data.hit_frames))
+        self.hit_cursor: int = 0
         self.is_finished: bool = False
 
+    @property
+    def next_hit(self) -> int | None:
+        """下一个待触发的命中帧，已全部触发时为 None。"""
+        if self.hit_cursor < len(self.hits):
+            return self.hits[self.hit_cursor]
+        return None
+
     def advance(self) -> bool:
         self.elapsed_frames += 1
         return self.elapsed_frames >= self.data.total_frames
@@ -34,7 +48,8 @@ class ActionManager:
         # 连招状态管理
         self.combo_counter: int = 1
         self.combo_reset_frames: int = 120  # 2秒不按普攻重置
-        self.idle_timer: int = 0
+        # [V3.3] 动作结束时在时间轮登记连招重置，新动作启动时取消
+        self._combo_reset_handle: "TimerHandle | None" = None
 
     def request_action(self, action_data: ActionFrameData) -> bool:
         """请求执行动作，包含连击同步与中断判定。"""
@@ -43,6 +58,9 @@ class ActionManager:
         if action_data.action_type == "normal_attack":
             # 如果动作本身没定段位，自动分配当前计数
             if action_data.combo_index == 0:
+                if action_data.compiled:
+                    # 编译模板的绑定副本会被复用，段位写入独立副本
+                    action_data = replace(action_data)
                 action_data.combo_index = self.combo_counter
         else:
             # 执行非普攻动作（如闪避、技能），通常会重置普攻段位（取决于具体角色）
@@ -62,15 +80,11 @@ class ActionManager:
             # 动态读取最大连招数，防止初始化顺序导致的配置失效
             max_combo = getattr(self.character, "max_combo", 5)
             self.combo_counter = (self.combo_counter % max_combo) + 1
-            self.idle_timer = 0
 
         return True
 
     def on_frame_update(self) -> None:
         if not self.current_action:
-            self.idle_timer += 1
-            if self.idle_timer >= self.combo_reset_frames:
-                self._reset_combo()
             return
 
         instance = self.current_action
@@ -82,17 +96,40 @@ class ActionManager:
             )
 
         # 2. 命中检测
-        if (
-            instance.hit_frames_pending
-            and (instance.elapsed_frames + 1) == instance.hit_frames_pending[0]
-        ):
-            instance.hit_frames_pending.pop(0)
+        if instance.next_hit == instance.elapsed_frames + 1:
+            instance.hit_cursor += 1
             self._trigger_hit()
 
         # 3. 推进
         if instance.advance():
             self._terminate_current("FINISHED")
 
+    def next_wakeup(self, frame: int) -> float:
+        """[快进协议] 返回下一个命中帧或动作结束帧。空闲时无需唤醒。"""
+        instance = self.current_action
+        if not instance:
+            return float("inf")
+
+        elapsed = instance.elapsed_frames
+        steps = instance.data.total_frames - elapsed
+        next_hit = instance.next_hit
+        if next_hit is not None and next_hit > elapsed:
+            steps = min(steps, next_hit - elapsed)
+        return frame + max(1, steps)
+
+    def fast_forward(self, frames: int) -> None:
+        """[快进协议] 推进动作的空闲帧 (动画后摇)。连招重置由时间轮触发。"""
+        instance = self.current_action
+        if not instance:
+            return
+
+        if instance.data.horizontal_dist != 0:
+            # 逐帧累加以保持与逐帧驱动完全一致的浮点结果
+            step = instance.data.horizontal_dist / instance.data.total_frames
+            for _ in range(frames):
+                self.ctx.global_move_dist += step
+        instance.elapsed_frames += frames
+
     def _can_cancel_current(self, next_action: ActionFrameData) -> bool:
         """根据新动作类型检索中断帧。"""
         instance = self.current_action
@@ -110,6 +147,9 @@ class ActionManager:
         return cancel_frame is not None and instance.elapsed_frames >= cancel_frame
 
     def _start_action(self, data: ActionFrameData) -> None:
+        if self._combo_reset_handle is not None:
+            self.ctx.timers.cancel(self._combo_reset_handle)
+            self._combo_reset_handle = None
         self.current_action = ActionInstance(data)
         get_emulation_logger().log_info(
             f"{self.character.name} 执行: {data.name} (段位: {data.combo_index})",
@@ -119,14 +159,22 @@ class ActionManager:
     def _trigger_hit(self) -> None:
         instance = self.current_action
         if instance and instance.data.origin_skill:
-            hit_idx = (
-                len(instance.data.hit_frames) - len(instance.hit_frames_pending) - 1
-            )
+            hit_idx = instance.hit_cursor - 1
             # 回调时透传 combo_index 以便技能层识别倍率
             instance.data.origin_skill.on_execute_hit(None, hit_idx)
 
     def _terminate_current(self, reason: str) -> None:
         self.current_action = None
+        if self.combo_counter != 1:
+            # 空闲 combo_reset_frames 帧后重置段位
+            self._combo_reset_handle = self.ctx.timers.schedule(
+                self.ctx.current_frame + self.combo_reset_frames, self._on_combo_timeout
+            )
+
+    def _on_combo_timeout(self) -> None:
+        """[时间轮回调] 空闲超时，重置普攻段位。"""
+        self._combo_reset_handle = None
+        self._reset_combo()
 
     def _reset_combo(self) -> None:
         if self.combo_counter != 1:
@@ -0,0 +1,111 @@
+"""[V3.3] 编译后的动作时间轴。
+
+动作序列被编译为由指令 (ActionCommand) 与重复块组成的紧凑指令树：
+同一条配置只对应一个指令对象，重复块与具名子序列在各次出现间共享节点，
+内存占用与不同动作的数量相关，而与展开后的总长度无关。
+模拟器通过指令指针按下标读取，接口与展开后的列表一致。
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from typing import Union, overload
+
+from core.action.action_data import ActionCommand
+
+
+class RepeatBlock:
+    """重复块：将 body 依次执行 times 次。"""
+
+    __slots__ = ("body", "times", "offsets", "body_len", "length")
+
+    def __init__(self, body: Sequence[TimelineNode], times: int = 1) -> None:
+        self.body: tuple[TimelineNode, ...] = tuple(body)
+        self.times = times
+        # 各子节点在单次循环体内的起始下标
+        self.offsets: list[int] = []
+        pos = 0
+        for node in self.body:
+            self.offsets.append(pos)
+            pos += node_length(node)
+        self.body_len = pos
+        self.length = pos * times
+
+
+TimelineNode = Union[ActionCommand, RepeatBlock]
+
+
+def node_length(node: TimelineNode) -> int:
+    return node.length if isinstance(node, RepeatBlock) else 1
+
+
+class ActionTimeline(Sequence[ActionCommand]):
+    """
+    只读的动作指令序列。
+
+    下标访问沿重复块逐层定位 (每层一次二分)，并缓存最近一次访问的结果：
+    模拟器在等待期间会反复读取同一指针位置，此时为 O(1)。
+    """
+
+    def __init__(self, root: RepeatBlock) -> None:
+        self.root = root
+        self._last_index = -1
+        self._last_command: ActionCommand | None = None
+
+    def __len__(self) -> int:
+        return self.root.length
+
+    @overload
+    def __getitem__(self, index: int) -> ActionCommand: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ActionCommand]: ...
+
+    def __getitem__(self, index: int | slice) -> ActionCommand | list[ActionCommand]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("动作时间轴下标越界")
+        if index == self._last_index:
+            return self._last_command  # type: ignore[return-value]
+
+        node: TimelineNode = self.root
+        i = index
+        while isinstance(node, RepeatBlock):
+            i %= node.body_len
+            k = bisect_right(node.offsets, i) - 1
+            i -= node.offsets[k]
+            node = node.body[k]
+
+        self._last_index = index
+        self._last_command = node
+        return node
+
+    def __iter__(self) -> Iterator[ActionCommand]:
+        return self._walk(self.root)
+
+    def _walk(self, block: RepeatBlock) -> Iterator[ActionCommand]:
+        for _ in range(block.times):
+            for node in block.body:
+                if isinstance(node, RepeatBlock):
+                    yield from self._walk(node)
+                else:
+                    yield node
+
+    def __repr__(self) -> str:
+        return f"ActionTimeline(len={len(self)}, unique={len(self.unique_commands())})"
+
+    def unique_commands(self) -> list[ActionCommand]:
+        """时间轴引用的全部不同指令对象 (按首次出现顺序)。"""
+        seen: dict[int, ActionCommand] = {}
+        stack: list[TimelineNode] = [self.root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, RepeatBlock):
+                stack.extend(reversed(node.body))
+            else:
+                seen.setdefault(id(node), node)
+        return list(seen.values())
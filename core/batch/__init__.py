@@ -12,14 +12,17 @@ from core.batch.models import (
     BatchNode,
     BatchNodeKind,
     BatchProject,
+    BatchRunGroup,
     BatchRunRequest,
     BatchRunResult,
     BatchRunSummary,
+    DpsDistribution,
     MutationRule,
     RangeMutationConfig,
     RangeType,
     TaskRunState,
 )
+from core.batch.montecarlo import MonteCarloService
 from core.batch.storage import BatchProjectStorage
 
 __all__ = [
@@ -35,9 +38,12 @@ __all__ = [
     "MAIN_BATCH_PROGRESS",
     "MAIN_BATCH_REJECTED",
     "MAIN_BATCH_TASK_RESULT",
+    "BatchRunGroup",
     "BatchRunRequest",
     "BatchRunResult",
     "BatchRunSummary",
+    "DpsDistribution",
+    "MonteCarloService",
     "MutationRule",
     "RangeMutationConfig",
     "RangeType",
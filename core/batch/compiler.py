@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import copy
+import json
 from typing import Any
 
+from core.rng import RandomStreams
 from core.batch.models import (
     BatchCompileError,
     BatchNode,
     BatchNodeKind,
     BatchProject,
+    BatchRunGroup,
     BatchRunRequest,
 )
 
@@ -17,8 +20,15 @@ class BatchProjectCompiler:
 
     @classmethod
     def compile(cls, project: BatchProject) -> list[BatchRunRequest]:
+        """编译为独立叶子请求列表。
+
+        若基准配置未指定 rng_seed，则为本次编译生成一个共享种子，
+        使各分支在公共随机数 (CRN) 下对比，降低方差。
+        """
         requests: list[BatchRunRequest] = []
         base_config = copy.deepcopy(project.base_config)
+        if "rng_seed" not in base_config:
+            base_config["rng_seed"] = RandomStreams().seed
 
         def walk(
             node: BatchNode,
@@ -54,6 +64,82 @@ class BatchProjectCompiler:
         walk(project.root, base_config, {})
         return requests
 
+    @classmethod
+    def compile_groups(cls, project: BatchProject) -> list[BatchRunGroup]:
+        """编译为前缀共享树：共享指令前缀的叶子归入同一运行组。"""
+        return cls.group_requests(cls.compile(project))
+
+    @classmethod
+    def group_requests(cls, requests: list[BatchRunRequest]) -> list[BatchRunGroup]:
+        """将请求按共享前缀分组。
+
+        仅当除 sequence_config 外的配置完全一致时才能共享前缀；
+        无可共享前缀的请求单独成组 (branch_point 为 0)。
+        """
+        buckets: dict[str, list[BatchRunRequest]] = {}
+        for request in requests:
+            base = {k: v for k, v in request.config.items() if k != "sequence_config"}
+            key = json.dumps(base, sort_keys=True, ensure_ascii=False, default=str)
+            buckets.setdefault(key, []).append(request)
+
+        groups: list[BatchRunGroup] = []
+        for members in buckets.values():
+            root = cls._build_group(members, 0)
+            if root.branch_point > 0:
+                groups.append(root)
+            else:
+                groups.extend(cls._build_group([r], 0) for r in root.all_requests())
+        return groups
+
+    @classmethod
+    def _build_group(cls, requests: list[BatchRunRequest], start: int) -> BatchRunGroup:
+        sequences = [r.config.get("sequence_config", []) for r in requests]
+        group = BatchRunGroup(
+            group_id=f"grp_{requests[0].node_id}",
+            config=requests[0].config,
+        )
+        if len(requests) == 1:
+            group.requests = list(requests)
+            return group
+
+        # 最长公共前缀，且保证每个分支至少保留一条尾部指令；
+        # 子序列调用的展开取决于整条序列的定义 (允许先调用后定义)，不纳入共享前缀
+        limit = min(min(len(s) for s in sequences) - 1, *(cls._call_free_length(s) for s in sequences))
+        branch = min(start, limit)
+        while branch < limit and all(s[branch] == sequences[0][branch] for s in sequences):
+            branch += 1
+        group.branch_point = max(branch, 0)
+
+        # 按分叉后的首条指令划分子树
+        partitions: dict[str, list[BatchRunRequest]] = {}
+        for request, seq in zip(requests, sequences):
+            head = seq[group.branch_point] if group.branch_point < len(seq) else None
+            key = json.dumps(head, sort_keys=True, ensure_ascii=False, default=str)
+            partitions.setdefault(key, []).append(request)
+
+        for members in partitions.values():
+            # 全部请求落入同一划分时前缀已到上限，无法继续分叉
+            if len(members) == 1 or len(members) == len(requests):
+                group.requests.extend(members)
+                continue
+            sub = cls._build_group(members, group.branch_point + 1)
+            if sub.branch_point > group.branch_point:
+                group.subgroups.append(sub)
+            else:
+                group.requests.extend(sub.all_requests())
+        return group
+
+    @classmethod
+    def _call_free_length(cls, entries: list[dict[str, Any]]) -> int:
+        """返回首个含子序列调用 (含重复块内的嵌套调用) 的条目之前的条目数。"""
+        for index, entry in enumerate(entries):
+            if "define" in entry:
+                continue
+            nested = entry.get("sequence", [])
+            if "call" in entry or cls._call_free_length(nested) < len(nested):
+                return index
+        return len(entries)
+
     @staticmethod
     def _apply_rule(config: dict[str, Any], path: list[Any], value: Any) -> None:
         if not path:
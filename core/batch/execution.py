@@ -11,6 +11,7 @@ from collections.abc import Callable, Iterable
 from core.batch.compiler import BatchProjectCompiler
 from core.batch.models import (
     BatchProject,
+    BatchRunGroup,
     BatchRunRequest,
     BatchRunResult,
     BatchRunSummary,
@@ -22,22 +23,17 @@ def _default_batch_worker(request: BatchRunRequest) -> BatchRunResult:
     from core.factory.assembler import SimulationAssembler
     from core.logger import SimulationLogger
     from core.registry import initialize_registry
-    from core.persistence.database import ResultDatabase
+    from core.persistence.target import create_persistence_target
 
     initialize_registry()
     repo = MySQLDataRepository()
-    db = ResultDatabase()
-    simulator = None
+    # 无需审计下钻时使用内存账本，跳过快照构造与 SQL 写入
+    db = create_persistence_target(request.audit)
+    duration = 0
 
     async def _run() -> None:
-        nonlocal simulator
-        # 数据库初始化
-        await db.initialize()
-        await db.create_session(
-            config_name=f"BatchRun_{request.node_id}",
-            config_snapshot=request.config,
-        )
-        await db.start_session()
+        nonlocal duration
+        await db.start(f"BatchRun_{request.node_id}", request.config)
 
         # 使用 SimulationAssembler 获取静态修饰符数据
         assembler = SimulationAssembler(repo)
@@ -53,19 +49,76 @@ def _default_batch_worker(request: BatchRunRequest) -> BatchRunResult:
 
         # 持久化静态修饰符（武器/圣遗物）
         for data in static_modifiers_data:
-            await db.record_static_modifiers(
-                data["entity_id"],
-                data["modifiers"]
-            )
+            await db.record_static_modifiers(data["entity_id"], data["modifiers"])
+
+        await simulator.run()
+        await db.stop()
+        duration = simulator.ctx.current_frame
+
+    asyncio.run(_run())
+    return _build_result(request, db.total_damage, duration, db.rng_seed)
+
+
+def _default_group_worker(group: BatchRunGroup) -> list[BatchRunResult]:
+    """运行一个前缀共享组：共享前缀只模拟一次，在分叉点 fork 出各叶子。"""
+    from core.data.repository import MySQLDataRepository
+    from core.factory.action_parser import ActionParser
+    from core.factory.assembler import SimulationAssembler
+    from core.logger import SimulationLogger
+    from core.registry import initialize_registry
+    from core.persistence.ledger import DamageLedger
 
+    initialize_registry()
+    repo = MySQLDataRepository()
+    parser = ActionParser()
+    results: list[BatchRunResult] = []
+
+    async def _run_group(simulator: Any, node: BatchRunGroup) -> None:
+        shared = node.config.get("sequence_config", [])[: node.branch_point]
+        simulator.stop_at_action = len(parser.parse_sequence(shared))
         await simulator.run()
-        await db.stop_session()
+
+        if not simulator.paused:
+            # 共享前缀内即已终止 (如超时)，各分支结果与前缀一致
+            for request in node.all_requests():
+                results.append(_build_result(
+                    request, simulator.db.total_damage, simulator.ctx.current_frame, simulator.db.rng_seed
+                ))
+            return
+
+        checkpoint = simulator.checkpoint()
+        for sub in node.subgroups:
+            child = checkpoint.fork(parser.parse_sequence(sub.config.get("sequence_config", [])))
+            await _run_group(child, sub)
+
+        for request in node.requests:
+            child = checkpoint.fork(parser.parse_sequence(request.config.get("sequence_config", [])))
+            child.ctx.logger = SimulationLogger(
+                name=f"BatchRun_{request.node_id}",
+                batch_run_id=request.batch_run_id,
+                batch_node_id=request.node_id,
+            )
+            await child.run()
+            results.append(_build_result(
+                request, child.db.total_damage, child.ctx.current_frame, child.db.rng_seed
+            ))
+
+    async def _run() -> None:
+        ledger = DamageLedger()
+        assembler = SimulationAssembler(repo)
+        simulator, static_modifiers_data = assembler.assemble(group.config, persistence_db=ledger)
+        simulator.ctx.logger = SimulationLogger(name=f"BatchRun_{group.group_id}")
+        for data in static_modifiers_data:
+            await ledger.record_static_modifiers(data["entity_id"], data["modifiers"])
+        await _run_group(simulator, group)
 
     asyncio.run(_run())
+    return results
+
 
-    # 从模拟器上下文或数据库获取结果
-    duration = getattr(simulator.ctx, "current_frame", 0) if simulator else 0
-    total_damage = db.projector.total_damage if db.projector else 0.0
+def _build_result(
+    request: BatchRunRequest, total_damage: float, duration: int, rng_seed: int | None = None
+) -> BatchRunResult:
     dps = (total_damage / duration * 60) if duration else 0.0
     return BatchRunResult(
         request_id=request.request_id,
@@ -75,6 +128,7 @@ def _default_batch_worker(request: BatchRunRequest) -> BatchRunResult:
         dps=dps,
         simulation_duration=duration,
         param_snapshot=dict(request.param_snapshot),
+        rng_seed=rng_seed,
     )
 
 
@@ -85,9 +139,21 @@ class BatchExecutionService:
         self,
         max_workers: int | None = None,
         worker_func: Callable[[BatchRunRequest], BatchRunResult] | None = None,
+        audit: bool | None = None,
+        share_prefix: bool = False,
     ) -> None:
+        """初始化批处理执行服务。
+
+        Args:
+            max_workers: 并行进程数，默认等于 CPU 核数。
+            worker_func: 自定义单次运行函数。
+            audit: 若指定，则覆盖所有请求的审计开关；为 False 时各运行仅写入内存账本。
+            share_prefix: 是否按共享指令前缀分组执行 (仅对默认 worker 且无需审计的请求生效)。
+        """
         self.max_workers = max_workers or multiprocessing.cpu_count()
         self.worker_func = worker_func or _default_batch_worker
+        self.audit = audit
+        self.share_prefix = share_prefix
 
     async def run(
         self,
@@ -99,6 +165,9 @@ class BatchExecutionService:
         materialized = list(requests) if requests is not None else []
         if project is not None and not materialized:
             materialized = BatchProjectCompiler.compile(project)
+        if self.audit is not None:
+            for request in materialized:
+                request.audit = self.audit
 
         summary = BatchRunSummary(total_runs=len(materialized))
         if not materialized:
@@ -106,34 +175,55 @@ class BatchExecutionService:
 
         loop = asyncio.get_running_loop()
 
-        # 创建 future -> request 映射
-        future_to_request: dict[asyncio.Future, BatchRunRequest] = {}
+        # 创建 future -> requests 映射 (前缀共享组的一个 future 对应多个请求)
+        future_to_requests: dict[asyncio.Future, list[BatchRunRequest]] = {}
         if self.worker_func is _default_batch_worker:
             with concurrent.futures.ProcessPoolExecutor(
                 max_workers=self.max_workers
             ) as executor:
-                for request in materialized:
-                    future = loop.run_in_executor(executor, self.worker_func, request)
-                    future_to_request[future] = request
-                await self._consume_futures(future_to_request, summary, on_progress, on_task_result)
+                for unit in self._plan_units(materialized):
+                    if isinstance(unit, BatchRunGroup):
+                        group_future = loop.run_in_executor(executor, _default_group_worker, unit)
+                        future_to_requests[group_future] = unit.all_requests()
+                    else:
+                        future = loop.run_in_executor(executor, self.worker_func, unit)
+                        future_to_requests[future] = [unit]
+                await self._consume_futures(future_to_requests, summary, on_progress, on_task_result)
         else:
             for request in materialized:
                 future = loop.run_in_executor(None, self.worker_func, request)
-                future_to_request[future] = request
-            await self._consume_futures(future_to_request, summary, on_progress, on_task_result)
+                future_to_requests[future] = [request]
+            await self._consume_futures(future_to_requests, summary, on_progress, on_task_result)
 
         self._calculate_stats(summary)
         return summary
 
+    def _plan_units(
+        self, requests: list[BatchRunRequest]
+    ) -> list[BatchRunRequest | BatchRunGroup]:
+        """规划执行单元：可共享前缀的请求合并为运行组，其余保持独立。"""
+        if not self.share_prefix:
+            return list(requests)
+
+        # 审计运行写入外部数据库，无法随检查点分叉
+        forkable = [r for r in requests if not r.audit]
+        units: list[BatchRunRequest | BatchRunGroup] = [r for r in requests if r.audit]
+        for group in BatchProjectCompiler.group_requests(forkable):
+            if group.branch_point > 0:
+                units.append(group)
+            else:
+                units.extend(group.all_requests())
+        return units
+
     async def _consume_futures(
         self,
-        future_to_request: dict[asyncio.Future, BatchRunRequest],
+        future_to_requests: dict[asyncio.Future, list[BatchRunRequest]],
         summary: BatchRunSummary,
         on_progress: Callable[[int, int, str | None], Any] | None,
         on_task_result: Callable[[BatchRunResult], Any] | None,
     ) -> None:
         completed = 0
-        pending = set(future_to_request.keys())
+        pending = set(future_to_requests.keys())
 
         while pending:
             done, pending = await asyncio.wait(
@@ -141,44 +231,52 @@ class BatchExecutionService:
                 return_when=asyncio.FIRST_COMPLETED,
             )
             for future in done:
-                request = future_to_request[future]
+                requests = future_to_requests[future]
                 try:
-                    result = future.result()
-                    summary.results.append(result)
-                    if result.error:
-                        summary.failed_runs += 1
-                        summary.errors.append(result.error)
-                    else:
-                        summary.completed_runs += 1
-
-                    # 调用任务结果回调
-                    if on_task_result:
-                        if inspect.iscoroutinefunction(on_task_result):
-                            await on_task_result(result)
-                        else:
-                            on_task_result(result)
+                    outcome = future.result()
+                    results = outcome if isinstance(outcome, list) else [outcome]
                 except Exception as exc:
-                    summary.failed_runs += 1
                     summary.errors.append(str(exc))
                     # 创建错误结果
-                    error_result = BatchRunResult(
-                        request_id=request.request_id,
-                        node_id=request.node_id,
-                        node_name=request.node_name,
-                        error=str(exc),
-                    )
-                    if on_task_result:
-                        if inspect.iscoroutinefunction(on_task_result):
-                            await on_task_result(error_result)
+                    results = [
+                        BatchRunResult(
+                            request_id=request.request_id,
+                            node_id=request.node_id,
+                            node_name=request.node_name,
+                            error=str(exc),
+                        )
+                        for request in requests
+                    ]
+                    summary.failed_runs += len(results)
+                    for error_result in results:
+                        if on_task_result:
+                            if inspect.iscoroutinefunction(on_task_result):
+                                await on_task_result(error_result)
+                            else:
+                                on_task_result(error_result)
+                else:
+                    for result in results:
+                        summary.results.append(result)
+                        if result.error:
+                            summary.failed_runs += 1
+                            summary.errors.append(result.error)
                         else:
-                            on_task_result(error_result)
+                            summary.completed_runs += 1
 
-                completed += 1
-                if on_progress:
-                    if inspect.iscoroutinefunction(on_progress):
-                        await on_progress(completed, summary.total_runs, request.request_id)
-                    else:
-                        on_progress(completed, summary.total_runs, request.request_id)
+                        # 调用任务结果回调
+                        if on_task_result:
+                            if inspect.iscoroutinefunction(on_task_result):
+                                await on_task_result(result)
+                            else:
+                                on_task_result(result)
+
+                for result in results:
+                    completed += 1
+                    if on_progress:
+                        if inspect.iscoroutinefunction(on_progress):
+                            await on_progress(completed, summary.total_runs, result.request_id)
+                        else:
+                            on_progress(completed, summary.total_runs, result.request_id)
 
     @staticmethod
     def _calculate_stats(summary: BatchRunSummary) -> None:
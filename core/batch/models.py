@@ -96,6 +96,8 @@ class BatchRunRequest:
     config: dict[str, Any]
     param_snapshot: dict[str, Any] = field(default_factory=dict)
     batch_run_id: str | None = None
+    # 是否需要审计下钻；为 False 时使用内存账本，不写入结果数据库
+    audit: bool = True
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -105,6 +107,7 @@ class BatchRunRequest:
             "config": self.config,
             "param_snapshot": self.param_snapshot,
             "batch_run_id": self.batch_run_id,
+            "audit": self.audit,
         }
 
     @classmethod
@@ -116,6 +119,77 @@ class BatchRunRequest:
             config=dict(payload.get("config", {})),
             param_snapshot=dict(payload.get("param_snapshot", {})),
             batch_run_id=payload.get("batch_run_id"),
+            audit=bool(payload.get("audit", True)),
+        )
+
+
+@dataclass
+class BatchRunGroup:
+    """共享指令前缀的运行组 (前缀共享树的节点)。
+
+    组内所有请求除 sequence_config 外配置完全一致，且前 branch_point 条指令相同。
+    共享前缀只模拟一次，随后在分叉点 fork 出 requests 中的叶子与 subgroups 中的子组。
+    """
+
+    group_id: str
+    config: dict[str, Any]
+    branch_point: int = 0  # 分叉点：共享的 sequence_config 条目数
+    requests: list[BatchRunRequest] = field(default_factory=list)
+    subgroups: list[BatchRunGroup] = field(default_factory=list)
+
+    def all_requests(self) -> list[BatchRunRequest]:
+        """按深度优先顺序展开组内的全部叶子请求。"""
+        collected = list(self.requests)
+        for group in self.subgroups:
+            collected.extend(group.all_requests())
+        return collected
+
+
+@dataclass
+class DpsDistribution:
+    """蒙特卡洛 DPS 分布摘要。"""
+
+    samples: int = 0
+    mean: float = 0.0
+    std_dev: float = 0.0
+    min: float = 0.0
+    max: float = 0.0
+    p05: float = 0.0
+    p50: float = 0.0
+    p95: float = 0.0
+    confidence: float = 0.95
+    ci_half_width: float = 0.0  # 均值置信区间半宽
+    converged: bool = False  # 是否因置信区间收敛而提前停止
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "mean": self.mean,
+            "std_dev": self.std_dev,
+            "min": self.min,
+            "max": self.max,
+            "p05": self.p05,
+            "p50": self.p50,
+            "p95": self.p95,
+            "confidence": self.confidence,
+            "ci_half_width": self.ci_half_width,
+            "converged": self.converged,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> DpsDistribution:
+        return cls(
+            samples=int(payload.get("samples", 0)),
+            mean=float(payload.get("mean", 0.0)),
+            std_dev=float(payload.get("std_dev", 0.0)),
+            min=float(payload.get("min", 0.0)),
+            max=float(payload.get("max", 0.0)),
+            p05=float(payload.get("p05", 0.0)),
+            p50=float(payload.get("p50", 0.0)),
+            p95=float(payload.get("p95", 0.0)),
+            confidence=float(payload.get("confidence", 0.95)),
+            ci_half_width=float(payload.get("ci_half_width", 0.0)),
+            converged=bool(payload.get("converged", False)),
         )
 
 
@@ -131,6 +205,8 @@ class BatchRunResult:
     simulation_duration: int = 0
     param_snapshot: dict[str, Any] = field(default_factory=dict)
     error: str | None = None
+    rng_seed: int | None = None
+    distribution: DpsDistribution | None = None  # 蒙特卡洛运行时的 DPS 分布
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -142,6 +218,8 @@ class BatchRunResult:
             "simulation_duration": self.simulation_duration,
             "param_snapshot": self.param_snapshot,
             "error": self.error,
+            "rng_seed": self.rng_seed,
+            "distribution": self.distribution.to_dict() if self.distribution else None,
         }
 
     @classmethod
@@ -155,6 +233,12 @@ class BatchRunResult:
             simulation_duration=int(payload.get("simulation_duration", 0)),
             param_snapshot=dict(payload.get("param_snapshot", {})),
             error=payload.get("error"),
+            rng_seed=payload.get("rng_seed"),
+            distribution=(
+                DpsDistribution.from_dict(payload["distribution"])
+                if payload.get("distribution")
+                else None
+            ),
         )
 
 
@@ -172,6 +256,7 @@ class BatchRunSummary:
     p95_dps: float = 0.0
     results: list[BatchRunResult] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    distribution: DpsDistribution | None = None
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -185,6 +270,7 @@ class BatchRunSummary:
             "p95_dps": self.p95_dps,
             "results": [result.to_dict() for result in self.results],
             "errors": list(self.errors),
+            "distribution": self.distribution.to_dict() if self.distribution else None,
         }
 
     @classmethod
@@ -203,6 +289,11 @@ class BatchRunSummary:
                 for item in payload.get("results", [])
             ],
             errors=[str(item) for item in payload.get("errors", [])],
+            distribution=(
+                DpsDistribution.from_dict(payload["distribution"])
+                if payload.get("distribution")
+                else None
+            ),
         )
 
 
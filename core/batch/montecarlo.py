@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import copy
+import inspect
+import math
+import multiprocessing
+from dataclasses import replace
+from statistics import NormalDist
+from typing import Any
+from collections.abc import Callable
+
+from core.batch.execution import _default_batch_worker
+from core.batch.models import (
+    BatchRunRequest,
+    BatchRunResult,
+    BatchRunSummary,
+    DpsDistribution,
+)
+from core.rng import RandomStreams
+
+
+class P2Quantile:
+    """P² 流式分位数估计 (Jain & Chlamtac)，常数内存。"""
+
+    def __init__(self, p: float) -> None:
+        self.p = p
+        self._initial: list[float] = []
+        self._heights: list[float] = []
+        self._positions: list[int] = []
+        self._desired: list[float] = []
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def add(self, x: float) -> None:
+        if not self._heights:
+            self._initial.append(x)
+            if len(self._initial) == 5:
+                self._heights = sorted(self._initial)
+                self._positions = [1, 2, 3, 4, 5]
+                p = self.p
+                self._desired = [1.0, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5.0]
+            return
+
+        q, n = self._heights, self._positions
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = next(i for i in range(1, 5) if x < q[i]) - 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # 调整中间三个标记的高度
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if q[i - 1] < candidate < q[i + 1]:
+                    q[i] = candidate
+                else:
+                    q[i] = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                n[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self) -> float:
+        if self._heights:
+            return self._heights[2]
+        if not self._initial:
+            return 0.0
+        # 样本不足 5 个时退化为排序取值 (与 BatchExecutionService 的 p95 口径一致)
+        ordered = sorted(self._initial)
+        return ordered[min(int(len(ordered) * self.p), len(ordered) - 1)]
+
+
+class RunningStats:
+    """流式统计：Welford 均值/方差 + P² 分位数草图。"""
+
+    QUANTILES = (0.05, 0.5, 0.95)
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._sketches = {q: P2Quantile(q) for q in self.QUANTILES}
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+        for sketch in self._sketches.values():
+            sketch.add(x)
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def ci_half_width(self, confidence: float) -> float:
+        """均值置信区间半宽 (正态近似)。"""
+        if self.count < 2:
+            return math.inf
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        return z * self.std_dev / math.sqrt(self.count)
+
+    def quantile(self, p: float) -> float:
+        return self._sketches[p].value
+
+    def to_distribution(self, confidence: float, converged: bool) -> DpsDistribution:
+        if not self.count:
+            return DpsDistribution(confidence=confidence)
+        half_width = self.ci_half_width(confidence)
+        return DpsDistribution(
+            samples=self.count,
+            mean=self.mean,
+            std_dev=self.std_dev,
+            min=self.min,
+            max=self.max,
+            p05=self.quantile(0.05),
+            p50=self.quantile(0.5),
+            p95=self.quantile(0.95),
+            confidence=confidence,
+            ci_half_width=half_width if math.isfinite(half_width) else 0.0,
+            converged=converged,
+        )
+
+
+class MonteCarloService:
+    """蒙特卡洛执行服务：同一请求在多个种子下重复运行，直至 DPS 均值的置信区间收敛。"""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        worker_func: Callable[[BatchRunRequest], BatchRunResult] | None = None,
+        tolerance: float | None = None,
+        relative_tolerance: float | None = 0.01,
+        confidence: float = 0.95,
+        min_samples: int = 10,
+        max_samples: int = 1000,
+    ) -> None:
+        """初始化蒙特卡洛执行服务。
+
+        Args:
+            max_workers: 并行进程数，默认等于 CPU 核数。
+            worker_func: 自定义单次运行函数。
+            tolerance: 置信区间半宽的绝对容差 (DPS)。
+            relative_tolerance: 置信区间半宽相对均值的容差；与 tolerance 任一满足即停止。
+            confidence: 置信水平。
+            min_samples: 判定收敛前的最少样本数。
+            max_samples: 样本数上限。
+        """
+        if tolerance is None and relative_tolerance is None:
+            raise ValueError("tolerance 与 relative_tolerance 至少需指定一个。")
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.worker_func = worker_func or _default_batch_worker
+        self.tolerance = tolerance
+        self.relative_tolerance = relative_tolerance
+        self.confidence = confidence
+        self.min_samples = max(min_samples, 2)
+        self.max_samples = max(max_samples, self.min_samples)
+
+    async def run(
+        self,
+        request: BatchRunRequest,
+        on_progress: Callable[[int, int, str | None], Any] | None = None,
+    ) -> BatchRunSummary:
+        """运行蒙特卡洛采样。
+
+        各样本的种子由基准种子 (request.config["rng_seed"]，缺省时随机生成) 派生，
+        因此相同基准种子下的采样序列可复现。样本运行不写审计库。
+
+        Returns:
+            BatchRunSummary: results 中为该请求的聚合结果，distribution 为 DPS 分布。
+        """
+        base_seed = request.config.get("rng_seed")
+        if base_seed is None:
+            base_seed = RandomStreams().seed
+        seed_stream = RandomStreams(base_seed).stream("montecarlo")
+
+        stats = RunningStats()
+        duration_sum = 0
+        damage_sum = 0.0
+        summary = BatchRunSummary()
+        converged = False
+        submitted = 0
+
+        loop = asyncio.get_running_loop()
+        executor: concurrent.futures.Executor | None = None
+        if self.worker_func is _default_batch_worker:
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers)
+
+        pending: set[asyncio.Future] = set()
+
+        def submit() -> None:
+            nonlocal submitted
+            config = copy.deepcopy(request.config)
+            config["rng_seed"] = seed_stream.getrandbits(63)
+            sample = replace(
+                request,
+                request_id=f"{request.request_id}#{submitted}",
+                config=config,
+                audit=False,
+            )
+            pending.add(loop.run_in_executor(executor, self.worker_func, sample))
+            submitted += 1
+
+        try:
+            while submitted < min(self.max_workers, self.max_samples):
+                submit()
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    summary.total_runs += 1
+                    try:
+                        result = future.result()
+                    except Exception as exc:
+                        result = None
+                        summary.errors.append(str(exc))
+                    else:
+                        if result.error:
+                            summary.errors.append(result.error)
+                            result = None
+
+                    if result is None:
+                        summary.failed_runs += 1
+                    else:
+                        summary.completed_runs += 1
+                        stats.add(result.dps)
+                        damage_sum += result.total_damage
+                        duration_sum += result.simulation_duration
+
+                    if on_progress:
+                        if inspect.iscoroutinefunction(on_progress):
+                            await on_progress(summary.total_runs, self.max_samples, request.request_id)
+                        else:
+                            on_progress(summary.total_runs, self.max_samples, request.request_id)
+
+                converged = self._is_converged(stats)
+                if converged:
+                    break
+                while submitted < self.max_samples and len(pending) < self.max_workers:
+                    submit()
+        finally:
+            for future in pending:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        distribution = stats.to_distribution(self.confidence, converged)
+        summary.distribution = distribution
+        if stats.count:
+            summary.avg_dps = distribution.mean
+            summary.max_dps = distribution.max
+            summary.min_dps = distribution.min
+            summary.std_dev_dps = distribution.std_dev
+            summary.p95_dps = distribution.p95
+            summary.results.append(
+                BatchRunResult(
+                    request_id=request.request_id,
+                    node_id=request.node_id,
+                    node_name=request.node_name,
+                    total_damage=damage_sum / stats.count,
+                    dps=distribution.mean,
+                    simulation_duration=round(duration_sum / stats.count),
+                    param_snapshot=dict(request.param_snapshot),
+                    rng_seed=base_seed,
+                    distribution=distribution,
+                )
+            )
+        return summary
+
+    def _is_converged(self, stats: RunningStats) -> bool:
+        if stats.count < self.min_samples:
+            return False
+        half_width = stats.ci_half_width(self.confidence)
+        if self.tolerance is not None and half_width <= self.tolerance:
+            return True
+        if self.relative_tolerance is not None and half_width <= self.relative_tolerance * abs(stats.mean):
+            return True
+        return False
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import copy
+from collections.abc import Sequence
+from typing import Any, TYPE_CHECKING
+
+from core.action.action_timeline import ActionTimeline
+from core.context import set_context
+
+if TYPE_CHECKING:
+    from core.action.action_data import ActionCommand
+    from core.simulator import Simulator
+
+
+def _process_registries() -> list[tuple[type, str]]:
+    """进程级实体注册表 (类属性)，需随检查点一同保存与恢复。"""
+    from core.entities.elemental_entities import DendroCoreEntity
+    from core.entities.lunar_entities import LunarCageEntity, ThunderCloudEntity
+    from core.entities.scene_entity import SceneEntity
+
+    return [
+        (SceneEntity, "active_scenes"),
+        (ThunderCloudEntity, "active_clouds"),
+        (LunarCageEntity, "active_cages"),
+        (DendroCoreEntity, "active_cores"),
+    ]
+
+
+class SimulationCheckpoint:
+    """
+    运行中模拟的检查点 (Branch Point)。
+
+    在分叉点挂起的模拟器 (见 ``Simulator.stop_at_action``) 连同其上下文、
+    队伍、空间、系统、效果、事件订阅与计数器被整体冻结为一份深拷贝；
+    每次 ``fork`` 再从冻结态复制出一个独立的子模拟器，以不同的指令尾部续跑。
+    共享前缀只需模拟一次，子模拟器的结算结果与从第 0 帧完整运行一致。
+
+    Note:
+        实体类上的进程级注册表 (如雷暴云、月笼列表) 在 fork 时被替换为子模拟器的副本，
+        因此同一进程内由同一检查点分叉出的子模拟器需依次运行，不可交错。
+    """
+
+    def __init__(self, simulator: Simulator):
+        """冻结挂起中的模拟器。
+
+        Args:
+            simulator: 已在分叉点挂起的模拟器。
+
+        Raises:
+            RuntimeError: 模拟器未处于挂起状态。
+            ValueError: 持久化目标不支持分叉 (如写入外部数据库的 ResultDatabase)。
+        """
+        if not simulator.paused:
+            raise RuntimeError("仅能为已在分叉点挂起的模拟器创建检查点")
+        db = simulator.db
+        if db is not None and not getattr(db, "supports_fork", False):
+            raise ValueError(f"持久化目标 {type(db).__name__} 不支持分叉")
+
+        self.frame: int = simulator.ctx.current_frame
+        self.action_ptr: int = simulator.action_ptr
+        registries = {key: getattr(*key) for key in _process_registries()}
+        self._state = copy.deepcopy((simulator, registries), self._shared_memo(simulator))
+
+    def fork(self, action_sequence: Sequence[ActionCommand] | None = None) -> Simulator:
+        """从检查点复制出一个独立的子模拟器，并将其上下文设为当前活跃上下文。
+
+        Args:
+            action_sequence: 子模拟器的完整指令序列 (前缀需与检查点一致)，
+                为空时沿用检查点的指令序列。
+
+        Returns:
+            Simulator: 可直接调用 run() 续跑的子模拟器。
+        """
+        frozen_sim = self._state[0]
+        simulator, registries = copy.deepcopy(self._state, self._shared_memo(frozen_sim))
+
+        for (owner, attr), value in registries.items():
+            setattr(owner, attr, value)
+
+        simulator.ctx._token = None
+        set_context(simulator.ctx)
+
+        if action_sequence is not None:
+            # 编译后的时间轴只读，可直接共享；普通列表复制一份以隔离调用方
+            if isinstance(action_sequence, ActionTimeline):
+                simulator.actions = action_sequence
+            else:
+                simulator.actions = list(action_sequence)
+        simulator.stop_at_action = None
+        simulator.paused = False
+        return simulator
+
+    @staticmethod
+    def _shared_memo(simulator: Simulator) -> dict[int, Any]:
+        """预置深拷贝备忘录：日志器、进度回调与上下文令牌在父子间共享而非复制。"""
+        ctx = simulator.ctx
+        shared = [ctx.logger, ctx._token, simulator.on_progress]
+        return {id(obj): obj for obj in shared if obj is not None}
@@ -2,14 +2,85 @@ from __future__ import annotations
 import math
 from typing import Any, TYPE_CHECKING
 
+import numpy as np
+
 from core.mechanics.aura import Element
 from core.systems.contract.attack import AOEShape
 from core.entities.base_entity import BaseEntity, CombatEntity, EntityState, Faction
+from core.spatial_index import GridIndex
 
 if TYPE_CHECKING:
     from core.systems.contract.damage import Damage
     from core.team import Team
 
+# 网格粗筛的候选数 (或待筛选目标数) 达到该值时，改走 NumPy 批量路径
+BATCH_MIN_TARGETS = 32
+
+# 需要逐帧驱动的生命周期状态
+LIVE_STATES = frozenset((EntityState.ACTIVE, EntityState.FINISHING))
+
+
+class EntityRegistry:
+    """
+    单一阵营的实体登记表。
+
+    以 entity_id 为键提供 O(1) 的注册与成员判定；迭代保持注册顺序，
+    且能覆盖迭代过程中新注册的实体 (与列表追加语义一致)。
+    注销在帧末统一批量压缩，同时维护该阵营的空间索引。
+    """
+
+    def __init__(self) -> None:
+        self._by_id: dict[int, BaseEntity] = {}
+        self._order: list[BaseEntity] = []
+        self.grid = GridIndex()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, entity: Any) -> bool:
+        return getattr(entity, "entity_id", None) in self._by_id
+
+    def __iter__(self):
+        # 按下标迭代，使本轮迭代中追加的实体同样被访问
+        order = self._order
+        i = 0
+        while i < len(order):
+            yield order[i]
+            i += 1
+
+    def get(self, entity_id: int) -> BaseEntity | None:
+        return self._by_id.get(entity_id)
+
+    def add(self, entity: BaseEntity) -> bool:
+        """登记实体，已存在时返回 False。"""
+        if entity.entity_id in self._by_id:
+            return False
+        self._by_id[entity.entity_id] = entity
+        self._order.append(entity)
+        self.grid.insert(entity)
+        entity._spatial_index = self.grid
+        return True
+
+    def remove_many(self, entity_ids: Any) -> None:
+        """批量注销实体，单次压缩顺序表。"""
+        removed = False
+        for eid in entity_ids:
+            entity = self._by_id.pop(eid, None)
+            if entity is not None:
+                self.grid.remove(entity)
+                entity._spatial_index = None
+                removed = True
+        if removed:
+            by_id = self._by_id
+            self._order = [e for e in self._order if e.entity_id in by_id]
+
+    def clear(self) -> None:
+        self.remove_many(list(self._by_id))
+
+    def active(self) -> list[BaseEntity]:
+        """仍需逐帧驱动 (ACTIVE / FINISHING) 的实体。"""
+        return [e for e in self._order if e.state in LIVE_STATES]
+
 
 class CombatSpace:
     """战场空间管理器。
@@ -20,12 +91,13 @@ class CombatSpace:
 
     def __init__(self) -> None:
         """初始化战场空间。"""
-        self._entities: dict[Faction, list[BaseEntity]] = {
-            Faction.PLAYER: [],  # [重构] 此处仅存放召唤物
-            Faction.ENEMY: [],
-            Faction.NEUTRAL: [],
+        self._entities: dict[Faction, EntityRegistry] = {
+            Faction.PLAYER: EntityRegistry(),  # [重构] 此处仅存放召唤物
+            Faction.ENEMY: EntityRegistry(),
+            Faction.NEUTRAL: EntityRegistry(),
         }
-        self._remove_queue: list[BaseEntity] = []
+        # 待注销实体 (entity_id -> 实体)，帧末统一处理
+        self._remove_queue: dict[int, BaseEntity] = {}
         self.team: Team | None = None
 
     def set_team(self, team: Team) -> None:
@@ -34,8 +106,7 @@ class CombatSpace:
 
     def register(self, entity: BaseEntity) -> None:
         """将实体注册到当前空间中（不应包含角色本体）。"""
-        if entity not in self._entities[entity.faction]:
-            self._entities[entity.faction].append(entity)
+        if self._entities[entity.faction].add(entity):
             from core.logger import get_emulation_logger
 
             get_emulation_logger().log_info(
@@ -45,8 +116,8 @@ class CombatSpace:
 
     def unregister(self, entity: BaseEntity) -> None:
         """从移除队列中标记该实体，待本帧结束时统一注销。"""
-        if entity not in self._remove_queue:
-            self._remove_queue.append(entity)
+        if entity.entity_id not in self._remove_queue:
+            self._remove_queue[entity.entity_id] = entity
             from core.logger import get_emulation_logger
 
             get_emulation_logger().log_info(
@@ -61,43 +132,101 @@ class CombatSpace:
             self.team.on_frame_update()
 
         # 2. 驱动空间内注册的所有物理实体 (召唤物、敌人、中立物)
-        for faction_list in self._entities.values():
-            for entity in faction_list:
-                if entity.state in [EntityState.ACTIVE, EntityState.FINISHING]:
+        for registry in self._entities.values():
+            for entity in registry:
+                if entity.state in LIVE_STATES:
                     entity.on_frame_update()
 
-                if not entity.is_active and entity.state != EntityState.FINISHING:
+                if entity.state not in LIVE_STATES:
                     self.unregister(entity)
 
         # 3. 执行注销队列
         if self._remove_queue:
-            for entity in self._remove_queue:
-                if entity in self._entities[entity.faction]:
-                    self._entities[entity.faction].remove(entity)
+            by_faction: dict[Faction, list[int]] = {}
+            for eid, entity in self._remove_queue.items():
+                by_faction.setdefault(entity.faction, []).append(eid)
+            for faction, eids in by_faction.items():
+                self._entities[faction].remove_many(eids)
             self._remove_queue.clear()
 
+    def get_registered_entities(self, active_only: bool = False) -> list[BaseEntity]:
+        """按阵营、注册顺序列出空间内的物理实体（不含角色）。
+
+        Args:
+            active_only: 仅返回仍需逐帧驱动 (ACTIVE / FINISHING) 的实体。
+        """
+        results: list[BaseEntity] = []
+        for registry in self._entities.values():
+            results.extend(registry.active() if active_only else registry)
+        return results
+
+    def next_wakeup(self, frame: int) -> float:
+        """[快进协议] 汇总队伍与空间实体的下一唤醒帧。"""
+        from core.tool import get_next_wakeup
+
+        wake = self.team.next_wakeup(frame) if self.team else float("inf")
+        for registry in self._entities.values():
+            for entity in registry:
+                if wake <= frame + 1:
+                    return wake
+                if entity.state in LIVE_STATES:
+                    wake = min(
+                        wake,
+                        get_next_wakeup(entity, frame, "on_frame_update", "_perform_tick"),
+                    )
+                else:
+                    # 待注销实体需在下一帧被清理
+                    wake = frame + 1
+        return wake
+
+    def fast_forward(self, frames: int) -> None:
+        """[快进协议] 同步推进队伍与空间实体的空闲帧。"""
+        if self.team:
+            self.team.fast_forward(frames)
+        for registry in self._entities.values():
+            for entity in registry:
+                entity.fast_forward(frames)
+
     # ---------------------------------------------------------
     # 物理判定内核 (XZ平面投影) - 已适配 Team 架构
     # ---------------------------------------------------------
 
-    def _get_search_targets(self, faction: Faction) -> list[BaseEntity]:
-        """获取检索时的候选实体列表（动态合并场上角色）。"""
-        targets: list[BaseEntity] = self._entities[faction].copy()
+    def _get_search_targets(
+        self, faction: Faction, bounds: tuple[float, float, float, float]
+    ) -> tuple[list[BaseEntity], bool]:
+        """获取检索时的候选实体列表（网格粗筛，动态合并场上角色）。
+
+        Args:
+            bounds: 查询区域在 XZ 平面的包围盒 (min_x, min_z, max_x, max_z)。
+
+        Returns:
+            (候选列表, 是否批量判定)。候选数达到 BATCH_MIN_TARGETS 时，
+            空间实体交由列式表批量判定，候选列表仅包含场上角色。
+        """
+        grid = self._entities[faction].grid
+        targets = grid.query_aabb(*bounds, ordered=False)
+        batched = len(targets) >= BATCH_MIN_TARGETS
+        if batched:
+            targets = []
+        else:
+            grid.sort(targets)
 
         # 如果检索玩家方，自动加入场上角色本体
         if faction == Faction.PLAYER and self.team and self.team.current_character:
             targets.append(self.team.current_character)
 
-        return targets
+        return targets, batched
 
     def get_entities_in_range(
         self, origin: tuple[float, float], radius: float, faction: Faction
     ) -> list[BaseEntity]:
         """执行圆柱/球体判定。"""
         ox, oz = origin
-        results: list[BaseEntity] = []
+        search_list, batched = self._get_search_targets(
+            faction, (ox - radius, oz - radius, ox + radius, oz + radius)
+        )
+        results = self._entities[faction].grid.table.in_range(ox, oz, radius) if batched else []
 
-        search_list = self._get_search_targets(faction)
         for e in search_list:
             ex, ez = e.pos[0], e.pos[1]
             dist_sq = (ex - ox) ** 2 + (ez - oz) ** 2
@@ -118,9 +247,22 @@ class CombatSpace:
         ox, oz = origin
         rad = math.radians(-facing)
         cos_f, sin_f = math.cos(rad), math.sin(rad)
-        results: list[BaseEntity] = []
 
-        search_list = self._get_search_targets(faction)
+        # 矩形四角 (局部坐标 (0|length, ±width/2)) 还原到世界坐标后取包围盒
+        half_w = width / 2.0
+        xs, zs = [], []
+        for lx in (0.0, length):
+            for lz in (-half_w, half_w):
+                xs.append(ox + lx * cos_f + lz * sin_f)
+                zs.append(oz - lx * sin_f + lz * cos_f)
+
+        search_list, batched = self._get_search_targets(
+            faction, (min(xs), min(zs), max(xs), max(zs))
+        )
+        results = (
+            self._entities[faction].grid.table.in_box(ox, oz, length, width, cos_f, sin_f) if batched else []
+        )
+
         for e in search_list:
             ex, ez = e.pos[0], e.pos[1]
             dx, dz = ex - ox, ez - oz
@@ -137,10 +279,22 @@ class CombatSpace:
         return results
 
     def broadcast_damage(self, attacker: CombatEntity, damage: Damage) -> None:
-        """发起伤害广播。"""
+        """发起伤害广播：所有命中目标共用同一个伤害对象触发受击逻辑。"""
+        for t in self.resolve_damage_targets(attacker, damage):
+            if not damage.target:
+                damage.set_target(t)
+            # 只有 CombatEntity 才能处理伤害
+            if isinstance(t, CombatEntity):
+                t.handle_damage(damage)
+
+    def resolve_damage_targets(self, attacker: CombatEntity, damage: Damage) -> list[BaseEntity]:
+        """[V3.3] 按伤害的判定框与选取策略解析命中目标 (不触发受击逻辑)。
+
+        DamageSystem 据此将范围攻击交由 DamagePipeline.run_targets 逐目标结算。
+        """
         config = getattr(damage, "config", None)
         if not config:
-            return
+            return []
 
         hb = config.hitbox
         shape = hb.shape
@@ -187,13 +341,7 @@ class CombatSpace:
                 f"伤害广播命中 {len(final_targets)} 个目标 (AOE: {shape.name})",
                 sender="Physics",
             )
-
-        for t in final_targets:
-            if not damage.target:
-                damage.set_target(t)
-            # 只有 CombatEntity 才能处理伤害
-            if isinstance(t, CombatEntity):
-                t.handle_damage(damage)
+        return final_targets
 
     def broadcast_element(
         self,
@@ -227,15 +375,14 @@ class CombatSpace:
         self, origin: tuple[float, float], faction: Faction
     ) -> BaseEntity | None:
         ox, oz = origin
-        best_dist = float("inf")
-        best_e: BaseEntity | None = None
+        best_e = self._entities[faction].grid.nearest(ox, oz)
 
-        search_list = self._get_search_targets(faction)
-        for e in search_list:
-            dist_sq = (e.pos[0] - ox) ** 2 + (e.pos[1] - oz) ** 2
-            if dist_sq < best_dist:
-                best_dist = dist_sq
-                best_e = e
+        # 场上角色不入网格，单独比较；距离相同时召唤物优先 (与注册顺序一致)
+        if faction == Faction.PLAYER and self.team and self.team.current_character:
+            char = self.team.current_character
+            char_dist = (char.pos[0] - ox) ** 2 + (char.pos[1] - oz) ** 2
+            if best_e is None or char_dist < (best_e.pos[0] - ox) ** 2 + (best_e.pos[1] - oz) ** 2:
+                best_e = char
         return best_e
 
     def _apply_selection_strategy(
@@ -259,19 +406,37 @@ class CombatSpace:
         max_targets = int(data.get("max_targets", 999))
         
         if select_way == "CLOSEST":
+            if len(unique_targets) >= BATCH_MIN_TARGETS and 0 < max_targets < len(unique_targets):
+                return self._closest_k(unique_targets, origin, max_targets)
             unique_targets.sort(
                 key=lambda e: (e.pos[0] - origin[0]) ** 2 + (e.pos[1] - origin[1]) ** 2
             )
         
         return unique_targets[: min(len(unique_targets), max_targets)]
 
+    @staticmethod
+    def _closest_k(
+        targets: list[BaseEntity], origin: tuple[float, float], k: int
+    ) -> list[BaseEntity]:
+        """最近的 k 个目标 (argpartition)，与按距离稳定排序后截取的结果一致。"""
+        ox, oz = origin
+        dist = np.fromiter(
+            ((e.pos[0] - ox) ** 2 + (e.pos[1] - oz) ** 2 for e in targets),
+            dtype=np.float64,
+            count=len(targets),
+        )
+        kth = np.partition(dist, k - 1)[k - 1]
+        # 与第 k 名同距的目标按原顺序取舍
+        candidates = np.flatnonzero(dist <= kth)
+        chosen = candidates[np.argsort(dist[candidates], kind="stable")][:k]
+        return [targets[i] for i in chosen.tolist()]
+
     def get_all_entities(self) -> list[BaseEntity]:
         """获取所有物理实体列表（包含场上角色）。"""
-        results: list[BaseEntity] = []
-        for faction_list in self._entities.values():
-            results.extend(faction_list)
+        results = self.get_registered_entities()
 
         if self.team and self.team.current_character:
-            if self.team.current_character not in results:
-                results.append(self.team.current_character)
+            char = self.team.current_character
+            if not any(char in registry for registry in self._entities.values()):
+                results.append(char)
         return results
@@ -3,6 +3,11 @@ from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import Any, TYPE_CHECKING
 
+from core.event import EventType
+from core.event_profiler import EventProfiler
+from core.rng import RandomStreams
+from core.timer_wheel import TimerWheel
+
 if TYPE_CHECKING:
     from core.combat_space import CombatSpace
     from core.systems.manager import SystemManager
@@ -25,6 +30,8 @@ class SimulationContext:
         space: 战场空间管理器，负责实体物理位置与碰撞。
         system_manager: 管理并驱动所有仿真子系统 (如伤害、反应系统)。
         logger: 仿真的日志记录器。
+        rng: 上下文级随机数源，种子会随会话一同记录。
+        timers: [V3.3] 帧倒计时的时间轮调度服务，每帧推进时触发到期回调。
     """
 
     # 基础状态
@@ -39,11 +46,19 @@ class SimulationContext:
     space: CombatSpace | None = None
     system_manager: SystemManager | None = None
     logger: SimulationLogger | None = None
+    # 随机数源：由单一种子派生的独立命名随机流
+    rng: RandomStreams = field(default_factory=RandomStreams)
+    # 帧倒计时调度：到期帧 -> 回调
+    timers: TimerWheel = field(default_factory=TimerWheel)
+    # 伤害审计级别：full / summary / off (见 core.systems.damage.context)
+    audit_level: str = "full"
 
     # 内部状态管理
     _modifier_id_counter: int = field(default=0, init=False)
     _instance_id_counter: int = field(default=0, init=False)
     _seen_entities: set[int] = field(default_factory=set, init=False)
+    # 增量快照：entity_id -> 上次写入快照时的状态版本号
+    _snapshot_versions: dict[int, int] = field(default_factory=dict, init=False)
     _token: Any | None = field(default=None, init=False, repr=False)
 
     def get_next_modifier_id(self) -> int:
@@ -85,9 +100,47 @@ class SimulationContext:
             self.event_engine.clear_frame_events()
             
         self.current_frame += 1
+        self.timers.advance(self.current_frame)
         if self.space:
             self.space.on_frame_update()
 
+    def next_wakeup(self) -> float:
+        """[快进协议] 汇总空间实体、时间轮与 FRAME_END 订阅者，返回下一个必须逐帧执行的帧号。
+
+        任何无法声明唤醒帧的组件都会使结果退化为 current_frame + 1。
+        """
+        from core.tool import get_next_wakeup
+
+        frame = self.current_frame
+        wake = self.space.next_wakeup(frame) if self.space else float("inf")
+        wake = min(wake, self.timers.next_due())
+
+        engine = self.event_engine
+        while engine and wake > frame + 1:
+            for handler in engine.handlers(EventType.FRAME_END):
+                wake = min(wake, get_next_wakeup(handler, frame, "handle_event"))
+            engine = engine.parent
+        return wake
+
+    def fast_forward(self, frames: int) -> None:
+        """[快进协议] 跳过 frames 个空闲帧。
+
+        调用方需保证这些帧内不存在任何唤醒点 (见 next_wakeup)，
+        跳过后的状态与逐帧推进完全一致。
+        """
+        if frames <= 0:
+            return
+        self.current_frame += frames
+        self.timers.advance(self.current_frame)
+        if self.space:
+            self.space.fast_forward(frames)
+
+        engine = self.event_engine
+        while engine:
+            for handler in engine.handlers(EventType.FRAME_END):
+                handler.fast_forward(frames)
+            engine = engine.parent
+
     def get_system(self, cls_or_name: str | type) -> Any | None:
         """获取已挂载的仿真系统实例。
 
@@ -106,7 +159,9 @@ class SimulationContext:
         self.current_frame = 0
         self.global_move_dist = 0.0
         self.global_vertical_dist = 0.0
+        self.timers.clear()
         self._seen_entities.clear()
+        self._snapshot_versions.clear()
         if self.event_engine:
             self.event_engine.clear()
 
@@ -114,10 +169,19 @@ class SimulationContext:
         if self.logger:
             self.logger.log_info("Context Reset", sender="Context")
 
-    def take_snapshot(self) -> dict[str, Any]:
-        """抓取当前仿真场景的全量状态快照 (V3.0 自动化登记增强版)。"""
+    def take_snapshot(self, keyframe: bool = False) -> dict[str, Any]:
+        """抓取当前仿真场景的状态快照 (V3.0 自动化登记增强版)。
+
+        [V3.3] 默认为增量快照：仅导出自上次快照以来状态版本发生变化的实体。
+
+        Args:
+            keyframe: 为 True 时导出全部实体的完整状态 (关键帧)。
+        """
+        from core.tool import get_state_version
+
         snapshot: dict[str, Any] = {
             "frame": self.current_frame,
+            "keyframe": keyframe,
             "global": {
                 "move_dist": round(self.global_move_dist, 3),
                 "vertical_dist": round(self.global_vertical_dist, 3),
@@ -129,15 +193,12 @@ class SimulationContext:
         }
 
         if self.space:
-            from core.entities.base_entity import Faction
-            
             # 统一处理所有实体
             all_current_entities: list[Any] = []
             if self.space.team:
                 all_current_entities.extend(self.space.team.get_members())
             
-            for faction in Faction:
-                all_current_entities.extend(self.space._entities.get(faction, []))
+            all_current_entities.extend(self.space.get_registered_entities())
 
             for entity in all_current_entities:
                 # 1. 发现新实体，导出元数据进行登记
@@ -149,7 +210,11 @@ class SimulationContext:
                     snapshot["entities_meta"].append(meta)
                     self._seen_entities.add(eid)
 
-                # 2. 导出状态
+                # 2. 状态未变化的实体跳过导出
+                version = get_state_version(entity)
+                if not keyframe and self._snapshot_versions.get(eid) == version:
+                    continue
+                self._snapshot_versions[eid] = version
                 state = entity.export_state()
                 
                 # 判定实体类型 (优先从 meta 获取，否则兜底)
@@ -173,11 +238,28 @@ class SimulationContext:
 # ---------------------------------------------------------
 
 
+# 具有审计价值的事件类型 (V2.5 增强版：包含生命周期与跳变事件)，发布时写入帧缓冲区
+REVIEW_EVENT_TYPES: frozenset[EventType] = frozenset({
+    EventType.AFTER_DAMAGE,
+    EventType.AFTER_ELEMENTAL_REACTION,
+    EventType.AFTER_HEAL,
+    EventType.AFTER_ENERGY_CHANGE,
+    EventType.AFTER_HEALTH_CHANGE,
+    EventType.ON_MODIFIER_ADDED,
+    EventType.ON_MODIFIER_REMOVED,
+    EventType.ON_EFFECT_ADDED,
+    EventType.ON_EFFECT_REMOVED,
+})
+
+
 class EventEngine:
     """基于实例的事件驱动引擎。
 
     支持在特定的 SimulationContext 内进行事件订阅、取消订阅与发布。
     支持业务事件的帧内缓冲，以便于战果复盘持久化。
+
+    订阅表在 subscribe / unsubscribe 时预编译为按事件类型索引的分发元组
+    (按优先级排序的 handle_event 绑定方法)，publish 仅做一次字典查询与遍历。
     """
 
     def __init__(self, parent: EventEngine | None = None):
@@ -186,22 +268,31 @@ class EventEngine:
         Args:
             parent: 可选的父引擎，若存在，事件将向上冒泡发布。
         """
-        self._handlers: dict[Any, list[Any]] = {}
+        # event_type -> [(优先级, 订阅序号, 处理程序)]
+        self._handlers: dict[Any, list[tuple[int, int, Any]]] = {}
+        # event_type -> 预编译的分发元组
+        self._dispatch: dict[Any, tuple[Any, ...]] = {}
+        self._seq = 0
         self.parent = parent
+        # 可选的事件总线剖析器 (见 enable_profiling)，为空时不产生任何计时开销
+        self.profiler: EventProfiler | None = None
         # 缓存当前帧的关键业务事件，供快照导出使用
         self.current_frame_events: list[dict[str, Any]] = []
 
-    def subscribe(self, event_type: Any, handler: Any) -> None:
+    def subscribe(self, event_type: Any, handler: Any, priority: int = 0) -> None:
         """订阅特定类型的事件。
 
         Args:
             event_type: 事件类型枚举。
-            handler: 处理函数或实现了 handle_event 的对象。
+            handler: 实现了 handle_event 的对象，或直接接收事件的可调用对象。
+            priority: 分发优先级，数值越大越先执行；同优先级按订阅顺序执行。
         """
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        if handler not in self._handlers[event_type]:
-            self._handlers[event_type].append(handler)
+        entries = self._handlers.setdefault(event_type, [])
+        if any(h is handler or h == handler for _, _, h in entries):
+            return
+        self._seq += 1
+        entries.append((-priority, self._seq, handler))
+        self._compile(event_type)
 
     def unsubscribe(self, event_type: Any, handler: Any) -> None:
         """取消对特定事件的订阅。
@@ -210,52 +301,66 @@ class EventEngine:
             event_type: 事件类型枚举。
             handler: 之前订阅的处理程序。
         """
-        if event_type in self._handlers:
-            if handler in self._handlers[event_type]:
-                self._handlers[event_type].remove(handler)
+        entries = self._handlers.get(event_type)
+        if not entries:
+            return
+        for i, (_, _, h) in enumerate(entries):
+            if h is handler or h == handler:
+                del entries[i]
+                self._compile(event_type)
+                return
+
+    def handlers(self, event_type: Any) -> list[Any]:
+        """按分发顺序返回某事件类型的处理程序列表。"""
+        return [h for _, _, h in sorted(self._handlers.get(event_type, []), key=lambda e: e[:2])]
+
+    def _compile(self, event_type: Any) -> None:
+        entries = self._handlers[event_type]
+        if not entries:
+            del self._handlers[event_type]
+            self._dispatch.pop(event_type, None)
+            return
+        entries.sort(key=lambda e: e[:2])
+        self._dispatch[event_type] = tuple(getattr(h, "handle_event", h) for _, _, h in entries)
 
     def publish(self, event: Any) -> None:
         """发布一个事件，触发所有对应的处理程序。
         具有“审计价值”的事件将被自动拦截并存入帧缓冲区。
         """
-        # 拦截关键业务事件 (V2.5 增强版：包含生命周期与跳变事件)
-        from core.event import EventType
-        review_targets = {
-            EventType.AFTER_DAMAGE, 
-            EventType.AFTER_ELEMENTAL_REACTION, 
-            EventType.AFTER_HEAL,
-            EventType.AFTER_ENERGY_CHANGE,
-            EventType.AFTER_HEALTH_CHANGE,
-            EventType.ON_MODIFIER_ADDED,
-            EventType.ON_MODIFIER_REMOVED,
-            EventType.ON_EFFECT_ADDED,
-            EventType.ON_EFFECT_REMOVED
-        }
-        
-        if hasattr(event, "event_type") and event.event_type in review_targets:
+        event_type = event.event_type
+        if event_type in REVIEW_EVENT_TYPES:
+            source = event.source
             self.current_frame_events.append({
-                "type": event.event_type.name,
+                "type": event_type.name,
                 "frame": event.frame,
-                "source_id": getattr(event.source, "entity_id", None),
-                "source_name": getattr(event.source, "name", "Unknown"),
-                "payload": event.data 
+                "source_id": getattr(source, "entity_id", None),
+                "source_name": getattr(source, "name", "Unknown"),
+                "payload": event.data
             })
 
-        if hasattr(event, "event_type"):
-            # 使用快照迭代以防止处理过程中订阅列表发生变化
-            handlers = self._handlers.get(event.event_type, []).copy()
-            for handler in handlers:
+        # 分发元组不可变，处理过程中的订阅变更只影响下一次发布
+        if self.profiler is not None:
+            if self.profiler.dispatch(event, self._dispatch.get(event_type, ())):
+                return
+        else:
+            for handle in self._dispatch.get(event_type, ()):
                 # 卫语句：如果事件已被标记为取消，停止分发
-                if getattr(event, "cancelled", False):
+                if event.cancelled:
                     return
-                handler.handle_event(event)
+                handle(event)
 
         # 冒泡至父引擎
-        if getattr(event, "propagation_stopped", False):
+        if event.propagation_stopped:
             return
         if self.parent:
             self.parent.publish(event)
 
+    def enable_profiling(self) -> EventProfiler:
+        """开启事件总线剖析模式 (仅作用于本引擎)，返回剖析器。"""
+        if self.profiler is None:
+            self.profiler = EventProfiler()
+        return self.profiler
+
     def clear_frame_events(self) -> None:
         """清空当前帧的事件缓冲区。"""
         self.current_frame_events.clear()
@@ -263,6 +368,7 @@ class EventEngine:
     def clear(self) -> None:
         """清除所有订阅记录与事件缓冲。"""
         self._handlers.clear()
+        self._dispatch.clear()
         self.current_frame_events.clear()
 
 
@@ -299,11 +405,14 @@ def set_context(ctx: SimulationContext) -> None:
     _current_context.set(ctx)
 
 
-def create_context() -> SimulationContext:
+def create_context(seed: int | None = None) -> SimulationContext:
     """工厂函数：创建一个完整配置的仿真上下文实例。
 
     该函数会自动初始化注册表、日志系统以及挂载所有核心仿真子系统。
 
+    Args:
+        seed: 随机数源的根种子，为空时随机生成。
+
     Returns:
         SimulationContext: 已就绪的上下文实例。
     """
@@ -323,7 +432,7 @@ def create_context() -> SimulationContext:
 
     # 1. 基础环境准备
     initialize_registry()
-    ctx = SimulationContext()
+    ctx = SimulationContext(rng=RandomStreams(seed))
     set_context(ctx)
 
     # 2. 挂载核心组件
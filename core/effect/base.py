@@ -1,6 +1,8 @@
+import math
 from abc import ABC
 from enum import Enum, auto
 from typing import Any, Optional
+from core.effect.store import EffectStore
 from core.logger import get_emulation_logger
 from core.tool import get_current_time
 
@@ -11,10 +13,19 @@ class StackingRule(Enum):
     INDEPENDENT = auto()  # 独立存在
 
 
+# 类 -> 是否为被动效果 (未重写任何逐帧钩子)
+_PASSIVE_CLASSES: dict[type, bool] = {}
+
+
 class BaseEffect(ABC):
     """
     效果基类。
     支持完整的生命周期管理与去全局化 Context。
+
+    [V3.3] 未重写逐帧钩子 (on_frame_update / on_tick / fast_forward) 的被动效果
+    挂载在战斗实体上时不再逐帧扣减持续时间：剩余时间按持有者的效果时钟推算，
+    到期帧登记到上下文时间轮 (SimulationContext.timers)，由持有者在到期帧的
+    逐帧逻辑中移除，与逐帧扣减的移除时机一致。
     """
 
     def __init__(
@@ -26,7 +37,11 @@ class BaseEffect(ABC):
     ):
         self.owner = owner  # 效果持有者 (Character 或 Target)
         self.name = name
-        self.duration = duration  # 剩余帧数 (float('inf') 为永久)
+        self._duration = duration  # 剩余帧数 (float('inf') 为永久)
+        # 时间轮驱动：同步时刻持有者的效果时钟读数与到期定时器
+        self._scheduled = False
+        self._synced_tick = 0
+        self._expiry: Any = None
         self.max_duration = duration
         self.stacking_rule = stacking_rule
         self.is_active = False
@@ -53,6 +68,9 @@ class BaseEffect(ABC):
 
         self.is_active = True
         self.start_frame = get_current_time()
+        if self._can_schedule():
+            self._scheduled = True
+            self.duration = self._duration
         self.owner.add_effect(self)
         self.on_apply()
         get_emulation_logger().log_effect(self.owner, self.name, action="获得")
@@ -63,13 +81,78 @@ class BaseEffect(ABC):
         if not self.is_active:
             return
         self.is_active = False
+        if self._scheduled:
+            self._duration = self.duration
+            self._scheduled = False
+            self.owner.ctx.timers.cancel(self._expiry)
+            self._expiry = None
         self.on_remove()
         self.owner.remove_effect(self)
         get_emulation_logger().log_effect(self.owner, self.name, action="结束")
 
+    @property
+    def duration(self) -> float:
+        """剩余帧数 (float('inf') 为永久)。"""
+        if self._scheduled:
+            return self._duration - (self.owner._effect_ticks - self._synced_tick)
+        return self._duration
+
+    @duration.setter
+    def duration(self, value: float) -> None:
+        self._duration = value
+        if self._scheduled:
+            self._synced_tick = self.owner._effect_ticks
+            self._schedule_expiry()
+
+    @classmethod
+    def is_passive(cls) -> bool:
+        """是否为被动效果：未重写任何逐帧钩子，持续时间可交由时间轮管理。"""
+        passive = _PASSIVE_CLASSES.get(cls)
+        if passive is None:
+            passive = _PASSIVE_CLASSES[cls] = all(
+                getattr(cls, hook) is getattr(BaseEffect, hook)
+                for hook in ("on_frame_update", "on_tick", "fast_forward")
+            )
+        return passive
+
+    def _can_schedule(self) -> bool:
+        owner = self.owner
+        return (
+            self.is_passive()
+            and hasattr(owner, "_effect_ticks")
+            and getattr(owner, "ctx", None) is not None
+        )
+
+    def _schedule_expiry(self) -> None:
+        """按剩余时间登记最早可能的到期帧。
+
+        持有者在到期帧逐帧时复核剩余时间，未到期则重新登记，
+        因此登记偏早只会多一次唤醒，不会改变移除时机。
+        """
+        owner = self.owner
+        timers = owner.ctx.timers
+        timers.cancel(self._expiry)
+        self._expiry = None
+        remaining = self.duration
+        if remaining == float("inf"):
+            return
+
+        # 还需经历的持有者逐帧次数；本帧持有者尚未执行逐帧逻辑时，按本帧计入
+        ticks = max(1, math.ceil(remaining))
+        frame = owner.ctx.current_frame
+        due = frame + ticks if owner._effect_tick_frame == frame else frame + ticks - 1
+        if due <= frame:
+            owner._due_effects.append(self)
+        else:
+            self._expiry = timers.schedule(due, self._on_expiry_due)
+
+    def _on_expiry_due(self) -> None:
+        self._expiry = None
+        self.owner._due_effects.append(self)
+
     def on_frame_update(self, target: Any):
         """每一帧的驱动逻辑"""
-        if not self.is_active:
+        if not self.is_active or self._scheduled:
             return
 
         # 处理持续时间
@@ -82,10 +165,24 @@ class BaseEffect(ABC):
         # 触发每帧钩子
         self.on_tick(target)
 
+    def next_wakeup(self, frame: int) -> float:
+        """[快进协议] 返回效果到期的帧号；重写 on_tick 的子类需同步重写本方法。"""
+        if not self.is_active or self._scheduled or self.duration == float("inf"):
+            return float("inf")
+        return frame + max(1, math.ceil(self.duration))
+
+    def fast_forward(self, frames: int) -> None:
+        """[快进协议] 扣除空闲帧对应的持续时间 (调度方保证不会越过到期帧)。"""
+        if self.is_active and not self._scheduled and self.duration != float("inf"):
+            self.duration -= frames
+
     def _find_existing(self) -> Optional["BaseEffect"]:
         """在 owner 身上查找同名效果"""
-        if not hasattr(self.owner, "active_effects"):
+        effects = getattr(self.owner, "active_effects", None)
+        if effects is None:
             return None
+        if isinstance(effects, EffectStore):
+            return effects.find(self.name, self.__class__)
         return next(
             (
                 e
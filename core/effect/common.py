@@ -100,6 +100,14 @@ class TalentEffect:
             return
         pass
 
+    def next_wakeup(self, frame: int) -> float:
+        """[快进协议] 返回下一唤醒帧。重写 on_frame_update 的子类需同步重写。"""
+        return float("inf")
+
+    def fast_forward(self, frames: int) -> None:
+        """[快进协议] 跳过 frames 个空闲帧。"""
+        pass
+
 
 class ConstellationEffect:
     """
@@ -132,6 +140,14 @@ class ConstellationEffect:
             return
         pass
 
+    def next_wakeup(self, frame: int) -> float:
+        """[快进协议] 返回下一唤醒帧。重写 on_frame_update 的子类需同步重写。"""
+        return float("inf")
+
+    def fast_forward(self, frames: int) -> None:
+        """[快进协议] 跳过 frames 个空闲帧。"""
+        pass
+
 
 # ================================
 # 月兆系统相关类
@@ -0,0 +1,190 @@
+"""[V3.3] 实体效果存储。
+
+以名称、类型与名称前缀树索引实体身上的活跃效果，挂载、移除与按名查询均为 O(1)，
+不随增益数量增长；迭代与切片保持挂载顺序，与原先的列表语义一致。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+
+class _TrieNode:
+    __slots__ = ("children", "terminal", "count")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.terminal = False
+        # 子树中 (含自身) 的效果名数量，归零时剪枝
+        self.count = 0
+
+
+class EffectStore:
+    """
+    活跃效果容器。
+
+    - 挂载顺序：效果 -> 挂载序号 (字典保持插入顺序，移除为 O(1))；
+    - 名称索引：名称 -> 同名效果 (按挂载顺序)；
+    - 类型索引：具体类型 -> 该类型的效果，isinstance 查询在少量类型键上展开；
+    - 前缀树：仅收录当前存在效果的名称，供前缀查询。
+    效果以对象身份为键，深拷贝时索引随之重建。
+    """
+
+    def __init__(self) -> None:
+        self._order: dict[Any, int] = {}
+        self._by_name: dict[str, dict[Any, int]] = {}
+        self._by_class: dict[type, dict[Any, int]] = {}
+        self._trie = _TrieNode()
+        self._seq = 0
+
+    # -----------------------------------------------------
+    # 序列接口 (兼容原 list 用法)
+    # -----------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __bool__(self) -> bool:
+        return bool(self._order)
+
+    def __contains__(self, effect: Any) -> bool:
+        return effect in self._order
+
+    def __iter__(self) -> Iterator[Any]:
+        # 迭代快照，允许在遍历中挂载或移除效果
+        return iter(list(self._order))
+
+    def __getitem__(self, index: int | slice) -> Any:
+        return list(self._order)[index]
+
+    def __repr__(self) -> str:
+        return f"EffectStore({list(self._order)!r})"
+
+    # -----------------------------------------------------
+    # 挂载 / 移除
+    # -----------------------------------------------------
+
+    def add(self, effect: Any) -> bool:
+        """按挂载顺序追加效果，已存在时返回 False。"""
+        if effect in self._order:
+            return False
+        self._seq += 1
+        seq = self._seq
+        self._order[effect] = seq
+        self._by_class.setdefault(type(effect), {})[effect] = seq
+
+        name = effect.name
+        bucket = self._by_name.get(name)
+        if bucket is None:
+            bucket = self._by_name[name] = {}
+            self._trie_insert(name)
+        bucket[effect] = seq
+        return True
+
+    def remove(self, effect: Any) -> bool:
+        """移除效果，不存在时返回 False。"""
+        if self._order.pop(effect, None) is None:
+            return False
+        cls = type(effect)
+        bucket = self._by_class[cls]
+        del bucket[effect]
+        if not bucket:
+            del self._by_class[cls]
+
+        name = effect.name
+        bucket = self._by_name[name]
+        del bucket[effect]
+        if not bucket:
+            del self._by_name[name]
+            self._trie_remove(name)
+        return True
+
+    # -----------------------------------------------------
+    # 查询
+    # -----------------------------------------------------
+
+    def get(self, name: str) -> Any | None:
+        """最早挂载的同名效果。"""
+        bucket = self._by_name.get(name)
+        return next(iter(bucket)) if bucket else None
+
+    def has(self, name: str) -> bool:
+        return name in self._by_name
+
+    def find(self, name: str, cls: type) -> Any | None:
+        """最早挂载的、名称为 name 且为 cls 实例的效果 (效果堆叠判定)。"""
+        bucket = self._by_name.get(name)
+        if bucket:
+            for effect in bucket:
+                if isinstance(effect, cls):
+                    return effect
+        return None
+
+    def of_type(self, cls: type) -> list[Any]:
+        """所有 cls 实例 (含子类)，按挂载顺序。"""
+        matched: list[tuple[int, Any]] = []
+        for klass, bucket in self._by_class.items():
+            if issubclass(klass, cls):
+                matched.extend((seq, e) for e, seq in bucket.items())
+        matched.sort(key=lambda item: item[0])
+        return [e for _, e in matched]
+
+    def first_of_type(self, cls: type) -> Any | None:
+        """最早挂载的 cls 实例 (含子类)。"""
+        best: Any = None
+        best_seq = 0
+        for klass, bucket in self._by_class.items():
+            if issubclass(klass, cls):
+                effect, seq = next(iter(bucket.items()))
+                if best is None or seq < best_seq:
+                    best, best_seq = effect, seq
+        return best
+
+    def with_prefix(self, prefix: str) -> list[Any]:
+        """名称以 prefix 开头的全部效果，按挂载顺序。"""
+        node = self._trie
+        for ch in prefix:
+            child = node.children.get(ch)
+            if child is None:
+                return []
+            node = child
+
+        matched: list[tuple[int, Any]] = []
+        stack = [(node, prefix)]
+        while stack:
+            node, name = stack.pop()
+            if node.terminal:
+                matched.extend((seq, e) for e, seq in self._by_name[name].items())
+            for ch, child in node.children.items():
+                stack.append((child, name + ch))
+        matched.sort(key=lambda item: item[0])
+        return [e for _, e in matched]
+
+    # -----------------------------------------------------
+    # 前缀树维护
+    # -----------------------------------------------------
+
+    def _trie_insert(self, name: str) -> None:
+        node = self._trie
+        node.count += 1
+        for ch in name:
+            child = node.children.get(ch)
+            if child is None:
+                child = node.children[ch] = _TrieNode()
+            node = child
+            node.count += 1
+        node.terminal = True
+
+    def _trie_remove(self, name: str) -> None:
+        node = self._trie
+        node.count -= 1
+        for ch in name:
+            child = node.children[ch]
+            child.count -= 1
+            if child.count == 0:
+                # 其后的整条分支仅属于该名称
+                del node.children[ch]
+                return
+            node = child
+        node.terminal = False
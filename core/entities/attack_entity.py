@@ -12,7 +12,8 @@ from typing import Any, TYPE_CHECKING
 
 from core.entities.base_entity import BaseEntity, Faction
 from core.event import GameEvent, EventType
-from core.tool import get_current_time
+from core.rng import TARGETING_STREAM
+from core.tool import get_current_time, get_rng
 
 if TYPE_CHECKING:
     from core.context import SimulationContext
@@ -111,6 +112,21 @@ class AttackEntity(BaseEntity):
         elif self.trigger_type == AttackTriggerType.TRACKING:
             self._perform_tracking()
 
+    def next_wakeup(self, frame: int) -> float:
+        """[快进协议] 命中帧模式按下一命中帧唤醒；追踪/近身判定需逐帧执行。"""
+        wake = super().next_wakeup(frame)
+        if not self.is_active or self.has_attacked:
+            return wake
+
+        if self.trigger_type == AttackTriggerType.ON_HIT_FRAME:
+            if self.hit_index < len(self.hit_frames):
+                steps = self.hit_frames[self.hit_index] - self.current_frame
+                wake = min(wake, frame + max(1, steps))
+            return wake
+        if self.trigger_type in (AttackTriggerType.ON_PROXIMITY, AttackTriggerType.TRACKING):
+            return frame + 1
+        return wake
+
     def _check_hit_frame(self) -> None:
         """检查是否到达命中帧。"""
         if self.hit_index < len(self.hit_frames):
@@ -207,14 +223,20 @@ class AttackEntity(BaseEntity):
             )
             return candidates[0]
         elif self.targeting_mode == TargetingMode.RANDOM:
-            import random
-
-            return random.choice(candidates)
+            return get_rng(TARGETING_STREAM).choice(candidates)
         elif self.targeting_mode == TargetingMode.FIXED:
             return self.tracking_target if self.tracking_target in candidates else candidates[0]
 
         return candidates[0]
 
+    def _state_signature(self) -> tuple:
+        """扩展命中状态签名。"""
+        return super()._state_signature() + (
+            self.has_attacked,
+            self.trigger_type,
+            self.targeting_mode,
+        )
+
     def export_state(self) -> dict[str, Any]:
         """导出状态快照。"""
         base = super().export_state()
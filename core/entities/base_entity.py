@@ -1,14 +1,20 @@
 from __future__ import annotations
+import math
 from enum import Enum, auto
 from typing import Any, TYPE_CHECKING
 
 from core.context import get_context
+from core.effect.store import EffectStore
 from core.mechanics.aura import AuraManager
 from core.mechanics.icd import ICDManager
+from core.spatial_index import TrackedPosition
 from core.systems.contract.modifier import ModifierRecord
+from core.systems.contract.stats import STATS
+from core.tool import get_next_wakeup
 
 if TYPE_CHECKING:
     from core.effect.common import ShieldEffect
+    from core.spatial_index import GridIndex
     from core.context import SimulationContext, EventEngine
 
 
@@ -37,6 +43,9 @@ class BaseEntity:
     """
     _id_counter = 0
 
+    # 所属阵营的空间索引，由 CombatSpace 在注册/注销时维护
+    _spatial_index: GridIndex | None = None
+
     def __init__(
         self,
         name: str,
@@ -66,9 +75,9 @@ class BaseEntity:
         self.state: EntityState = EntityState.ACTIVE
 
         # 空间属性
-        self.pos: list[float] = list(pos)
+        self.pos = pos
         self.facing: float = facing
-        self.hitbox: tuple[float, float] = hitbox
+        self.hitbox = hitbox
         self.faction: Faction = faction
 
         # 目标选择属性
@@ -78,6 +87,10 @@ class BaseEntity:
         self.ctx = context if context else get_context()
         self.event_engine: EventEngine | None = self.ctx.event_engine if self.ctx else None
 
+        # 增量快照：状态版本号及上次登记的状态签名
+        self._state_version: int = 0
+        self._state_sig: tuple | None = None
+
     def __hash__(self) -> int:
         """基于 entity_id 的哈希，确保在 set 等集合中的唯一性。"""
         return hash(self.entity_id)
@@ -88,6 +101,28 @@ class BaseEntity:
             return self.entity_id == other.entity_id
         return False
 
+    @property
+    def pos(self) -> list[float]:
+        """位置坐标 [x, z, y]。原地修改与整体赋值均会同步空间索引。"""
+        return self._pos
+
+    @pos.setter
+    def pos(self, value: Any) -> None:
+        self._pos = TrackedPosition(value, self)
+        if self._spatial_index is not None:
+            self._spatial_index.move(self)
+
+    @property
+    def hitbox(self) -> tuple[float, float]:
+        """碰撞盒尺寸 (radius, height)。"""
+        return self._hitbox
+
+    @hitbox.setter
+    def hitbox(self, value: tuple[float, float]) -> None:
+        self._hitbox = value
+        if self._spatial_index is not None:
+            self._spatial_index.resize(self)
+
     @property
     def is_active(self) -> bool:
         """判断实体是否处于活跃状态。"""
@@ -114,6 +149,28 @@ class BaseEntity:
         """[钩子] 实体的具体业务逻辑实现点。子类应重写此方法而非 on_frame_update。"""
         pass
 
+    def next_wakeup(self, frame: int) -> float:
+        """[快进协议] 返回下一个必须逐帧执行的绝对帧号。
+
+        基类仅关心生命周期：处于 FINISHING 的实体需在下一帧结清，
+        有限寿命的实体在到期帧唤醒。重写 _perform_tick 的子类需同步重写本方法，
+        否则调度方会保守地逐帧驱动该实体。
+
+        Args:
+            frame: 当前已结算完毕的帧号。
+        """
+        if self.state == EntityState.FINISHING:
+            return frame + 1
+        if self.state != EntityState.ACTIVE or self.life_frame == float("inf"):
+            return float("inf")
+        return frame + max(1, math.ceil(self.life_frame - self.current_frame))
+
+    def fast_forward(self, frames: int) -> None:
+        """[快进协议] 跳过 frames 个空闲帧，等效推进实体内部计数器。"""
+        if self.state != EntityState.ACTIVE:
+            return
+        self.current_frame += frames
+
     def finish(self) -> None:
         """终结实体生命周期，执行清理逻辑。"""
         if self.state not in [EntityState.ACTIVE, EntityState.FINISHING]:
@@ -140,6 +197,31 @@ class BaseEntity:
             "hitbox_height": self.hitbox[1],
         }
 
+    def _state_signature(self) -> tuple:
+        """[增量快照协议] 返回 export_state 所依赖字段的轻量签名。
+
+        签名不需要与导出内容逐字对应，只需在导出内容可能变化时随之变化。
+        重写 export_state 的子类需同步扩展本方法，否则该实体每帧都会被视为已变更。
+        """
+        return (self.state, tuple(self.pos), self.facing, self.hitbox)
+
+    def poll_state_version(self) -> int:
+        """比对当前状态签名，若有变化则推进并返回状态版本号。"""
+        sig = self._state_signature()
+        if sig != self._state_sig:
+            # 签名中的可变容器需拷贝留存，否则后续原地修改无法被检出
+            self._state_sig = tuple(
+                x.copy() if isinstance(x, (dict, list)) else x for x in sig
+            )
+            self._state_version += 1
+        return self._state_version
+
+    def mark_state_dirty(self) -> int:
+        """强制推进状态版本号，使实体出现在下一个增量快照中。"""
+        self._state_version += 1
+        self._state_sig = None
+        return self._state_version
+
     def export_static_data(self) -> dict[str, Any]:
         """[扩展点] 导出实体的静态登记信息。由子类具体实现。"""
         owner_id = None
@@ -189,8 +271,15 @@ class CombatEntity(BaseEntity):
 
         # 核心战斗组件
         self.aura: AuraManager = AuraManager()
-        self.active_effects: list[Any] = []
+        # [V3.3] 按名称/类型/前缀索引的效果存储 (迭代保持挂载顺序)
+        self.active_effects: EffectStore = EffectStore()
         self.shield_effects: list[ShieldEffect] = []
+        # [V3.3] 效果时钟：被动效果按持有者逐帧次数推算剩余时间，到期由时间轮登记
+        self._effect_ticks: int = 0
+        self._effect_tick_frame: int = -1
+        self._due_effects: list[Any] = []
+        # 需要逐帧驱动的效果 (active_effects 的保序子集)
+        self._ticking_effects: list[Any] = []
 
         # ICD 管理器 (用于追踪该实体受到的附着冷却)
         self.icd_manager: ICDManager = ICDManager(self)
@@ -199,10 +288,51 @@ class CombatEntity(BaseEntity):
         self.custom_metrics: dict[str, float] = {}
 
         # [新] 属性审计链支持
-
-        self.dynamic_modifiers: list[ModifierRecord] = []
+        # 属性索引：按属性名分桶的修饰符 (保持注入顺序)；各属性的版本号与
+        # 合算缓存以属性 ID (见 STATS) 为下标，供 AttributeCalculator 按 (基础值, 版本号) 缓存合算结果
+        self._modifiers_by_stat: dict[str, list[ModifierRecord]] = {}
+        self._stat_versions: list[int] = [0] * len(STATS)
+        self._stat_totals: list[tuple[float, int, float] | None] = [None] * len(STATS)
+        self.modifier_version: int = 0
+
+        self.dynamic_modifiers = []
         self.attribute_data: dict[str, float] = {}
 
+    @property
+    def dynamic_modifiers(self) -> list[ModifierRecord]:
+        """动态修饰符列表。请通过 add_modifier / remove_modifier 增删，整体赋值会重建属性索引。"""
+        return self._dynamic_modifiers
+
+    @dynamic_modifiers.setter
+    def dynamic_modifiers(self, modifiers: list[ModifierRecord]) -> None:
+        touched = set(self._modifiers_by_stat)
+        self._dynamic_modifiers = modifiers
+        self._modifiers_by_stat = {}
+        for m in modifiers:
+            self._modifiers_by_stat.setdefault(m.stat, []).append(m)
+            touched.add(m.stat)
+        for stat in touched:
+            self._touch_stat(stat)
+
+    def _touch_stat(self, stat: str) -> None:
+        """推进属性版本号，使该属性的缓存合算值失效。"""
+        sid = STATS.intern(stat)
+        self.ensure_stat_slots(sid)
+        self._stat_versions[sid] += 1
+        self.modifier_version += 1
+
+    def ensure_stat_slots(self, stat_id: int) -> None:
+        """按需扩展以属性 ID 为下标的版本号与缓存数组。"""
+        missing = stat_id + 1 - len(self._stat_versions)
+        if missing > 0:
+            self._stat_versions.extend([0] * missing)
+            self._stat_totals.extend([None] * missing)
+
+    def get_stat_version(self, stat: str) -> int:
+        """获取指定属性修饰符的版本号。"""
+        sid = STATS.intern(stat)
+        return self._stat_versions[sid] if sid < len(self._stat_versions) else 0
+
     def add_modifier(
         self, source: str, stat: str, value: float, op: str = "ADD"
     ) -> ModifierRecord:
@@ -217,6 +347,8 @@ class CombatEntity(BaseEntity):
 
         modifier = ModifierRecord(m_id, source, stat, value, op)
         self.dynamic_modifiers.append(modifier)
+        self._modifiers_by_stat.setdefault(stat, []).append(modifier)
+        self._touch_stat(stat)
         
         # 2. 发布生命周期事件
         if self.event_engine:
@@ -237,6 +369,8 @@ class CombatEntity(BaseEntity):
 
         if modifier in self.dynamic_modifiers:
             self.dynamic_modifiers.remove(modifier)
+            self._modifiers_by_stat[modifier.stat].remove(modifier)
+            self._touch_stat(modifier.stat)
             if self.event_engine:
                 self.event_engine.publish(
                     GameEvent(
@@ -247,6 +381,15 @@ class CombatEntity(BaseEntity):
                     )
                 )
 
+    def _state_signature(self) -> tuple:
+        """扩展附着、护盾、机制指标与属性面板签名。"""
+        return super()._state_signature() + (
+            self.aura.state_signature(),
+            len(self.shield_effects),
+            self.custom_metrics,
+            self.attribute_data,
+        )
+
     def export_state(self) -> dict[str, Any]:
         """导出战斗状态快照。"""
         base = super().export_state()
@@ -277,8 +420,9 @@ class CombatEntity(BaseEntity):
         from core.event import GameEvent, EventType
         from core.tool import get_current_time
 
-        if effect not in self.active_effects:
-            self.active_effects.append(effect)
+        if self.active_effects.add(effect):
+            if not getattr(effect, "_scheduled", False) and hasattr(effect, "on_frame_update"):
+                self._ticking_effects.append(effect)
             if self.event_engine:
                 self.event_engine.publish(
                     GameEvent(
@@ -294,8 +438,9 @@ class CombatEntity(BaseEntity):
         from core.event import GameEvent, EventType
         from core.tool import get_current_time
 
-        if effect in self.active_effects:
-            self.active_effects.remove(effect)
+        if self.active_effects.remove(effect):
+            if effect in self._ticking_effects:
+                self._ticking_effects.remove(effect)
             if self.event_engine:
                 self.event_engine.publish(
                     GameEvent(
@@ -316,10 +461,7 @@ class CombatEntity(BaseEntity):
         Returns:
             效果实例，如果不存在则返回 None
         """
-        for effect in self.active_effects:
-            if effect.name == name:
-                return effect
-        return None
+        return self.active_effects.get(name)
 
     def has_effect(self, name: str) -> bool:
         """
@@ -331,10 +473,7 @@ class CombatEntity(BaseEntity):
         Returns:
             是否存在该效果
         """
-        for effect in self.active_effects:
-            if effect.name == name:
-                return True
-        return False
+        return self.active_effects.has(name)
 
     def get_effects_by_prefix(self, prefix: str) -> list[Any]:
         """
@@ -346,7 +485,7 @@ class CombatEntity(BaseEntity):
         Returns:
             匹配的效果列表
         """
-        return [e for e in self.active_effects if e.name.startswith(prefix)]
+        return self.active_effects.with_prefix(prefix)
 
     def apply_elemental_aura(self, damage: Any) -> list[Any]:
         """接收元素附着的统一入口，包含 ICD 判定逻辑。"""
@@ -393,11 +532,52 @@ class CombatEntity(BaseEntity):
     def _perform_tick(self) -> None:
         """驱动战斗实体的每帧逻辑。"""
         self.aura.update(self, 1 / 60)
+        self._effect_ticks += 1
+        self._effect_tick_frame = self.ctx.current_frame if self.ctx else -1
+
+        if not self._due_effects:
+            for eff in self._ticking_effects[:]:
+                eff.on_frame_update(self)
+            return
 
+        # 有被动效果到期：按挂载顺序与逐帧效果交错处理，保持原有的移除时序
+        due = self._due_effects
+        self._due_effects = []
         for eff in self.active_effects[:]:
-            if hasattr(eff, "on_frame_update"):
+            if eff in due:
+                if not eff.is_active:
+                    continue
+                if eff.duration <= 0:
+                    eff.remove()
+                elif eff._expiry is None:
+                    eff._schedule_expiry()
+            elif eff in self._ticking_effects:
                 eff.on_frame_update(self)
 
+    def next_wakeup(self, frame: int) -> float:
+        """[快进协议] 在生命周期之外，汇总附着与效果的唤醒帧。"""
+        wake = super().next_wakeup(frame)
+        if self.state != EntityState.ACTIVE:
+            return wake
+
+        wake = min(wake, self.aura.next_wakeup(frame))
+        # 被动效果的到期帧已登记在上下文时间轮中
+        for eff in self._ticking_effects:
+            if wake <= frame + 1:
+                break
+            wake = min(wake, get_next_wakeup(eff, frame, "on_frame_update", "on_tick"))
+        return wake
+
+    def fast_forward(self, frames: int) -> None:
+        """[快进协议] 推进附着衰减与效果持续时间。"""
+        if self.state != EntityState.ACTIVE:
+            return
+        super().fast_forward(frames)
+        self.aura.fast_forward(self, frames)
+        self._effect_ticks += frames
+        for eff in self._ticking_effects[:]:
+            eff.fast_forward(frames)
+
     def finish(self) -> None:
         """战斗实体销毁流程：先结清状态，再执行基类销毁。"""
         if self.state not in [EntityState.ACTIVE, EntityState.FINISHING]:
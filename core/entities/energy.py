@@ -35,6 +35,13 @@ class EnergyDropsObject(BaseEntity):
     def on_frame_update(self) -> None:
         pass
 
+    def next_wakeup(self, frame: int) -> float:
+        """能量实体不参与逐帧驱动，无需唤醒。"""
+        return float("inf")
+
+    def fast_forward(self, frames: int) -> None:
+        pass
+
     def on_finish(self) -> None:
         get_emulation_logger().log_info(
             f"{self.character.name}的 {self.name}x{self.count} 存活时间结束",
@@ -8,7 +8,6 @@
 """
 
 from __future__ import annotations
-import random
 from typing import Any
 
 from core.entities.base_entity import CombatEntity, Faction, EntityState
@@ -16,7 +15,8 @@ from core.entities.elemental_entities import DendroCoreEntity
 from core.event import GameEvent, EventType
 from core.mechanics.aura import Element
 from core.systems.contract.reaction import ElementalReactionType
-from core.tool import get_current_time
+from core.rng import TARGETING_STREAM
+from core.tool import get_current_time, get_rng
 
 
 class ProsperousCoreEntity(DendroCoreEntity):
@@ -151,6 +151,31 @@ class ThunderCloudEntity(CombatEntity):
         # 尝试跟随角色移动
         self._try_move_towards_creator()
 
+    def next_wakeup(self, frame: int) -> float:
+        """[快进协议] 按攻击计时累积至阈值的帧唤醒 (逐帧累加以复现浮点误差)。"""
+        wake = super().next_wakeup(frame)
+        if not self.is_active:
+            return wake
+
+        threshold = self.attack_interval if self.has_initial_attacked else self.initial_delay
+        timer = self.attack_timer
+        steps = 0
+        while frame + steps < wake:
+            steps += 1
+            timer += 1 / 60
+            if timer >= threshold:
+                break
+        return min(wake, frame + steps)
+
+    def fast_forward(self, frames: int) -> None:
+        """[快进协议] 逐帧重放攻击计时与平滑移动。"""
+        if not self.is_active:
+            return
+        super().fast_forward(frames)
+        for _ in range(frames):
+            self.attack_timer += 1 / 60
+            self._try_move_towards_creator()
+
     def _try_move_towards_creator(self) -> None:
         """尝试向创建者方向移动。"""
         if not self.creator:
@@ -315,6 +340,29 @@ class LunarCageEntity(CombatEntity):
         if self.time_since_last_attack >= 9.0:
             self.finish()
 
+    def next_wakeup(self, frame: int) -> float:
+        """[快进协议] 按无攻击计时累积至超时阈值的帧唤醒。"""
+        wake = super().next_wakeup(frame)
+        if not self.is_active:
+            return wake
+
+        elapsed = self.time_since_last_attack
+        steps = 0
+        while frame + steps < wake:
+            steps += 1
+            elapsed += 1 / 60
+            if elapsed >= 9.0:
+                break
+        return min(wake, frame + steps)
+
+    def fast_forward(self, frames: int) -> None:
+        """[快进协议] 逐帧重放无攻击计时。"""
+        if not self.is_active:
+            return
+        super().fast_forward(frames)
+        for _ in range(frames):
+            self.time_since_last_attack += 1 / 60
+
     @classmethod
     def count_nearby_cages(cls, pos: tuple[float, float, float], radius: float = 12.0) -> int:
         """计算指定位置附近的月笼数量。"""
@@ -350,7 +398,7 @@ class LunarCageEntity(CombatEntity):
             return
 
         # 随机选择 3 枚月笼进行攻击
-        attacking_cages = random.sample(
+        attacking_cages = get_rng(TARGETING_STREAM).sample(
             cls.active_cages,
             min(3, len(cls.active_cages))
         )
@@ -200,6 +200,14 @@ class SceneEntity(BaseEntity):
         """计算指定类型的活跃场景实体数量。"""
         return len(cls.active_scenes.get(scene_type, []))
 
+    def _state_signature(self) -> tuple:
+        """扩展检测范围与计时器签名。"""
+        return super()._state_signature() + (
+            self.detection_radius,
+            len(self._entities_in_range),
+            self.tick_timer,
+        )
+
     def export_state(self) -> dict[str, Any]:
         """导出状态快照。"""
         base = super().export_state()
@@ -81,7 +81,7 @@ class EventType(Enum):
 # --------------------------
 # 核心事件类
 # --------------------------
-@dataclass
+@dataclass(slots=True)
 class GameEvent:
     """
     通用游戏事件。
@@ -102,6 +102,68 @@ class GameEvent:
         self.cancelled = True
 
 
+class EventPool:
+    """
+    单一事件类型的 GameEvent 对象池。
+
+    用于 FRAME_END、BEFORE_CALCULATE 等高频事件：发布前取出实例、发布后归还，
+    嵌套发布会取得不同实例。仅适用于处理程序不持有事件对象本身的事件类型；
+    被帧缓冲区捕获的事件 (payload 引用 event.data) 须每次传入新的 data 字典。
+
+    池为进程级共享，批量服务可能在多个线程中同时运行模拟器：
+    取出与归还只依赖 list.pop / list.append 的原子性，不做先判空后取出的检查。
+    """
+
+    __slots__ = ("event_type", "_free")
+
+    def __init__(self, event_type: EventType):
+        self.event_type = event_type
+        self._free: list[GameEvent] = []
+
+    def acquire(self, frame: int, source: Any = None, data: dict[str, Any] | None = None) -> GameEvent:
+        """取出一个已重置的事件实例。data 为空时使用归还时换上的空字典。"""
+        try:
+            event = self._free.pop()
+        except IndexError:
+            return GameEvent(self.event_type, frame, source, data=data if data is not None else {})
+        event.frame = frame
+        event.source = source
+        event.cancelled = False
+        event.propagation_stopped = False
+        if data is not None:
+            event.data = data
+        return event
+
+    def release(self, event: GameEvent) -> None:
+        """归还事件实例，并解除对 source 与 data 的引用。
+
+        data 换为新的空字典而非原地清空：调用方传入的字典可能仍被帧缓冲区引用。
+        """
+        event.source = None
+        event.data = {}
+        self._free.append(event)
+
+    def publish(self, engine: Any, frame: int, source: Any = None, data: dict[str, Any] | None = None) -> None:
+        """取出实例、经由 engine 发布并归还。"""
+        event = self.acquire(frame, source, data)
+        try:
+            engine.publish(event)
+        finally:
+            self.release(event)
+
+
+_EVENT_POOLS: dict[EventType, EventPool] = {}
+
+
+def get_event_pool(event_type: EventType) -> EventPool:
+    """获取 (必要时创建) 指定事件类型的进程级对象池。"""
+    pool = _EVENT_POOLS.get(event_type)
+    if pool is None:
+        # setdefault 保证并发首次获取时各线程拿到同一个池
+        pool = _EVENT_POOLS.setdefault(event_type, EventPool(event_type))
+    return pool
+
+
 # --------------------------
 # 代理与接口
 # --------------------------
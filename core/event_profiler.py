@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from time import perf_counter_ns
+from typing import Any
+
+# 延迟直方图桶数：第 i 桶统计 [2^(i-1), 2^i) 微秒，末桶收纳更长耗时
+HISTOGRAM_BUCKETS = 16
+
+
+@dataclass(slots=True)
+class HandlerStats:
+    """单个 (事件类型, 处理程序) 的统计。"""
+
+    calls: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+    cancellations: int = 0  # 该处理程序将事件标记为取消的次数
+    histogram: list[int] = field(default_factory=lambda: [0] * HISTOGRAM_BUCKETS)
+
+    def add(self, elapsed_ns: int, cancelled: bool) -> None:
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        if cancelled:
+            self.cancellations += 1
+        self.histogram[min((elapsed_ns // 1000).bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+
+def handler_label(handle: Any) -> str:
+    """处理程序的可读标签：绑定方法取所属类名，普通函数/闭包取限定名。"""
+    owner = getattr(handle, "__self__", None)
+    if owner is not None:
+        return type(owner).__qualname__
+    return getattr(handle, "__qualname__", type(handle).__qualname__)
+
+
+class EventProfiler:
+    """
+    事件总线剖析器 (EventEngine 可选模式)。
+
+    按事件类型记录发布次数，按 (事件类型, 处理程序) 记录调用次数、
+    总耗时/最大耗时、取消次数及延迟直方图。耗时为包含嵌套发布在内的墙钟时间。
+    同类处理程序的多个实例合并统计。
+    """
+
+    def __init__(self) -> None:
+        self.event_counts: dict[str, int] = {}
+        self.handlers: dict[tuple[str, str], HandlerStats] = {}
+        self._labels: dict[Any, str] = {}
+
+    def dispatch(self, event: Any, handles: tuple[Any, ...]) -> bool:
+        """计时分发事件，返回事件是否已被取消。"""
+        type_name = event.event_type.name
+        self.event_counts[type_name] = self.event_counts.get(type_name, 0) + 1
+        for handle in handles:
+            if event.cancelled:
+                return True
+            start = perf_counter_ns()
+            handle(event)
+            elapsed = perf_counter_ns() - start
+            self._stats(type_name, handle).add(elapsed, event.cancelled)
+        return event.cancelled
+
+    def _stats(self, type_name: str, handle: Any) -> HandlerStats:
+        # 以所属类 (或函数本身) 作为缓存键：处理程序实例未必可哈希
+        owner = getattr(handle, "__self__", None)
+        cache_key = type(owner) if owner is not None else handle
+        label = self._labels.get(cache_key)
+        if label is None:
+            label = self._labels[cache_key] = handler_label(handle)
+        key = (type_name, label)
+        stats = self.handlers.get(key)
+        if stats is None:
+            stats = self.handlers[key] = HandlerStats()
+        return stats
+
+    def ranked(self) -> list[tuple[str, str, HandlerStats]]:
+        """按总耗时降序排列的 (事件类型, 处理程序, 统计)。"""
+        return sorted(
+            ((etype, label, stats) for (etype, label), stats in self.handlers.items()),
+            key=lambda item: item[2].total_ns,
+            reverse=True,
+        )
+
+    def report(self, top: int = 20) -> str:
+        """生成热点处理程序排行文本。"""
+        lines = [
+            f"事件总线剖析: {sum(self.event_counts.values())} 次发布, {len(self.handlers)} 个处理程序",
+            f"{'事件类型':<28}{'处理程序':<40}{'调用':>9}{'总耗时ms':>11}{'均值us':>9}{'最大us':>9}{'取消':>6}",
+        ]
+        for etype, label, stats in self.ranked()[:top]:
+            lines.append(
+                f"{etype:<28}{label[:39]:<40}{stats.calls:>9}{stats.total_ns / 1e6:>11.2f}"
+                f"{stats.total_ns / stats.calls / 1e3:>9.1f}{stats.max_ns / 1e3:>9.1f}{stats.cancellations:>6}"
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "event_counts": dict(sorted(self.event_counts.items(), key=lambda kv: kv[1], reverse=True)),
+            "handlers": [
+                {
+                    "event_type": etype,
+                    "handler": label,
+                    "calls": stats.calls,
+                    "total_ms": stats.total_ns / 1e6,
+                    "max_us": stats.max_ns / 1e3,
+                    "cancellations": stats.cancellations,
+                    # 键为桶上界 (微秒)
+                    "histogram_us": {str(1 << i): n for i, n in enumerate(stats.histogram) if n},
+                }
+                for etype, label, stats in self.ranked()
+            ],
+        }
+
+    def export_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
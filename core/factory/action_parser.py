@@ -1,5 +1,6 @@
 from typing import Any
 from core.action.action_data import ActionCommand
+from core.action.action_timeline import ActionTimeline, RepeatBlock, TimelineNode
 
 
 class ActionParser:
@@ -19,46 +20,136 @@ class ActionParser:
     }
 
     def parse_sequence(
-        self, sequence_config: list[dict[str, Any]]
-    ) -> list[ActionCommand]:
+        self,
+        sequence_config: list[dict[str, Any]],
+        subsequences: dict[str, list[dict[str, Any]]] | None = None,
+    ) -> ActionTimeline:
         """
         解析动作序列配置。
-        返回格式: List[ActionCommand]
-        支持指令展开：如 normal_attack 带 count 参数会展开为多条。
+        返回格式: ActionTimeline (按下标访问与展开后的 List[ActionCommand] 一致)
+
+        [V3.3] 序列被编译为紧凑的指令树，同一条配置只生成一个指令对象：
+        - 动作条目: {"character_name", "action_key", "params"}，
+          normal_attack 带 count 参数时编译为单段普攻的重复块；
+        - 重复块: {"repeat": N, "sequence": [...]}；
+        - 子序列定义: {"define": 名称, "sequence": [...]}，不产生指令，
+          也可通过 subsequences 参数传入；名称在整个序列内全局唯一；
+        - 子序列调用: {"call": 名称, "repeat": N (可选)}，各次调用共享编译结果。
+
+        Raises:
+            ValueError: 调用未定义的子序列、子序列重复定义、子序列循环引用或重复次数非法。
         """
-        parsed_actions = []
-        for action_entry in sequence_config:
-            char_name = action_entry["character_name"]
-            raw_action = action_entry["action_key"]
-
-            # 兼容逻辑
-            method_name = self.ACTION_NAME_MAP.get(raw_action, raw_action)
-            params = action_entry.get("params", {})
-
-            # 指令展开逻辑：仅针对普通攻击处理 count 参数
-            if method_name == "normal_attack" and "count" in params:
-                try:
-                    count = int(params["count"])
-                    # 将一条 count 指令拆分为多条单段指令
-                    for _ in range(count):
-                        # 构造单段指令，移除 count 防止子层混淆
-                        single_params = params.copy()
-                        single_params.pop("count", None)
-
-                        cmd = ActionCommand(
-                            character_name=char_name,
-                            action_type=method_name,
-                            params=single_params,
-                        )
-                        parsed_actions.append(cmd)
-                    continue  # 已处理展开，跳过原始追加
-                except (ValueError, TypeError):
-                    pass  # 非法 count 退回到普通处理
-
-            # 普通处理
-            cmd = ActionCommand(
-                character_name=char_name, action_type=method_name, params=params
-            )
-            parsed_actions.append(cmd)
-
-        return parsed_actions
+        definitions = dict(subsequences or {})
+        compiled: dict[str, RepeatBlock] = {}
+        body = self._compile_entries(sequence_config, definitions, compiled, ())
+        return ActionTimeline(RepeatBlock(body))
+
+    def _compile_entries(
+        self,
+        entries: list[dict[str, Any]],
+        definitions: dict[str, list[dict[str, Any]]],
+        compiled: dict[str, RepeatBlock],
+        calling: tuple[str, ...],
+    ) -> list[TimelineNode]:
+        # 先登记本层的子序列定义，允许先调用后定义。
+        # 编译结果按名称缓存，因此不允许在其他层级以同名重新定义
+        for entry in entries:
+            if "define" in entry:
+                name = entry["define"]
+                sequence = entry.get("sequence", [])
+                if definitions.get(name, sequence) is not sequence:
+                    raise ValueError(f"子序列重复定义: {name}")
+                definitions[name] = sequence
+
+        nodes: list[TimelineNode] = []
+        for entry in entries:
+            if "define" in entry:
+                continue
+
+            if "call" in entry:
+                block = self._compile_call(entry["call"], definitions, compiled, calling)
+                self._append(nodes, block, self._repeat_times(entry))
+            elif "sequence" in entry:
+                body = self._compile_entries(entry["sequence"], definitions, compiled, calling)
+                self._append(nodes, RepeatBlock(body), self._repeat_times(entry))
+            else:
+                self._compile_action(entry, nodes)
+        return nodes
+
+    def _compile_call(
+        self,
+        name: str,
+        definitions: dict[str, list[dict[str, Any]]],
+        compiled: dict[str, RepeatBlock],
+        calling: tuple[str, ...],
+    ) -> RepeatBlock:
+        block = compiled.get(name)
+        if block is not None:
+            return block
+        if name in calling:
+            raise ValueError(f"子序列循环引用: {' -> '.join(calling + (name,))}")
+        if name not in definitions:
+            raise ValueError(f"未定义的子序列: {name}")
+
+        body = self._compile_entries(definitions[name], definitions, compiled, calling + (name,))
+        block = compiled[name] = RepeatBlock(body)
+        return block
+
+    def _compile_action(self, action_entry: dict[str, Any], nodes: list[TimelineNode]) -> None:
+        char_name = action_entry["character_name"]
+        raw_action = action_entry["action_key"]
+
+        # 兼容逻辑
+        method_name = self.ACTION_NAME_MAP.get(raw_action, raw_action)
+        params = action_entry.get("params", {})
+
+        # 指令展开逻辑：仅针对普通攻击处理 count 参数
+        if method_name == "normal_attack" and "count" in params:
+            try:
+                count = int(params["count"])
+            except (ValueError, TypeError):
+                pass  # 非法 count 退回到普通处理
+            else:
+                # 构造单段指令并重复 count 次，移除 count 防止子层混淆
+                single_params = params.copy()
+                single_params.pop("count", None)
+                cmd = ActionCommand(
+                    character_name=char_name,
+                    action_type=method_name,
+                    params=single_params,
+                )
+                self._append(nodes, cmd, count)
+                return
+
+        # 普通处理
+        nodes.append(
+            ActionCommand(character_name=char_name, action_type=method_name, params=params)
+        )
+
+    @staticmethod
+    def _repeat_times(entry: dict[str, Any]) -> int:
+        try:
+            times = int(entry.get("repeat", 1))
+        except (ValueError, TypeError):
+            raise ValueError(f"非法的重复次数: {entry.get('repeat')!r}") from None
+        if times < 0:
+            raise ValueError(f"非法的重复次数: {times}")
+        return times
+
+    @staticmethod
+    def _append(nodes: list[TimelineNode], node: TimelineNode, times: int) -> None:
+        """追加 times 次 node；单次直接内联，空块省略。"""
+        if times <= 0:
+            return
+        if isinstance(node, RepeatBlock):
+            if node.length == 0:
+                return
+            if times == 1 and len(node.body) == 1:
+                node = node.body[0]
+            elif times == 1:
+                nodes.extend(node.body)
+                return
+        if times == 1:
+            nodes.append(node)
+        else:
+            nodes.append(RepeatBlock((node,), times))
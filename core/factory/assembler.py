@@ -1,10 +1,12 @@
 from __future__ import annotations
 from typing import Any
 
+from core.config import Config
 from core.context import create_context
 from core.factory.team_factory import TeamFactory
 from core.target import Target
 from core.simulator import Simulator
+from core.skills.base import warm_up_action_templates
 from core.factory.action_parser import ActionParser
 from core.data.repository import DataRepository
 from core.systems.rule_system import RuleSystem
@@ -27,7 +29,9 @@ class SimulationAssembler:
         从配置包组装仿真实例。
 
         Args:
-            config: 包含 context_config 和 sequence_config 的字典。
+            config: 包含 context_config 和 sequence_config 的字典，
+                可选的 rng_seed 用于固定随机数源；可选的 fast_forward
+                开启空闲帧快进，缺省时取全局配置 emulation.fast_forward。
             persistence_db: 可选的持久化数据库接口。
 
         Returns:
@@ -37,7 +41,7 @@ class SimulationAssembler:
                   需要在异步环境中调用 persistence_db.record_static_modifiers()。
         """
         # 1. 初始化上下文环境 (自动激活系统与物理空间)
-        ctx = create_context()
+        ctx = create_context(seed=config.get("rng_seed"))
         assert ctx.space is not None  # create_context() 保证 space 已初始化
 
         # 2. 组装队伍
@@ -47,6 +51,8 @@ class SimulationAssembler:
         # 2.1 创建角色对象
         team = self.team_factory.create_team(team_list_cfg)
         team.ctx = ctx  # 显式关联 Context 以便发布事件
+        # 预编译动作模板 (进程内仅首次组装时真正编译)
+        warm_up_action_templates(team.get_members())
 
         # 将 Team 注入 CombatSpace，开启物理同步与事件监听
         ctx.space.set_team(team)
@@ -76,7 +82,10 @@ class SimulationAssembler:
         action_sequence = parser.parse_sequence(sequence_cfg)
 
         # 6. 构建模拟器 (注入持久化接口)
-        simulator = Simulator(ctx, action_sequence, persistence_db=persistence_db)
+        fast_forward = config.get("fast_forward", Config.get("emulation.fast_forward", False))
+        simulator = Simulator(
+            ctx, action_sequence, persistence_db=persistence_db, fast_forward=bool(fast_forward)
+        )
 
         # 7. 收集静态修饰符数据 (用于后续异步持久化)
         static_modifiers_data: list[dict[str, Any]] = []
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
 from enum import Enum
 from typing import Any
 
@@ -25,22 +26,137 @@ class Element(Enum):
     QUICKEN = "激"
     NONE = "无"
 
+    # 稠密下标，模块加载时按定义顺序分配，供反应查表使用
+    ordinal: int
+
+
+# ---------------------------------------------------------------------------
+# [V3.3] 反应查表：导入时预计算，覆盖全部 (攻击元素, 附着元素) 组合，
+# apply_element 热路径只做字典取值。
+# ---------------------------------------------------------------------------
+
+# 为每个元素分配稠密下标 (Enum 的 __hash__ 为 Python 层实现，按下标取值可绕开哈希)
+for _i, _e in enumerate(Element):
+    _e.ordinal = _i
+
+_ELEMENT_BY_VALUE: dict[str, Element] = {e.value: e for e in Element}
+_INERT_ELEMENTS = frozenset((Element.PHYSICAL, Element.NONE))
+# 扩散 / 结晶：不附着、消耗量按 0.5 系数计算且不扣减攻击元素量
+_SWIRL_CRYSTAL_ELEMENTS = frozenset((Element.ANEMO, Element.GEO))
+_IS_INERT: list[bool] = [e in _INERT_ELEMENTS for e in Element]
+_IS_SWIRL_CRYSTAL: list[bool] = [e in _SWIRL_CRYSTAL_ELEMENTS for e in Element]
+
+_REACTION_PAIRS: dict[tuple[Element, Element], ElementalReactionType] = {
+    (Element.HYDRO, Element.PYRO): ElementalReactionType.VAPORIZE,
+    (Element.PYRO, Element.HYDRO): ElementalReactionType.VAPORIZE,
+    (Element.PYRO, Element.CRYO): ElementalReactionType.MELT,
+    (Element.CRYO, Element.PYRO): ElementalReactionType.MELT,
+    (Element.ELECTRO, Element.PYRO): ElementalReactionType.OVERLOAD,
+    (Element.PYRO, Element.ELECTRO): ElementalReactionType.OVERLOAD,
+    (Element.ELECTRO, Element.HYDRO): ElementalReactionType.ELECTRO_CHARGED,
+    (Element.HYDRO, Element.ELECTRO): ElementalReactionType.ELECTRO_CHARGED,
+    (Element.CRYO, Element.ELECTRO): ElementalReactionType.SUPERCONDUCT,
+    (Element.ELECTRO, Element.CRYO): ElementalReactionType.SUPERCONDUCT,
+    (Element.HYDRO, Element.DENDRO): ElementalReactionType.BLOOM,
+    (Element.DENDRO, Element.HYDRO): ElementalReactionType.BLOOM,
+    (Element.ANEMO, Element.PYRO): ElementalReactionType.SWIRL,
+    (Element.ANEMO, Element.HYDRO): ElementalReactionType.SWIRL,
+    (Element.ANEMO, Element.CRYO): ElementalReactionType.SWIRL,
+    (Element.ANEMO, Element.ELECTRO): ElementalReactionType.SWIRL,
+    (Element.GEO, Element.PYRO): ElementalReactionType.CRYSTALLIZE,
+    (Element.GEO, Element.HYDRO): ElementalReactionType.CRYSTALLIZE,
+    (Element.GEO, Element.CRYO): ElementalReactionType.CRYSTALLIZE,
+    (Element.GEO, Element.ELECTRO): ElementalReactionType.CRYSTALLIZE,
+}
+
+_TAX_PAIRS: dict[tuple[Element, Element], float] = {
+    (Element.HYDRO, Element.PYRO): 2.0,
+    (Element.PYRO, Element.HYDRO): 0.5,
+    (Element.PYRO, Element.CRYO): 2.0,
+    (Element.CRYO, Element.PYRO): 0.5,
+    (Element.PYRO, Element.FROZEN): 2.0,
+    (Element.PYRO, Element.QUICKEN): 0.5,
+    (Element.HYDRO, Element.DENDRO): 1.0,
+    (Element.DENDRO, Element.HYDRO): 1.0,
+    (Element.HYDRO, Element.QUICKEN): 1.0,
+    (Element.ELECTRO, Element.PYRO): 1.0,
+    (Element.PYRO, Element.ELECTRO): 1.0,
+    (Element.CRYO, Element.ELECTRO): 1.0,
+    (Element.ELECTRO, Element.CRYO): 1.0,
+    (Element.GEO, Element.FROZEN): 0.5,
+    (Element.ANEMO, Element.FROZEN): 0.5,
+}
+
+_AMP_PAIRS: dict[tuple[Element, Element], float] = {
+    (Element.HYDRO, Element.PYRO): 2.0,
+    (Element.PYRO, Element.HYDRO): 1.5,
+    (Element.PYRO, Element.CRYO): 2.0,
+    (Element.CRYO, Element.PYRO): 1.5,
+}
+
+
+def _derive_tax(attack: Element, target: Element) -> float:
+    if attack in _SWIRL_CRYSTAL_ELEMENTS and target == Element.QUICKEN:
+        return 0.0
+    if (attack, target) in _TAX_PAIRS:
+        return _TAX_PAIRS[(attack, target)]
+    if attack in _SWIRL_CRYSTAL_ELEMENTS:
+        return 0.5
+    return 0.0
+
+
+# 以下稠密表均按 TABLE[攻击元素.ordinal][附着元素.ordinal] 取值
+# 反应类型：未登记的组合按反向组合查找，仍缺省时回落为蒸发 (与历史行为一致)
+REACTION_TABLE: list[list[ElementalReactionType]] = [
+    [_REACTION_PAIRS.get((a, t), _REACTION_PAIRS.get((t, a), ElementalReactionType.VAPORIZE)) for t in Element]
+    for a in Element
+]
+# 元素税：附着元素被消耗量 = 攻击元素量 × 税率，0 表示不发生消耗型反应
+TAX_TABLE: list[list[float]] = [[_derive_tax(a, t) for t in Element] for a in Element]
+# 增幅倍率：冻结按冰元素计
+AMP_MULT_TABLE: list[list[float]] = [
+    [_AMP_PAIRS.get((a, Element.CRYO if t == Element.FROZEN else t), 1.0) for t in Element]
+    for a in Element
+]
+REACTION_CATEGORY: dict[ElementalReactionType, ReactionCategory] = {
+    r: REACTION_CLASSIFICATION.get(r, ReactionCategory.STATUS) for r in ElementalReactionType
+}
+
 
-@dataclass
 class Gauge:
     """
     元素量载体。
     遵循原神"附着论"，管理元素量的衰减与消耗。
+
+    [V3.3] 衰减按闭式惰性计算：仅记录最近一次改写时的元素量与时刻，
+    ``current_gauge`` 在读取时由所属 AuraManager 的时钟推算，无需逐帧扣减。
+    未绑定时钟的独立附着视为时间静止，仍可通过 ``update`` 手动衰减。
     """
 
-    element: Element
-    u_value: float  # 初始元素量 (1U, 2U, 4U)
-    max_gauge: float  # 最大附着量 (通常为 0.8 * u_value)
-    current_gauge: float  # 当前剩余附着量
-    decay_rate: float  # 衰减速率 (每秒扣除量)
-    # 月曜反应：附着来源追踪
-    source_character: Any = None  # 附着来源角色
-    source_time: float = 0.0  # 附着时间戳
+    __slots__ = (
+        "element", "u_value", "max_gauge", "_decay_rate",
+        "source_character", "source_time", "_base", "_t0", "_clock",
+    )
+
+    def __init__(
+        self,
+        element: Element,
+        u_value: float,  # 初始元素量 (1U, 2U, 4U)
+        max_gauge: float,  # 最大附着量 (通常为 0.8 * u_value)
+        current_gauge: float,  # 当前剩余附着量
+        decay_rate: float,  # 衰减速率 (每秒扣除量)
+        source_character: Any = None,  # 月曜反应：附着来源角色
+        source_time: float = 0.0,  # 附着时间戳
+    ) -> None:
+        self.element = element
+        self.u_value = u_value
+        self.max_gauge = max_gauge
+        self._decay_rate = decay_rate
+        self.source_character = source_character
+        self.source_time = source_time
+        self._clock: AuraManager | None = None
+        self._base = current_gauge
+        self._t0 = 0.0
 
     @classmethod
     def create(
@@ -61,17 +177,51 @@ class Gauge:
         decay = max_g / duration
         return cls(element, u_value, max_g, max_g, decay, source_character, source_time)
 
+    def _now(self) -> float:
+        return self._clock.elapsed if self._clock is not None else self._t0
+
+    @property
+    def current_gauge(self) -> float:
+        """当前剩余附着量 (按闭式衰减推算)。"""
+        g = self._base - self._decay_rate * (self._now() - self._t0)
+        return g if g > 0 else 0.0
+
+    @current_gauge.setter
+    def current_gauge(self, value: float) -> None:
+        self._base = value
+        self._t0 = self._now()
+        if self._clock is not None:
+            self._clock._schedule_expiry(self.expires_at)
+
+    @property
+    def decay_rate(self) -> float:
+        """衰减速率 (每秒扣除量)。"""
+        return self._decay_rate
+
+    @decay_rate.setter
+    def decay_rate(self, value: float) -> None:
+        # 先按旧速率结算到当前时刻，再切换速率
+        self.current_gauge = self.current_gauge
+        self._decay_rate = value
+        if self._clock is not None:
+            self._clock._schedule_expiry(self.expires_at)
+
+    @property
+    def expires_at(self) -> float:
+        """按当前速率衰减至 0 的时刻 (所属时钟的秒数)。"""
+        if self._decay_rate <= 0:
+            return float("inf") if self._base > 0 else self._t0
+        return self._t0 + self._base / self._decay_rate
+
     def update(self, dt: float) -> None:
-        """更新衰减逻辑。"""
-        self.current_gauge -= self.decay_rate * dt
-        if self.current_gauge < 0:
-            self.current_gauge = 0.0
+        """立即扣除 dt 秒的衰减量。"""
+        g = self.current_gauge - self._decay_rate * dt
+        self.current_gauge = g if g > 0 else 0.0
 
     def consume(self, amount: float) -> None:
         """消耗元素量。"""
-        self.current_gauge -= amount
-        if self.current_gauge < 0:
-            self.current_gauge = 0.0
+        g = self.current_gauge - amount
+        self.current_gauge = g if g > 0 else 0.0
 
     def to_dict(self) -> dict[str, Any]:
         """序列化输出。"""
@@ -93,8 +243,12 @@ class AuraManager:
 
     def __init__(self) -> None:
         self.auras: list[Gauge] = []
-        self.frozen_gauge: Gauge | None = None
-        self.quicken_gauge: Gauge | None = None
+        self._frozen_gauge: Gauge | None = None
+        self._quicken_gauge: Gauge | None = None
+
+        # 附着时钟 (秒) 与最早的到期时刻，附着在到期时统一清理
+        self.elapsed: float = 0.0
+        self._next_expiry: float = float("inf")
 
         self.is_electro_charged: bool = False
         self.ec_timer: float = 0.0
@@ -107,6 +261,51 @@ class AuraManager:
         # value: 上次触发结晶的时间戳（帧数）
         self._crystallize_cooldowns: dict[Element, int] = {}
 
+    @property
+    def frozen_gauge(self) -> Gauge | None:
+        return self._frozen_gauge
+
+    @frozen_gauge.setter
+    def frozen_gauge(self, gauge: Gauge | None) -> None:
+        self._frozen_gauge = self._track(gauge)
+
+    @property
+    def quicken_gauge(self) -> Gauge | None:
+        return self._quicken_gauge
+
+    @quicken_gauge.setter
+    def quicken_gauge(self, gauge: Gauge | None) -> None:
+        self._quicken_gauge = self._track(gauge)
+
+    def _track(self, gauge: Gauge | None) -> Gauge | None:
+        """将附着绑定到本管理器的时钟，从当前时刻开始衰减。"""
+        if gauge is not None and gauge._clock is not self:
+            gauge._clock = self
+            gauge.current_gauge = gauge._base
+        return gauge
+
+    def _schedule_expiry(self, at: float) -> None:
+        if at < self._next_expiry:
+            self._next_expiry = at
+
+    def _purge_expired(self) -> None:
+        """移除已衰减至 0 的附着，并重新计算最早到期时刻。"""
+        nxt = float("inf")
+        for a in self.auras[:]:
+            if a.current_gauge <= 0:
+                self.auras.remove(a)
+            elif a.expires_at < nxt:
+                nxt = a.expires_at
+        for name in ("_frozen_gauge", "_quicken_gauge"):
+            g = getattr(self, name)
+            if g is None:
+                continue
+            if g.current_gauge <= 0:
+                setattr(self, name, None)
+            elif g.expires_at < nxt:
+                nxt = g.expires_at
+        self._next_expiry = nxt
+
     def export_state(self) -> dict[str, Any]:
         """导出当前实体的所有附着状态快照。"""
         res: dict[str, Any] = {
@@ -121,22 +320,21 @@ class AuraManager:
             res["states"].append("燃烧")
         return res
 
-    def update(self, owner: Any, dt: float = 1 / 60) -> None:
-        """每帧驱动附着衰减与周期性反应。"""
-        for a in self.auras[:]:
-            a.update(dt)
-            if a.current_gauge <= 0:
-                self.auras.remove(a)
-
-        if self.frozen_gauge:
-            self.frozen_gauge.update(dt)
-            if self.frozen_gauge.current_gauge <= 0:
-                self.frozen_gauge = None
+    def state_signature(self) -> tuple:
+        """返回附着状态的轻量签名，用于增量快照的变更检测。"""
+        return (
+            tuple((a.element, a.current_gauge, a.max_gauge) for a in self.auras),
+            (self.frozen_gauge.current_gauge, self.frozen_gauge.max_gauge) if self.frozen_gauge else None,
+            (self.quicken_gauge.current_gauge, self.quicken_gauge.max_gauge) if self.quicken_gauge else None,
+            self.is_electro_charged,
+            self.is_burning,
+        )
 
-        if self.quicken_gauge:
-            self.quicken_gauge.update(dt)
-            if self.quicken_gauge.current_gauge <= 0:
-                self.quicken_gauge = None
+    def update(self, owner: Any, dt: float = 1 / 60) -> None:
+        """每帧推进附着时钟，清理到期附着并驱动周期性反应。"""
+        self.elapsed += dt
+        if self.elapsed >= self._next_expiry:
+            self._purge_expired()
 
         if self.is_electro_charged:
             self.ec_timer += dt
@@ -152,6 +350,33 @@ class AuraManager:
             else:
                 self._apply_burning_tick(owner, dt, is_damage_frame=False)
 
+    def next_wakeup(self, frame: int, dt: float = 1 / 60) -> float:
+        """[快进协议] 燃烧逐帧消耗草元素需逐帧驱动；感电在下一次跳电帧唤醒；纯衰减无需唤醒。"""
+        if self.is_burning:
+            return frame + 1
+        if self.is_electro_charged:
+            # 按逐帧累加的方式预算跳电帧，保证与逐帧驱动的计时一致
+            timer, n = self.ec_timer, 0
+            while timer < 1.0:
+                timer += dt
+                n += 1
+            return frame + n
+        return float("inf")
+
+    def fast_forward(self, owner: Any, frames: int, dt: float = 1 / 60) -> None:
+        """[快进协议] 推进附着时钟 (逐帧累加以保证与逐帧驱动一致)，到期附着在末尾统一清理。"""
+        if self.is_burning:
+            for _ in range(frames):
+                self.update(owner, dt)
+            return
+        for _ in range(frames):
+            self.elapsed += dt
+        if self.is_electro_charged:
+            for _ in range(frames):
+                self.ec_timer += dt
+        if self.elapsed >= self._next_expiry:
+            self._purge_expired()
+
     def apply_element(
         self,
         element: Any,
@@ -166,13 +391,15 @@ class AuraManager:
             attack_u: 攻击元素量
             source_character: 附着来源角色（用于月曜反应追踪）
         """
-        if not isinstance(element, Element):
-            attack_element = Element(element)
-        else:
+        if isinstance(element, Element):
             attack_element = element
+        else:
+            attack_element = _ELEMENT_BY_VALUE.get(element) or Element(element)
 
-        if attack_element in [Element.PHYSICAL, Element.NONE] or attack_u <= 0:
+        atk = attack_element.ordinal
+        if _IS_INERT[atk] or attack_u <= 0:
             return []
+        is_swirl_crystal = _IS_SWIRL_CRYSTAL[atk]
 
         results: list[ReactionResult] = []
         rem_u = attack_u
@@ -180,17 +407,17 @@ class AuraManager:
 
         # 1. 特殊状态判定
         if self.frozen_gauge:
-            tax = self._get_tax(attack_element, Element.FROZEN)
+            tax = TAX_TABLE[atk][Element.FROZEN.ordinal]
             if tax > 0:
                 prevent_attachment = True
                 consume = min(self.frozen_gauge.current_gauge, rem_u * tax)
                 self.frozen_gauge.consume(consume)
-                if attack_element not in [Element.ANEMO, Element.GEO]:
+                if not is_swirl_crystal:
                     rem_u -= consume / tax
                 r_type = (
                     ElementalReactionType.SHATTER
                     if attack_element == Element.GEO
-                    else self._map_reaction(attack_element, Element.CRYO)
+                    else REACTION_TABLE[atk][Element.CRYO.ordinal]
                 )
                 results.append(
                     self._create_result(r_type, attack_element, Element.FROZEN, consume)
@@ -212,12 +439,12 @@ class AuraManager:
                     )
                 )
             else:
-                tax = self._get_tax(attack_element, Element.QUICKEN)
+                tax = TAX_TABLE[atk][Element.QUICKEN.ordinal]
                 if tax > 0:
                     prevent_attachment = True
                     consume = min(self.quicken_gauge.current_gauge, rem_u * tax)
                     self.quicken_gauge.consume(consume)
-                    if attack_element not in [Element.ANEMO, Element.GEO]:
+                    if not is_swirl_crystal:
                         rem_u -= consume / tax
                     r_type = (
                         ElementalReactionType.BLOOM
@@ -233,7 +460,7 @@ class AuraManager:
                         self.quicken_gauge = None
 
         # 2. 状态转换
-        if attack_element not in [Element.ANEMO, Element.GEO]:
+        if not is_swirl_crystal:
             if self._check_combo(attack_element, Element.HYDRO, Element.CRYO):
                 prevent_attachment = True
                 target_el = (
@@ -289,14 +516,14 @@ class AuraManager:
                             )
                         )
                     continue
-                tax = self._get_tax(attack_element, aura.element)
+                tax = TAX_TABLE[atk][aura.element.ordinal]
                 if tax > 0:
                     prevent_attachment = True
                     consume = min(aura.current_gauge, rem_u * tax)
                     aura.consume(consume)
-                    if attack_element not in [Element.ANEMO, Element.GEO]:
+                    if not is_swirl_crystal:
                         rem_u -= consume / tax
-                    r_type = self._map_reaction(attack_element, aura.element)
+                    r_type = REACTION_TABLE[atk][aura.element.ordinal]
 
                     # 结晶反应冷却检查
                     # 火水雷冰结晶共享 1 秒冷却，但月结晶无冷却
@@ -322,7 +549,7 @@ class AuraManager:
         ):
             self.is_burning = True
 
-        if attack_element in [Element.ANEMO, Element.GEO]:
+        if is_swirl_crystal:
             return results
         if rem_u > 0.001 and not prevent_attachment:
             self._attach(attack_element, rem_u, source_character)
@@ -344,10 +571,10 @@ class AuraManager:
         consume: float = 0.0,
         is_cooldown_skipped: bool = False,
     ) -> ReactionResult:
-        category = REACTION_CLASSIFICATION.get(r_type, ReactionCategory.STATUS)
+        category = REACTION_CATEGORY[r_type]
         mult = (
-            self._get_mult(source, target)
-            if category == ReactionCategory.AMPLIFYING
+            AMP_MULT_TABLE[source.ordinal][target.ordinal]
+            if category is ReactionCategory.AMPLIFYING
             else 1.0
         )
         return ReactionResult(
@@ -361,57 +588,10 @@ class AuraManager:
         )
 
     def _map_reaction(self, atk: Element, target: Element) -> ElementalReactionType:
-        table = {
-            (Element.HYDRO, Element.PYRO): ElementalReactionType.VAPORIZE,
-            (Element.PYRO, Element.HYDRO): ElementalReactionType.VAPORIZE,
-            (Element.PYRO, Element.CRYO): ElementalReactionType.MELT,
-            (Element.CRYO, Element.PYRO): ElementalReactionType.MELT,
-            (Element.ELECTRO, Element.PYRO): ElementalReactionType.OVERLOAD,
-            (Element.PYRO, Element.ELECTRO): ElementalReactionType.OVERLOAD,
-            (Element.ELECTRO, Element.HYDRO): ElementalReactionType.ELECTRO_CHARGED,
-            (Element.HYDRO, Element.ELECTRO): ElementalReactionType.ELECTRO_CHARGED,
-            (Element.CRYO, Element.ELECTRO): ElementalReactionType.SUPERCONDUCT,
-            (Element.ELECTRO, Element.CRYO): ElementalReactionType.SUPERCONDUCT,
-            (Element.HYDRO, Element.DENDRO): ElementalReactionType.BLOOM,
-            (Element.DENDRO, Element.HYDRO): ElementalReactionType.BLOOM,
-            (Element.ANEMO, Element.PYRO): ElementalReactionType.SWIRL,
-            (Element.ANEMO, Element.HYDRO): ElementalReactionType.SWIRL,
-            (Element.ANEMO, Element.CRYO): ElementalReactionType.SWIRL,
-            (Element.ANEMO, Element.ELECTRO): ElementalReactionType.SWIRL,
-            (Element.GEO, Element.PYRO): ElementalReactionType.CRYSTALLIZE,
-            (Element.GEO, Element.HYDRO): ElementalReactionType.CRYSTALLIZE,
-            (Element.GEO, Element.CRYO): ElementalReactionType.CRYSTALLIZE,
-            (Element.GEO, Element.ELECTRO): ElementalReactionType.CRYSTALLIZE,
-        }
-        return table.get(
-            (atk, target), table.get((target, atk), ElementalReactionType.VAPORIZE)
-        )
+        return REACTION_TABLE[atk.ordinal][target.ordinal]
 
     def _get_tax(self, attack: Element, target: Element) -> float:
-        if attack in [Element.ANEMO, Element.GEO] and target == Element.QUICKEN:
-            return 0.0
-        table = {
-            (Element.HYDRO, Element.PYRO): 2.0,
-            (Element.PYRO, Element.HYDRO): 0.5,
-            (Element.PYRO, Element.CRYO): 2.0,
-            (Element.CRYO, Element.PYRO): 0.5,
-            (Element.PYRO, Element.FROZEN): 2.0,
-            (Element.PYRO, Element.QUICKEN): 0.5,
-            (Element.HYDRO, Element.DENDRO): 1.0,
-            (Element.DENDRO, Element.HYDRO): 1.0,
-            (Element.HYDRO, Element.QUICKEN): 1.0,
-            (Element.ELECTRO, Element.PYRO): 1.0,
-            (Element.PYRO, Element.ELECTRO): 1.0,
-            (Element.CRYO, Element.ELECTRO): 1.0,
-            (Element.ELECTRO, Element.CRYO): 1.0,
-            (Element.GEO, Element.FROZEN): 0.5,
-            (Element.ANEMO, Element.FROZEN): 0.5,
-        }
-        if (attack, target) in table:
-            return table[(attack, target)]
-        if attack in [Element.ANEMO, Element.GEO]:
-            return 0.5
-        return 0.0
+        return TAX_TABLE[attack.ordinal][target.ordinal]
 
     def _apply_ec_tick(self, owner: Any) -> None:
         """驱动感电跳电逻辑。"""
@@ -490,19 +670,11 @@ class AuraManager:
                 existing.source_character = source_character
                 existing.source_time = source_time
         else:
+            self._track(new_a)
             self.auras.append(new_a)
 
     def _get_mult(self, a: Element, b: Element) -> float:
-        target = Element.CRYO if b == Element.FROZEN else b
-        if (a, target) == (Element.HYDRO, Element.PYRO):
-            return 2.0
-        if (a, target) == (Element.PYRO, Element.HYDRO):
-            return 1.5
-        if (a, target) == (Element.PYRO, Element.CRYO):
-            return 2.0
-        if (a, target) == (Element.CRYO, Element.PYRO):
-            return 1.5
-        return 1.0
+        return AMP_MULT_TABLE[a.ordinal][b.ordinal]
 
     def _check_combo(self, atk: Element, el1: Element, el2: Element) -> bool:
         if atk == el1:
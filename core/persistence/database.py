@@ -2,6 +2,9 @@ from __future__ import annotations
 import aiosqlite
 import json
 import asyncio
+import os
+import time
+from collections.abc import Iterable
 from typing import Any, cast
 from enum import Enum
 from dataclasses import is_dataclass, asdict
@@ -26,6 +29,24 @@ class GenshinJSONEncoder(json.JSONEncoder):
         except TypeError:
             return str(o)
 
+def group_statements(commands: Iterable[tuple[str, Any]]) -> list[tuple[str, list[Any]]]:
+    """
+    [V3.3] 将相邻的同构 SQL 指令合并为 (sql, 参数列表)，供 executemany 批量执行。
+
+    仅合并相邻指令而不按语句重排：事件明细以 (SELECT MAX(event_id) ...) 子查询
+    引用最近写入的事件日志，实体脉冲依赖先行的实体登记，执行顺序必须与投影顺序一致。
+    """
+    groups: list[tuple[str, list[Any]]] = []
+    last_sql: str | None = None
+    for sql, params in commands:
+        if sql == last_sql:
+            groups[-1][1].append(params)
+        else:
+            groups.append((sql, [params]))
+            last_sql = sql
+    return groups
+
+
 class ResultDatabase:
     """
     [V3.0 重新设计] 仿真结果持久化引擎。
@@ -33,13 +54,21 @@ class ResultDatabase:
     核心投影逻辑已剥离至 DataProjector。
     """
 
-    def __init__(self, db_path: str = "simulation_audit.db"):
+    # [V3.3] 写事务提交阈值：累计行数或距上次提交的秒数，先到者触发
+    COMMIT_ROWS = 5000
+    COMMIT_INTERVAL = 0.5
+
+    def __init__(self, db_path: str = "simulation_audit.db", audit_level: str = "full"):
         self.db_path = db_path
+        # 伤害审计级别 (full / summary)，由 Simulator 同步至仿真上下文
+        self.audit_level = audit_level
         self._queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
         self._worker_task: asyncio.Task[None] | None = None
         self._running = False
         self.session_id: int | None = None
         self.projector: Any | None = None # 延迟初始化
+        self.rng_seed: int | None = None
+        self.event_profile_path: str | None = None
 
     async def initialize(self):
         """
@@ -59,9 +88,15 @@ class ResultDatabase:
                     total_damage REAL DEFAULT 0,
                     duration_frames INTEGER DEFAULT 0,
                     avg_dps REAL DEFAULT 0,
-                    peak_dps REAL DEFAULT 0
+                    peak_dps REAL DEFAULT 0,
+                    rng_seed INTEGER -- [V3.3] 随机数源根种子，用于复现
                 )
             """)
+            # [V3.3] 兼容旧数据库：如果 rng_seed 列不存在则添加
+            try:
+                await db.execute("ALTER TABLE simulation_sessions ADD COLUMN rng_seed INTEGER")
+            except Exception:
+                pass  # 列已存在，忽略
 
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS simulation_configs (
@@ -231,9 +266,18 @@ class ResultDatabase:
                     reaction TEXT, -- JSON: {"type": "VAPORIZE", "multiplier": 2.0, "source_element": "Hydro", ...}
                     name TEXT, -- 伤害名称（如"普通攻击·一段"、"元素战技·沙龙舞"）
                     contributions TEXT, -- [V18.0] 月反应组分: JSON [{"name": "芙宁娜", "damage": 1234.5, "weight": 45.2}, ...]
+                    crit_rate REAL, -- [V3.3] 截断后的暴击率%，供事后暴击重采样
+                    crit_dmg REAL, -- [V3.3] 暴击伤害%
+                    non_crit_damage REAL, -- [V3.3] 不暴击时的伤害值
                     FOREIGN KEY (event_id) REFERENCES simulation_event_log(event_id) ON DELETE CASCADE
                 )
             """)
+            # [V3.3] 兼容旧数据库：补齐暴击参数列
+            for column in ("crit_rate", "crit_dmg", "non_crit_damage"):
+                try:
+                    await db.execute(f"ALTER TABLE event_damage_data ADD COLUMN {column} REAL")
+                except Exception:
+                    pass  # 列已存在，忽略
 
             # 12. 资源状态跳变表 (能量与血量)
             await db.execute("""
@@ -343,6 +387,21 @@ class ResultDatabase:
             
             return session_id
 
+    async def start(self, config_name: str, config_snapshot: dict[str, Any] | None = None) -> None:
+        """[V3.3] 持久化目标协议：建表、创建会话并启动后台写入 Worker。"""
+        await self.initialize()
+        await self.create_session(config_name, config_snapshot)
+        await self.start_session()
+
+    async def stop(self) -> None:
+        """[V3.3] 持久化目标协议：排空写入队列并回写会话汇总。"""
+        await self.stop_session()
+
+    @property
+    def total_damage(self) -> float:
+        """会话总伤害 (由投影器累计，会话未创建时为 0)。"""
+        return float(self.projector.total_damage) if self.projector else 0.0
+
     async def start_session(self):
         """启动后台写入 Worker"""
         self._running = True
@@ -355,6 +414,16 @@ class ResultDatabase:
             await self._queue.put(None)
             await self._worker_task
 
+    def record_rng_seed(self, seed: int) -> None:
+        """记录本次会话的随机数种子，随会话汇总一同回写。"""
+        self.rng_seed = seed
+
+    def record_event_profile(self, profiler: Any) -> None:
+        """[V3.3] 将事件总线剖析结果导出为与数据库同目录的 JSON 文件。"""
+        stem = os.path.splitext(self.db_path)[0]
+        self.event_profile_path = f"{stem}_session{self.session_id}_events.json"
+        profiler.export_json(self.event_profile_path)
+
     def record_snapshot(self, snapshot: dict[str, Any]):
         """压入待处理数据"""
         self._queue.put_nowait(snapshot)
@@ -364,54 +433,115 @@ class ResultDatabase:
         if not self.projector:
             return
 
-        from core.logger import get_emulation_logger
-
         async with aiosqlite.connect(self.db_path) as db:
             await db.execute("PRAGMA foreign_keys=ON")
             await db.execute("PRAGMA journal_mode=WAL")
             
-            while True:
-                item = await self._queue.get()
+            # [V3.3] 显式事务：多个快照共用一个写事务，按行数或时长分批提交
+            pending_rows = 0
+            last_commit = time.monotonic()
+            stopping = False
+            while not stopping:
+                if db.in_transaction:
+                    # 存在未提交的写入时最多等待至提交时限，空闲超时即提交，避免长期持有写事务
+                    remaining = self.COMMIT_INTERVAL - (time.monotonic() - last_commit)
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout=max(remaining, 0.0))
+                    except asyncio.TimeoutError:
+                        await db.commit()
+                        pending_rows = 0
+                        last_commit = time.monotonic()
+                        continue
+                else:
+                    item = await self._queue.get()
                 if item is None:
                     break
-                
-                # 1. 获取所有轨道的 SQL 指令
-                commands: list[tuple[str, Any]] = []
-                commands.extend(self.projector.project_static_meta(item))
-                commands.extend(self.projector.project_pulse(item))
-                commands.extend(self.projector.project_metrics(item))
-                commands.extend(self.projector.project_events(item))
-                
-                # 2. 批量执行指令集 (在同一个原子操作中)
-                sql = "None"
-                params = "None"
-                try:
-                    for sql, params in commands:
-                        await db.execute(sql, params)
-                except Exception as e:
-                    get_emulation_logger().log_error(
-                        f"持久化执行失败: {e}\n最近一条SQL: {sql}\n参数: {params}",
-                        sender="Persistence"
-                    )
-                    # 如果发生外键冲突，跳过当前快照以保护后续数据
-                    pass
-
-                # 3. 定期提交
-                if self._queue.empty() or item.get("frame", 0) % 60 == 0:
+
+                # 1. 取出队列中已就绪的快照，投影为各自的 SQL 指令集
+                batch: list[list[tuple[str, Any]]] = []
+                batch_rows = 0
+                while item is not None:
+                    commands = self._project(item)
+                    batch.append(commands)
+                    batch_rows += len(commands)
+                    self._queue.task_done()
+                    if batch_rows >= self.COMMIT_ROWS or self._queue.empty():
+                        break
+                    item = self._queue.get_nowait()
+                    stopping = item is None
+
+                # 2. 批量写入
+                if not db.in_transaction:
+                    await db.execute("BEGIN")
+                await self._write_batch(db, batch)
+                pending_rows += batch_rows
+
+                # 3. 累计行数或时长达到阈值时提交
+                if (
+                    pending_rows >= self.COMMIT_ROWS
+                    or time.monotonic() - last_commit >= self.COMMIT_INTERVAL
+                ):
                     await db.commit()
-                
-                self._queue.task_done()
+                    pending_rows = 0
+                    last_commit = time.monotonic()
 
             # --- 4. 仿真结束，执行 Session 汇总回写 ---
             if self.projector:
                 proj = self.projector
                 avg_dps = proj.total_damage / (proj.max_frame / 60.0) if proj.max_frame > 0 else 0
                 await db.execute(
-                    "UPDATE simulation_sessions SET total_damage=?, duration_frames=?, avg_dps=?, peak_dps=? WHERE id=?",
-                    (proj.total_damage, proj.max_frame, avg_dps, proj.peak_dps, self.session_id)
+                    "UPDATE simulation_sessions SET total_damage=?, duration_frames=?, avg_dps=?, peak_dps=?, rng_seed=? WHERE id=?",
+                    (proj.total_damage, proj.max_frame, avg_dps, proj.peak_dps, self.rng_seed, self.session_id)
                 )
                 await db.commit()
 
+    def _project(self, snapshot: dict[str, Any]) -> list[tuple[str, Any]]:
+        """获取单个快照在所有轨道上的 SQL 指令 (按投影顺序)。"""
+        projector = self.projector
+        if projector is None:
+            return []
+        commands: list[tuple[str, Any]] = []
+        commands.extend(projector.project_static_meta(snapshot))
+        commands.extend(projector.project_pulse(snapshot))
+        commands.extend(projector.project_metrics(snapshot))
+        commands.extend(projector.project_events(snapshot))
+        return commands
+
+    async def _write_batch(self, db: aiosqlite.Connection, batch: list[list[tuple[str, Any]]]) -> None:
+        """
+        [V3.3] 将多个快照的指令合并为相邻同构语句的 executemany 写入。
+
+        批次在保存点内执行；若任一语句失败则回滚整个批次，
+        改为逐快照写入，仅跳过出错的快照以保护后续数据。
+        """
+        if len(batch) > 1:
+            await db.execute("SAVEPOINT snapshot_batch")
+            try:
+                for sql, rows in group_statements(c for commands in batch for c in commands):
+                    await db.executemany(sql, rows)
+            except Exception:
+                await db.execute("ROLLBACK TO snapshot_batch")
+            else:
+                await db.execute("RELEASE snapshot_batch")
+                return
+            await db.execute("RELEASE snapshot_batch")
+
+        from core.logger import get_emulation_logger
+
+        for commands in batch:
+            last_sql = "None"
+            last_rows: list[Any] = []
+            try:
+                for last_sql, last_rows in group_statements(commands):
+                    await db.executemany(last_sql, last_rows)
+            except Exception as e:
+                get_emulation_logger().log_error(
+                    f"持久化执行失败: {e}\n最近一条SQL: {last_sql}\n参数 (共 {len(last_rows)} 行): {last_rows[:3]}",
+                    sender="Persistence"
+                )
+                # 如果发生外键冲突，跳过当前快照以保护后续数据
+                pass
+
     async def get_frame(self, frame_id: int) -> dict[str, Any] | None:
         """按帧 ID 获取快照数据 (重定向到外部适配器)"""
         from core.persistence.adapter import ReviewDataAdapter
@@ -438,6 +568,6 @@ class ResultDatabase:
 
         async with aiosqlite.connect(self.db_path) as db:
             await db.execute("PRAGMA foreign_keys=ON")
-            for sql, params in commands:
-                await db.execute(sql, params)
+            for sql, rows in group_statements(commands):
+                await db.executemany(sql, rows)
             await db.commit()
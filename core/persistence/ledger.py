@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+class _ColumnTable:
+    """预分配的定长列式表，容量不足时按倍数扩容。"""
+
+    def __init__(self, columns: dict[str, Any], capacity: int = 1024):
+        self._dtypes = columns
+        self._capacity = capacity
+        self.size = 0
+        self._data: dict[str, np.ndarray] = {
+            name: np.zeros(capacity, dtype=dtype) for name, dtype in columns.items()
+        }
+
+    def append(self, **values: Any) -> int:
+        """追加一行并返回行号，未提供的列保持为 0。"""
+        if self.size >= self._capacity:
+            self._grow()
+        row = self.size
+        for name, value in values.items():
+            self._data[name][row] = value
+        self.size += 1
+        return row
+
+    def set(self, row: int, name: str, value: Any) -> None:
+        self._data[name][row] = value
+
+    def column(self, name: str) -> np.ndarray:
+        """返回有效数据区的只读视图。"""
+        view = self._data[name][: self.size]
+        view.flags.writeable = False
+        return view
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        for name, arr in self._data.items():
+            grown = np.zeros(self._capacity, dtype=self._dtypes[name])
+            grown[: self.size] = arr[: self.size]
+            self._data[name] = grown
+
+
+class DamageLedger:
+    """
+    无头内存持久化目标 (Headless Ledger)。
+
+    可直接作为 ``Simulator(persistence_db=...)`` 注入，但不构造逐帧快照、
+    不经过 SQL 与 JSON 序列化：仅从事件缓冲区中摘取伤害、反应、能量跳变
+    与修饰符生命周期，写入预分配的列式数组。适用于批处理等无需审计下钻的场景。
+
+    字符串类字段 (伤害名、元素、反应类型等) 统一驻留为整数编码，
+    可通过 ``decode`` 还原。
+    """
+
+    # 仿真器协议：无需逐帧快照，兼容空闲帧快进，可随检查点一同分叉
+    requires_snapshots = False
+    supports_sparse_frames = True
+    supports_fork = True
+    # 账本不消费逐步审计链，伤害管线可跳过审计记录
+    audit_level = "off"
+
+    def __init__(self, capacity: int = 1024):
+        """初始化账本。
+
+        Args:
+            capacity: 各列式表的初始预分配行数。
+        """
+        self.hits = _ColumnTable(
+            {
+                "frame": np.int32,
+                "source_id": np.int32,
+                "target_id": np.int32,
+                "damage": np.float64,
+                "is_crit": np.bool_,
+                "name": np.int32,
+                "element": np.int32,
+                "attack_tag": np.int32,
+                "reaction": np.int32,
+                # 暴击参数 (未开启暴击时暴击率为 0，非暴击伤害即最终伤害)
+                "crit_rate": np.float64,
+                "crit_dmg": np.float64,
+                "non_crit_damage": np.float64,
+            },
+            capacity,
+        )
+        self.reactions = _ColumnTable(
+            {
+                "frame": np.int32,
+                "source_id": np.int32,
+                "target_id": np.int32,
+                "reaction": np.int32,
+            },
+            capacity,
+        )
+        self.energy = _ColumnTable(
+            {
+                "frame": np.int32,
+                "entity_id": np.int32,
+                "new_value": np.float64,
+                "delta": np.float64,
+            },
+            capacity,
+        )
+        self.modifiers = _ColumnTable(
+            {
+                "modifier_id": np.int64,
+                "entity_id": np.int32,
+                "start_frame": np.int32,
+                "end_frame": np.int32,
+                "source": np.int32,
+                "stat": np.int32,
+                "value": np.float64,
+                "op": np.int32,
+            },
+            capacity,
+        )
+
+        self.entity_names: dict[int, str] = {}
+        self.max_frame: int = 0
+        self.rng_seed: int | None = None
+        self.event_profile: dict[str, Any] | None = None
+        self._strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+        # modifier_id -> 行号，用于闭合生命周期
+        self._modifier_rows: dict[int, int] = {}
+
+    # ---------------------------------------------------------
+    # 持久化目标协议 (会话生命周期)
+    # ---------------------------------------------------------
+
+    async def start(self, config_name: str, config_snapshot: dict[str, Any] | None = None) -> None:
+        """内存账本无需建立会话。"""
+
+    async def stop(self) -> None:
+        """内存账本无需落盘。"""
+
+    # ---------------------------------------------------------
+    # 仿真器写入接口
+    # ---------------------------------------------------------
+
+    def record_events(self, frame: int, events: list[dict[str, Any]]) -> None:
+        """摘取一帧内的业务事件 (格式同 EventEngine.current_frame_events)。"""
+        self.max_frame = max(self.max_frame, frame)
+        for evt in events:
+            etype = evt.get("type")
+            payload = evt.get("payload", {})
+            source_id = evt.get("source_id") or 0
+            if source_id and source_id not in self.entity_names:
+                self.entity_names[source_id] = evt.get("source_name", "Unknown")
+
+            if etype == "AFTER_DAMAGE":
+                self._record_hit(frame, source_id, payload)
+            elif etype == "AFTER_ELEMENTAL_REACTION":
+                res = payload.get("elemental_reaction")
+                self.reactions.append(
+                    frame=frame,
+                    source_id=source_id,
+                    target_id=getattr(payload.get("target"), "entity_id", 0),
+                    reaction=self.intern(getattr(getattr(res, "reaction_type", None), "name", "UNKNOWN")),
+                )
+            elif etype == "AFTER_ENERGY_CHANGE":
+                new_val = payload.get("new_energy")
+                if new_val is not None:
+                    self.energy.append(
+                        frame=frame,
+                        entity_id=source_id,
+                        new_value=new_val,
+                        delta=payload.get("delta", 0.0),
+                    )
+            elif etype == "ON_MODIFIER_ADDED":
+                self._open_modifier(source_id, payload.get("modifier"), frame)
+            elif etype == "ON_MODIFIER_REMOVED":
+                mid = getattr(payload.get("modifier"), "modifier_id", 0)
+                row = self._modifier_rows.get(mid)
+                if row is not None:
+                    self.modifiers.set(row, "end_frame", frame)
+
+    def record_snapshot(self, snapshot: dict[str, Any]) -> None:
+        """兼容全量快照接口：仅消费其中的事件列表。"""
+        self.record_events(snapshot.get("frame", 0), snapshot.get("events", []))
+
+    def record_rng_seed(self, seed: int) -> None:
+        """记录本次运行的随机数种子，用于复现。"""
+        self.rng_seed = seed
+
+    def record_event_profile(self, profiler: Any) -> None:
+        """保存事件总线剖析结果 (EventProfiler.to_dict)。"""
+        self.event_profile = profiler.to_dict()
+
+    async def record_static_modifiers(self, entity_id: int, modifiers: list[Any]) -> None:
+        """登记静态修饰符 (武器/圣遗物)，起始帧为 0。与 ResultDatabase 保持同一协程接口。"""
+        for mod in modifiers:
+            self._open_modifier(entity_id, mod, 0)
+
+    def _record_hit(self, frame: int, source_id: int, payload: dict[str, Any]) -> None:
+        dmg = payload.get("damage")
+        element = getattr(dmg, "element", None)
+        if isinstance(element, tuple):
+            element = element[0] if element else None
+        config = getattr(dmg, "config", None)
+        attack_tag = getattr(config, "attack_tag", None) if config else None
+        reactions = getattr(dmg, "reaction_results", None)
+        damage = getattr(dmg, "damage", 0.0)
+        crit_profile = getattr(dmg, "data", {}).get("crit_profile") or {}
+
+        self.hits.append(
+            frame=frame,
+            source_id=source_id,
+            target_id=getattr(payload.get("target"), "entity_id", 0),
+            damage=damage,
+            is_crit=bool(getattr(dmg, "is_crit", False)),
+            name=self.intern(getattr(dmg, "name", "Unknown Damage")),
+            element=self.intern(str(getattr(element, "value", element or "Neutral"))),
+            attack_tag=self.intern(str(getattr(attack_tag, "name", attack_tag))),
+            reaction=self.intern(reactions[0].reaction_type.name) if reactions else -1,
+            crit_rate=crit_profile.get("crit_rate", 0.0),
+            crit_dmg=crit_profile.get("crit_dmg", 0.0),
+            non_crit_damage=crit_profile.get("non_crit", damage),
+        )
+
+    def _open_modifier(self, entity_id: int, mod: Any, frame: int) -> None:
+        mid = getattr(mod, "modifier_id", 0)
+        if mid in self._modifier_rows:
+            return
+        self._modifier_rows[mid] = self.modifiers.append(
+            modifier_id=mid,
+            entity_id=entity_id,
+            start_frame=frame,
+            end_frame=-1,
+            source=self.intern(getattr(mod, "source", "")),
+            stat=self.intern(getattr(mod, "stat", "")),
+            value=getattr(mod, "value", 0.0),
+            op=self.intern(getattr(mod, "op", "ADD")),
+        )
+
+    # ---------------------------------------------------------
+    # 字符串驻留
+    # ---------------------------------------------------------
+
+    def intern(self, text: str) -> int:
+        """将字符串驻留为整数编码。"""
+        code = self._string_ids.get(text)
+        if code is None:
+            code = len(self._strings)
+            self._strings.append(text)
+            self._string_ids[text] = code
+        return code
+
+    def decode(self, code: int) -> str | None:
+        """还原整数编码对应的字符串，-1 表示空值。"""
+        return self._strings[code] if 0 <= code < len(self._strings) else None
+
+    # ---------------------------------------------------------
+    # 汇总查询
+    # ---------------------------------------------------------
+
+    @property
+    def total_damage(self) -> float:
+        """总伤害。"""
+        return float(self.hits.column("damage").sum())
+
+    @property
+    def peak_dps(self) -> float:
+        """峰值 DPS：按 60 帧窗口统计，口径与 DataProjector 一致 (仅计入已闭合的窗口)。"""
+        frames = self.hits.column("frame")
+        if frames.size == 0 or self.max_frame < 60:
+            return 0.0
+        windows = np.maximum(frames - 1, 0) // 60
+        closed = self.max_frame // 60
+        sums = np.bincount(windows, weights=self.hits.column("damage"), minlength=closed)
+        return float(sums[:closed].max())
+
+    @property
+    def avg_dps(self) -> float:
+        """平均 DPS。"""
+        return self.total_damage / (self.max_frame / 60.0) if self.max_frame > 0 else 0.0
+
+    def damage_by_source(self) -> dict[int, float]:
+        """按伤害来源实体聚合总伤害。"""
+        return self._group_sum(self.hits.column("source_id"), self.hits.column("damage"))
+
+    def damage_by_target(self) -> dict[int, float]:
+        """按受击目标实体聚合总伤害。"""
+        return self._group_sum(self.hits.column("target_id"), self.hits.column("damage"))
+
+    @staticmethod
+    def _group_sum(keys: np.ndarray, values: np.ndarray) -> dict[int, float]:
+        if keys.size == 0:
+            return {}
+        uniq, inverse = np.unique(keys, return_inverse=True)
+        sums = np.bincount(inverse, weights=values)
+        return {int(k): float(v) for k, v in zip(uniq, sums)}
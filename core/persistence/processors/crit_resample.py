@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import Any, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from core.persistence.ledger import DamageLedger
+
+
+class CritResampleProcessor:
+    """
+    [V3.3] 事后暴击重采样处理器。
+
+    对于暴击结果不影响控制流的轮转，基于一次已完成运行记录的逐击
+    (非暴击伤害, 暴击率, 暴击伤害)，以 NumPy 向量化方式为成千上万次虚拟运行
+    重新抽取暴击结果，直接得到 DPS 分布，无需重跑帧循环。
+
+    注：多组分月曜反应伤害的加权结果按固定值处理 (组分暴击未单独记录)。
+    """
+
+    PERCENTILES = (5, 25, 50, 75, 95)
+    # 单批抽样矩阵的元素上限 (虚拟运行数 × 命中数)，控制内存占用
+    CHUNK_ELEMENTS = 4_000_000
+
+    @staticmethod
+    def process(
+        raw_hits: list[dict[str, Any]],
+        duration_frames: int,
+        runs: int = 10000,
+        seed: int | None = None,
+        bins: int = 40,
+    ) -> dict[str, Any]:
+        """
+        从 event_damage_data 行重采样。
+
+        Args:
+            raw_hits: SimulationRepository.fetch_crit_profiles 返回的行
+            duration_frames: 会话时长 (帧)
+        """
+        non_crit = np.array(
+            [h["non_crit"] if h["non_crit"] is not None else h["dmg"] for h in raw_hits], dtype=np.float64
+        )
+        crit_rate = np.array([h["crit_rate"] or 0.0 for h in raw_hits], dtype=np.float64)
+        crit_dmg = np.array([h["crit_dmg"] or 0.0 for h in raw_hits], dtype=np.float64)
+        return CritResampleProcessor.resample(non_crit, crit_rate, crit_dmg, duration_frames, runs, seed, bins)
+
+    @staticmethod
+    def from_ledger(
+        ledger: DamageLedger,
+        runs: int = 10000,
+        seed: int | None = None,
+        bins: int = 40,
+    ) -> dict[str, Any]:
+        """从内存账本重采样。"""
+        return CritResampleProcessor.resample(
+            ledger.hits.column("non_crit_damage"),
+            ledger.hits.column("crit_rate"),
+            ledger.hits.column("crit_dmg"),
+            ledger.max_frame,
+            runs,
+            seed,
+            bins,
+        )
+
+    @staticmethod
+    def resample(
+        non_crit: np.ndarray,
+        crit_rate: np.ndarray,
+        crit_dmg: np.ndarray,
+        duration_frames: int,
+        runs: int = 10000,
+        seed: int | None = None,
+        bins: int = 40,
+    ) -> dict[str, Any]:
+        """
+        核心重采样：总伤害 = Σ非暴击伤害 + 暴击指示矩阵 @ (非暴击伤害 × 暴击伤害%)。
+        """
+        if duration_frames <= 0 or runs <= 0:
+            return CritResampleProcessor._empty_result()
+
+        seconds = duration_frames / 60.0
+        base_total = float(non_crit.sum())
+
+        # 仅可能暴击的命中参与抽样
+        mask = crit_rate > 0
+        p = np.minimum(crit_rate[mask], 100.0) / 100.0
+        bonus = non_crit[mask] * crit_dmg[mask] / 100.0
+
+        rng = np.random.default_rng(seed)
+        totals = np.full(runs, base_total)
+        if p.size:
+            chunk = max(1, CritResampleProcessor.CHUNK_ELEMENTS // p.size)
+            for start in range(0, runs, chunk):
+                stop = min(start + chunk, runs)
+                hits = rng.random((stop - start, p.size)) < p
+                totals[start:stop] += hits @ bonus
+
+        dps = np.sort(totals / seconds)
+        counts, edges = np.histogram(dps, bins=bins)
+
+        def rank(q: float) -> float:
+            # 与 BatchExecutionService._calculate_stats 相同的取位口径
+            return float(dps[min(int(len(dps) * q), len(dps) - 1)])
+
+        return {
+            "runs": runs,
+            "avg_dps": float(dps.mean()),
+            "max_dps": float(dps[-1]),
+            "min_dps": float(dps[0]),
+            "std_dev_dps": float(dps.std(ddof=1)) if runs > 1 else 0.0,
+            "p95_dps": rank(0.95),
+            "percentiles": {q: rank(q / 100) for q in CritResampleProcessor.PERCENTILES},
+            "histogram": {"counts": counts.tolist(), "edges": edges.tolist()},
+            "expected_dps": (base_total + float((p * bonus).sum())) / seconds,
+        }
+
+    @staticmethod
+    def _empty_result() -> dict[str, Any]:
+        return {
+            "runs": 0, "avg_dps": 0.0, "max_dps": 0.0, "min_dps": 0.0,
+            "std_dev_dps": 0.0, "p95_dps": 0.0,
+            "percentiles": {q: 0.0 for q in CritResampleProcessor.PERCENTILES},
+            "histogram": {"counts": [], "edges": []},
+            "expected_dps": 0.0,
+        }
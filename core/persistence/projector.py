@@ -342,9 +342,15 @@ class DataProjector:
                             contributions_list.append(contrib_data)
                         contributions_json = json.dumps(contributions_list)
 
+                    # [V3.3] 暴击参数：供事后暴击重采样
+                    crit_profile = dmg_data.get("crit_profile") or {}
+
                     commands.append((
-                        "INSERT INTO event_damage_data (event_id, target_id, final_damage, element_type, attack_tag, is_crit, reaction, name, contributions) VALUES ((SELECT MAX(event_id) FROM simulation_event_log), ?, ?, ?, ?, ?, ?, ?, ?)",
-                        (tid, dmg_val, elem_str, attack_tag, 1 if getattr(dmg_obj, "is_crit", False) else 0, reaction_json, dmg_name, contributions_json)
+                        "INSERT INTO event_damage_data (event_id, target_id, final_damage, element_type, attack_tag, is_crit, reaction, name, contributions, crit_rate, crit_dmg, non_crit_damage) VALUES ((SELECT MAX(event_id) FROM simulation_event_log), ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            tid, dmg_val, elem_str, attack_tag, 1 if getattr(dmg_obj, "is_crit", False) else 0, reaction_json, dmg_name, contributions_json,
+                            crit_profile.get("crit_rate", 0.0), crit_profile.get("crit_dmg", 0.0), crit_profile.get("non_crit", dmg_val),
+                        )
                     ))
 
                     audit_trail = getattr(dmg_obj, "data", {}).get("audit_trail", [])
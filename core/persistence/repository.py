@@ -58,6 +58,19 @@ class SimulationRepository:
                 rows = await cursor.fetchall()
                 return [{"frame": r[0], "dmg": r[1], "source_id": r[2], "element": r[3], "event_id": r[4], "action": r[5], "name": r[6]} for r in rows]
 
+    async def fetch_crit_profiles(self, sid: int) -> list[dict[str, Any]]:
+        """[V3.3] 获取逐击暴击参数 (供事后暴击重采样)"""
+        async with aiosqlite.connect(self.db_path) as db:
+            sql = """
+                SELECT d.final_damage, d.crit_rate, d.crit_dmg, d.non_crit_damage
+                FROM event_damage_data d
+                JOIN simulation_event_log l ON d.event_id = l.event_id
+                WHERE l.session_id = ?
+            """
+            async with db.execute(sql, (sid,)) as cursor:
+                rows = await cursor.fetchall()
+                return [{"dmg": r[0], "crit_rate": r[1], "crit_dmg": r[2], "non_crit": r[3]} for r in rows]
+
     async def fetch_character_pulses(self, sid: int) -> list[dict[str, Any]]:
         async with aiosqlite.connect(self.db_path) as db:
             sql = "SELECT frame_id, entity_id, x, z, is_on_field, action_id FROM character_pulses WHERE session_id = ? ORDER BY frame_id"
@@ -0,0 +1,43 @@
+"""[V3.3] 仿真持久化目标协议。
+
+审计数据库 (ResultDatabase) 与内存账本 (DamageLedger) 共同实现本协议，
+上层服务 (单次仿真、批处理 worker) 只依赖协议中的会话生命周期与汇总接口，
+无需再按审计开关分别处理两种后端。
+"""
+
+from __future__ import annotations
+
+from typing import Any, Protocol
+
+from core.persistence.database import ResultDatabase
+from core.persistence.ledger import DamageLedger
+
+
+class PersistenceTarget(Protocol):
+    """仿真持久化目标：会话启停、静态修饰符登记与总伤害汇总。"""
+
+    rng_seed: int | None
+
+    async def start(self, config_name: str, config_snapshot: dict[str, Any] | None = None) -> None:
+        """开启会话，之后可作为 ``Simulator(persistence_db=...)`` 接收数据。"""
+        ...
+
+    async def stop(self) -> None:
+        """结束会话并落盘全部数据。"""
+        ...
+
+    async def record_static_modifiers(self, entity_id: int, modifiers: list[Any]) -> None:
+        """登记实体的静态修饰符 (武器/圣遗物)。"""
+        ...
+
+    @property
+    def total_damage(self) -> float:
+        """会话总伤害。"""
+        ...
+
+
+def create_persistence_target(audit: bool) -> PersistenceTarget:
+    """按审计需求创建持久化目标：需要审计下钻时写入结果数据库，否则使用内存账本。"""
+    if audit:
+        return ResultDatabase()
+    return DamageLedger()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import hashlib
+import random
+from typing import Any
+
+# 标准随机流名称
+CRIT_STREAM = "crit"  # 暴击判定
+TARGETING_STREAM = "targeting"  # 随机索敌 / 随机选取
+PROC_STREAM = "proc"  # 概率触发 (天赋额外攻击、微粒数量等)
+
+
+class RandomStreams:
+    """
+    上下文级随机数源。
+
+    由单个种子派生出相互独立的命名随机流 (暴击、索敌、实体级概率等)。
+    每条流的种子仅取决于 (根种子, 流名称)，与其他流的消耗次数无关；
+    因此两个仅在局部存在差异的配置在相同种子下共享公共随机数 (CRN)，
+    可显著降低对比实验所需的蒙特卡洛重复次数。
+    """
+
+    def __init__(self, seed: int | None = None):
+        """初始化随机数源。
+
+        Args:
+            seed: 根种子，为空时随机生成 (仍会记录以便复现)。
+        """
+        self.seed: int = seed if seed is not None else random.SystemRandom().getrandbits(63)
+        self._streams: dict[str, random.Random] = {}
+
+    def stream(self, name: str) -> random.Random:
+        """获取 (必要时创建) 指定名称的随机流。"""
+        rng = self._streams.get(name)
+        if rng is None:
+            digest = hashlib.sha256(f"{self.seed}:{name}".encode()).digest()
+            rng = random.Random(int.from_bytes(digest[:8], "big"))
+            self._streams[name] = rng
+        return rng
+
+    def entity_stream(self, name: str, entity: Any) -> random.Random:
+        """获取实体级随机流。
+
+        以实体名称 (而非进程内自增的 entity_id) 区分，保证跨进程、跨运行可复现。
+        """
+        return self.stream(f"{name}:{getattr(entity, 'name', entity)}")
@@ -1,13 +1,20 @@
 from __future__ import annotations
-from typing import Any, cast
-from collections.abc import Callable
+from typing import Any, TYPE_CHECKING, cast
+from collections.abc import Callable, Sequence
 import traceback
 
 from core.action.action_data import ActionCommand
 from core.context import SimulationContext
-from core.event import GameEvent, EventType
+from core.systems.damage.context import AUDIT_FULL
+from core.event import EventType, get_event_pool
 from core.logger import get_emulation_logger
 
+if TYPE_CHECKING:
+    from core.checkpoint import SimulationCheckpoint
+
+# 每帧发布一次的帧结束事件复用实例，避免逐帧分配
+_FRAME_END_POOL = get_event_pool(EventType.FRAME_END)
+
 
 class Simulator:
     """
@@ -18,17 +25,28 @@ class Simulator:
     def __init__(
         self,
         context: SimulationContext,
-        action_sequence: list[ActionCommand],
+        action_sequence: Sequence[ActionCommand],
         persistence_db: Any | None = None,
         on_progress: Callable[[int], Any] | None = None,
+        fast_forward: bool = False,
+        profile_events: bool = False,
+        audit_level: str | None = None,
     ):
         """初始化模拟器。
 
         Args:
             context: 模拟上下文实例。
-            action_sequence: 待执行的动作指令序列。
+            action_sequence: 待执行的动作指令序列 (列表或 ActionParser 编译的 ActionTimeline)。
             persistence_db: 可选的持久化数据库接口。
             on_progress: 进度回调函数，接收当前帧数作为参数。
+            fast_forward: 是否启用空闲帧快进。启用后，若所有子系统均声明了
+                下一唤醒帧，则直接跳过其间的空闲帧，结算结果与逐帧驱动一致。
+                需要逐帧快照的持久化目标会自动禁用该功能。
+            profile_events: 是否开启事件总线剖析。运行结束时输出热点处理程序排行，
+                并交由持久化目标导出 (见 record_event_profile)。
+            audit_level: 伤害审计级别 (full / summary / off)。默认为完整审计；
+                挂载的持久化目标可通过 ``audit_level`` 属性声明所需级别
+                (DamageLedger 为 off，ResultDatabase 默认为 full)。
         """
         self.ctx = context
         self.actions = action_sequence
@@ -37,25 +55,63 @@ class Simulator:
         self.db = persistence_db
         self.on_progress = on_progress
         self.max_frames = 18000  # 5分钟硬限制 (60fps * 300s)
+        self.fast_forward = fast_forward
+        self.skipped_frames = 0  # 快进跳过的帧数统计
+        # 完整唤醒查询失败后的退避窗口，避免在持续活跃的场景中逐帧付出查询开销
+        self._wakeup_backoff = 0
+        self._wakeup_retry_frame = 0
+        # 分叉点：指令指针到达该位置时挂起 (不执行结清)，供 checkpoint 使用
+        self.stop_at_action: int | None = None
+        self.paused = False
+        self._started = False
+        if profile_events and context.event_engine:
+            context.event_engine.enable_profiling()
+        if audit_level is None:
+            audit_level = getattr(persistence_db, "audit_level", AUDIT_FULL)
+        context.audit_level = audit_level
 
     async def run(self) -> None:
         """开始异步模拟循环。
 
         驱动每一帧的物理更新、指令下发、事件发布以及状态持久化。
+        若设置了 stop_at_action，指令指针到达该位置时挂起返回 (paused 为 True)，
+        此时可调用 checkpoint() 分叉，或再次调用 run() 续跑。
         """
         self.is_running = True
-        get_emulation_logger().log_info("模拟开始执行", sender="Simulator")
+        self.paused = False
 
         try:
-            # 初始帧前准备
-            self._prepare_simulation()
+            # 从检查点分叉的模拟器已完成初始化，直接续跑
+            if not self._started:
+                get_emulation_logger().log_info("模拟开始执行", sender="Simulator")
+
+                # 初始帧前准备
+                self._prepare_simulation()
 
-            # [V19.0] 记录第 0 帧快照（包含规则应用产生的事件，如能量设置）
-            # 必须在 advance_frame() 之前记录，因为 advance_frame() 会清空事件缓冲区
-            if self.db:
-                self.db.record_snapshot(self.ctx.take_snapshot())
+                if self.fast_forward and self.db and not getattr(self.db, "supports_sparse_frames", False):
+                    get_emulation_logger().log_info(
+                        "持久化目标需要逐帧快照，已禁用空闲帧快进", sender="Simulator"
+                    )
+                    self.fast_forward = False
+
+                # [V19.0] 记录第 0 帧快照（包含规则应用产生的事件，如能量设置）
+                # 必须在 advance_frame() 之前记录，因为 advance_frame() 会清空事件缓冲区
+                if self.db:
+                    if hasattr(self.db, "record_rng_seed"):
+                        self.db.record_rng_seed(self.ctx.rng.seed)
+                    self._persist_frame()
+                self._started = True
 
             while self.is_running:
+                # 分叉点挂起：保留完整运行态，跳过结清阶段
+                if self.stop_at_action is not None and self.action_ptr >= self.stop_at_action:
+                    self.paused = True
+                    break
+
+                # 0. 空闲帧快进：直接跳至下一个唤醒帧的前一帧
+                if self.fast_forward:
+                    await self._skip_idle_frames()
+
                 # 1. 推进全局帧 (此方法内部会驱动 ctx.space.on_frame_update, 进而驱动 team)
                 self.ctx.advance_frame()
 
@@ -69,13 +125,11 @@ class Simulator:
 
                 # 3. 发布帧结束事件 (驱动各 System 结算)
                 if self.ctx.event_engine:
-                    self.ctx.event_engine.publish(
-                        GameEvent(EventType.FRAME_END, self.ctx.current_frame)
-                    )
+                    _FRAME_END_POOL.publish(self.ctx.event_engine, self.ctx.current_frame)
 
                 # 4. 持久化快照
                 if self.db:
-                    self.db.record_snapshot(self.ctx.take_snapshot())
+                    self._persist_frame()
 
                 # 5. UI 进度通知 (每 10 帧同步一次)
                 if self.on_progress and self.ctx.current_frame % 10 == 0:
@@ -97,18 +151,17 @@ class Simulator:
             self.is_running = False
             
             # --- 强制结清阶段 (Mandatory Settlement) ---
-            if self.ctx.space:
+            if self.ctx.space and not self.paused:
                 # 1. 先清除上一帧残留的业务事件 (如最后一击产生的伤害)，防止在终结快照中重复记录
                 if self.ctx.event_engine:
                     self.ctx.event_engine.clear_frame_events()
 
-                from core.entities.base_entity import Faction
                 all_entities: list[Any] = []
                 if self.ctx.space.team:
                     all_entities.extend(self.ctx.space.team.get_members())
                 
-                for faction in Faction:
-                    all_entities.extend(self.ctx.space._entities.get(faction, []))
+                # 已销毁实体的 finish 为空操作，仅需处理仍存活的实体
+                all_entities.extend(self.ctx.space.get_registered_entities(active_only=True))
                 
                 # 2. 统一触发实体销毁 (会自动闭合 DB 中的 end_frame)
                 for ent in all_entities:
@@ -117,13 +170,54 @@ class Simulator:
                 
                 # 3. 记录最后的结清快照
                 if self.db:
-                    self.db.record_snapshot(self.ctx.take_snapshot())
+                    self._persist_frame()
+
+        if self.paused:
+            get_emulation_logger().log_info(
+                f"模拟在分叉点挂起 (Frame: {self.ctx.current_frame}, Ptr: {self.action_ptr})",
+                sender="Simulator",
+            )
+            return
 
         # 仿真结束后确保最后一次进度同步
         if self.on_progress:
             await self.on_progress(self.ctx.current_frame)
 
         get_emulation_logger().log_info("模拟执行完毕", sender="Simulator")
+        self._report_event_profile()
+
+    def checkpoint(self) -> SimulationCheckpoint:
+        """为已在分叉点挂起的模拟器创建检查点。
+
+        检查点可多次 fork 出独立的子模拟器，以不同的指令尾部继续运行。
+        """
+        from core.checkpoint import SimulationCheckpoint
+
+        return SimulationCheckpoint(self)
+
+    def _report_event_profile(self) -> None:
+        """输出事件总线剖析排行，并交由持久化目标导出。"""
+        profiler = self.ctx.event_engine.profiler if self.ctx.event_engine else None
+        if profiler is None:
+            return
+        get_emulation_logger().log_info(profiler.report(), sender="EventProfiler")
+        if self.db and hasattr(self.db, "record_event_profile"):
+            self.db.record_event_profile(profiler)
+
+    def _persist_frame(self) -> None:
+        """将当前帧写入持久化目标。
+
+        声明 ``requires_snapshots = False`` 的轻量目标 (如 DamageLedger) 仅接收
+        事件缓冲区，跳过全量快照的构造开销。
+        """
+        db = self.db
+        if db is None:
+            return
+        if getattr(db, "requires_snapshots", True):
+            db.record_snapshot(self.ctx.take_snapshot())
+        else:
+            engine = self.ctx.event_engine
+            db.record_events(self.ctx.current_frame, engine.current_frame_events if engine else [])
 
     def _prepare_simulation(self) -> None:
         """模拟启动前的预处理逻辑。"""
@@ -156,6 +250,71 @@ class Simulator:
             target.on_field = True
             team.active_index = team.members.index(target)
 
+    async def _skip_idle_frames(self) -> None:
+        """跳过当前帧与下一唤醒帧之间的所有空闲帧。"""
+        frame = self.ctx.current_frame
+        if frame < self._wakeup_retry_frame:
+            return
+
+        # 廉价预检：指令下发与动作状态机
+        wake = min(self._next_command_wakeup(frame), self.max_frames + 1)
+        team = self.ctx.space.team if self.ctx.space else None
+        if team and wake > frame + 1:
+            wake = min(wake, team.next_action_wakeup(frame))
+        if wake <= frame + 1:
+            return
+
+        wake = min(wake, self.ctx.next_wakeup())
+        frames = int(wake) - frame - 1
+        if frames <= 0:
+            # 存在需要逐帧驱动的组件，指数退避后再尝试 (不影响结算正确性)
+            self._wakeup_backoff = min(max(1, self._wakeup_backoff * 2), 16)
+            self._wakeup_retry_frame = frame + self._wakeup_backoff
+            return
+        self._wakeup_backoff = 0
+
+        self.ctx.fast_forward(frames)
+        self.skipped_frames += frames
+
+        if self.on_progress and frame // 10 != self.ctx.current_frame // 10:
+            await self.on_progress(self.ctx.current_frame)
+
+    def _next_command_wakeup(self, frame: int) -> float:
+        """返回下一条待下发指令可能被受理的帧号。
+
+        仅对切换 CD 与基础技能 CD 这两类可预测的等待做精确推算，其余情况保守地逐帧尝试。
+        """
+        if self.action_ptr >= len(self.actions):
+            return float("inf")
+
+        team = self.ctx.space.team if self.ctx.space else None
+        if not team:
+            return frame + 1
+        if team.is_any_character_busy:
+            # 动作结束帧已由 ActionManager 声明
+            return float("inf")
+
+        command = cast(ActionCommand, self.actions[self.action_ptr])
+        char = team.get_character_by_name(command.character_name)
+        if not char:
+            return frame + 1
+
+        if char != team.current_character:
+            return frame + max(1, team.swap_cd_timer)
+
+        from core.skills.base import SkillBase
+
+        skill = char.skills.get(command.action_type)
+        cd_frames = getattr(skill, "cd_frames", 0)
+        if (
+            skill is not None
+            and type(skill).can_cast is SkillBase.can_cast
+            and cd_frames > 0
+            and frame + 1 - skill.last_use_frame < cd_frames
+        ):
+            return skill.last_use_frame + cd_frames
+        return frame + 1
+
     def _try_enqueue_next_action(self) -> None:
         """尝试从指令序列中提取下一个指令并请求角色执行。"""
         if self.action_ptr >= len(self.actions):
@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
+from collections.abc import Hashable, Iterable
 from typing import Any
 
 from core.action.action_data import ActionFrameData
 
+# [V3.3] 进程级动作模板池：(技能类型, 技能等级, 变体) -> 编译后的只读 ActionFrameData
+_ACTION_TEMPLATES: dict[tuple[type, int, Hashable], ActionFrameData] = {}
+
 
 class SkillBase(ABC):
     """
@@ -22,6 +26,8 @@ class SkillBase(ABC):
         self.lv: int = lv
         self.caster: Any = caster
         self.last_use_frame: int = -9999
+        # 已绑定到本实例的动作模板：(等级, 变体) -> ActionFrameData
+        self._bound_actions: dict[tuple[int, Hashable], ActionFrameData] = {}
 
     @abstractmethod
     def to_action_data(
@@ -41,6 +47,46 @@ class SkillBase(ABC):
         """
         pass
 
+    # -----------------------------------------------------
+    # [V3.3] 动作模板
+    # -----------------------------------------------------
+
+    def compiled_action(self, variant: Any = None) -> ActionFrameData:
+        """
+        返回变体对应的动作数据。
+
+        变体由子类根据意图与角色状态选定 (如连击段位、形态、意图中的元素)，
+        须可哈希，且需完整决定 build_action 的产出。模板按 (技能类型, 等级, 变体) 在进程内
+        编译一次，本实例持有其绑定副本，重复施放不再重新构造。
+        """
+        key = (self.lv, variant)
+        bound = self._bound_actions.get(key)
+        if bound is None:
+            pool_key = (type(self), self.lv, variant)
+            template = _ACTION_TEMPLATES.get(pool_key)
+            if template is None:
+                template = _ACTION_TEMPLATES[pool_key] = self.build_action(variant).compile()
+            bound = self._bound_actions[key] = template.bind(self)
+        return bound
+
+    def build_action(self, variant: Any) -> ActionFrameData:
+        """构造变体对应的动作数据 (仅在模板编译时调用)。
+
+        to_action_data 经由 compiled_action 取得动作数据的子类必须重写本方法；
+        直接构造 ActionFrameData 的子类无需实现，基类默认抛出 NotImplementedError。
+        子类可将参数收窄为自身使用的变体类型 (如段位 int、形态 str)。
+        """
+        raise NotImplementedError(f"{type(self).__name__} 未实现 build_action")
+
+    def action_variants(self) -> Iterable[Hashable]:
+        """预热时需要编译的变体列表。"""
+        return ()
+
+    def warm_up(self) -> None:
+        """预编译本技能的全部动作模板。"""
+        for variant in self.action_variants():
+            self.compiled_action(variant)
+
     def can_cast(self) -> bool:
         """
         检查技能是否满足施放条件 (如 CD、能量)。
@@ -74,6 +120,17 @@ class SkillBase(ABC):
         """
         pass
 
+    def next_wakeup(self, frame: int) -> float:
+        """
+        [快进协议] 返回下一个必须逐帧执行的绝对帧号。
+        重写 on_frame_update 的子类需同步重写本方法与 fast_forward。
+        """
+        return float("inf")
+
+    def fast_forward(self, frames: int) -> None:
+        """[快进协议] 跳过 frames 个空闲帧，等效推进技能内部计时器。"""
+        pass
+
 
 class EnergySkill(SkillBase):
     """
@@ -119,3 +176,15 @@ class EnergySkill(SkillBase):
                         }
                     )
                 )
+
+
+def warm_up_action_templates(characters: Iterable[Any]) -> None:
+    """[V3.3] 预编译全队技能的动作模板。
+
+    模板池为进程级缓存，批量 worker 在首次组装时支付编译成本，
+    之后的仿真实例仅做绑定。
+    """
+    for char in characters:
+        for skill in getattr(char, "skills", {}).values():
+            if isinstance(skill, SkillBase):
+                skill.warm_up()
@@ -38,7 +38,13 @@ class NormalAttackSkill(SkillBase):
         idx = 1
         if hasattr(self.caster, "action_manager"):
             idx = self.caster.action_manager.combo_counter
+        return self.compiled_action(idx)
 
+    def action_variants(self) -> range:
+        return range(1, getattr(self.caster, "max_combo", 5) + 1)
+
+    def build_action(self, idx: int) -> ActionFrameData:
+        """构造第 idx 段普攻的动作数据。"""
         # 核心规范：直接使用原生中文作为索引 Key
         action_key = f"普通攻击{idx}"
 
@@ -145,6 +151,12 @@ class ChargedAttackSkill(SkillBase):
     def to_action_data(
         self, intent: dict[str, Any] | None = None
     ) -> ActionFrameData:
+        return self.compiled_action()
+
+    def action_variants(self) -> list[Any]:
+        return [None]
+
+    def build_action(self, variant: Any) -> ActionFrameData:
         # 统一命名规范：使用 '重击'
         f = self.action_frame_data.get(
             "重击",
@@ -258,6 +270,13 @@ class PlungingAttackSkill(SkillBase):
             origin_skill=self,
         )
 
+    def next_wakeup(self, frame: int) -> float:
+        """下落期间逐帧模拟坠落，需保持逐帧驱动。"""
+        instance = getattr(getattr(self.caster, "action_manager", None), "current_action", None)
+        if instance and instance.data.origin_skill == self:
+            return frame + 1
+        return float("inf")
+
     def on_frame_update(self) -> None:
         if not self.caster:
             return
@@ -322,6 +341,9 @@ class SkipSkill(SkillBase):
         self, intent: dict[str, Any] | None = None
     ) -> ActionFrameData:
         frames = int(intent.get("frames", 1)) if intent else 1
+        return self.compiled_action(frames)
+
+    def build_action(self, frames: int) -> ActionFrameData:
         return ActionFrameData(
             name="等待",
             action_type="skip",
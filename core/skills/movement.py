@@ -23,6 +23,13 @@ class DashSkill(SkillBase):
     def to_action_data(
         self, intent: dict[str, Any] | None = None
     ) -> ActionFrameData:
+        # 动作数据由角色类的帧数据表决定，变体取施放者类型
+        return self.compiled_action(type(self.caster))
+
+    def action_variants(self) -> list[type]:
+        return [type(self.caster)]
+
+    def build_action(self, caster_type: type) -> ActionFrameData:
         # 尝试从角色数据中获取实测冲刺数据
         frames: FrameData = self.default_frames
         if hasattr(self.caster, "action_frame_data"):
@@ -47,6 +54,10 @@ class DashSkill(SkillBase):
         # 在此处执行物理位移累加 (暂略)
         pass
 
+    def next_wakeup(self, frame: int) -> float:
+        """位移逻辑尚未实装，无需唤醒。"""
+        return float("inf")
+
 
 class JumpSkill(SkillBase):
     """
@@ -60,6 +71,12 @@ class JumpSkill(SkillBase):
     def to_action_data(
         self, intent: dict[str, Any] | None = None
     ) -> ActionFrameData:
+        return self.compiled_action(type(self.caster))
+
+    def action_variants(self) -> list[type]:
+        return [type(self.caster)]
+
+    def build_action(self, caster_type: type) -> ActionFrameData:
         frames: FrameData = self.default_frames
         if hasattr(self.caster, "action_frame_data"):
             raw = self.caster.action_frame_data.get("JUMP", self.default_frames)
@@ -81,3 +98,7 @@ class JumpSkill(SkillBase):
     def on_frame_update(self) -> None:
         """处理垂直上升逻辑。"""
         pass
+
+    def next_wakeup(self, frame: int) -> float:
+        """位移逻辑尚未实装，无需唤醒。"""
+        return float("inf")
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import math
+from typing import Any, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from core.entities.base_entity import BaseEntity
+
+
+class TrackedPosition(list):
+    """
+    实体坐标 [x, z, y]。
+
+    行为与普通列表一致；XZ 分量被改写时通知所属实体，
+    以便空间索引增量更新实体所在网格。
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, values: Any = (), owner: Any = None):
+        super().__init__(values)
+        self._owner = owner
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        owner = self._owner
+        if owner is not None and owner._spatial_index is not None:
+            owner._spatial_index.move(owner)
+
+
+class HitTable:
+    """
+    实体碰撞参数的列式表 (单一阵营)。
+
+    以连续 NumPy 数组保存各实体的 XZ 坐标与碰撞半径，一次向量化运算即可得到
+    AOE 的命中掩码。删除采用末行换位，结果按注册序号恢复原有顺序。
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.rows: list[BaseEntity] = []
+        self._row_of: dict[int, int] = {}
+        self.x = np.empty(capacity)
+        self.z = np.empty(capacity)
+        self.radius = np.empty(capacity)
+        self.seq = np.empty(capacity, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def insert(self, entity: BaseEntity, seq: int) -> None:
+        n = len(self.rows)
+        if n == len(self.x):
+            self._grow(2 * n)
+        self._row_of[entity.entity_id] = n
+        self.rows.append(entity)
+        self.x[n] = entity.pos[0]
+        self.z[n] = entity.pos[1]
+        self.radius[n] = entity.hitbox[0]
+        self.seq[n] = seq
+
+    def remove(self, entity: BaseEntity) -> None:
+        row = self._row_of.pop(entity.entity_id)
+        last = len(self.rows) - 1
+        tail = self.rows.pop()
+        if row != last:
+            self.rows[row] = tail
+            self._row_of[tail.entity_id] = row
+            for col in (self.x, self.z, self.radius, self.seq):
+                col[row] = col[last]
+
+    def update(self, entity: BaseEntity) -> None:
+        row = self._row_of[entity.entity_id]
+        self.x[row] = entity.pos[0]
+        self.z[row] = entity.pos[1]
+        self.radius[row] = entity.hitbox[0]
+
+    def _grow(self, capacity: int) -> None:
+        for name in ("x", "z", "radius", "seq"):
+            old = getattr(self, name)
+            col = np.empty(capacity, dtype=old.dtype)
+            col[: len(old)] = old
+            setattr(self, name, col)
+
+    def select(self, mask: np.ndarray) -> list[BaseEntity]:
+        """按注册顺序取出掩码命中的实体。"""
+        idx = np.flatnonzero(mask)
+        if len(idx) > 1:
+            idx = idx[np.argsort(self.seq[idx], kind="stable")]
+        rows = self.rows
+        return [rows[i] for i in idx.tolist()]
+
+    def in_range(self, ox: float, oz: float, radius: float) -> list[BaseEntity]:
+        """圆柱/球体判定：中心距离 <= 查询半径 + 碰撞半径。"""
+        n = len(self.rows)
+        dx = self.x[:n] - ox
+        dz = self.z[:n] - oz
+        total_r = radius + self.radius[:n]
+        return self.select(dx * dx + dz * dz <= total_r * total_r)
+
+    def in_box(
+        self, ox: float, oz: float, length: float, width: float, cos_f: float, sin_f: float
+    ) -> list[BaseEntity]:
+        """矩形判定：局部坐标系下点到矩形的最近距离 <= 碰撞半径。"""
+        n = len(self.rows)
+        dx = self.x[:n] - ox
+        dz = self.z[:n] - oz
+        rx = dx * cos_f - dz * sin_f
+        rz = dx * sin_f + dz * cos_f
+        ex = rx - np.maximum(0.0, np.minimum(rx, length))
+        ez = rz - np.maximum(-width / 2.0, np.minimum(rz, width / 2.0))
+        r = self.radius[:n]
+        return self.select(ex * ex + ez * ez <= r * r)
+
+
+class GridIndex:
+    """
+    XZ 平面均匀网格空间索引 (单一阵营)。
+
+    实体按碰撞盒中心落入边长为 cell_size 的网格；查询时以查询区域外扩
+    阵营内最大碰撞半径后的包围盒收集候选，再做精确判定。
+    候选结果按注册顺序返回，与线性扫描的结果顺序一致。
+    """
+
+    def __init__(self, cell_size: float = 5.0):
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], list[BaseEntity]] = {}
+        self._cell_of: dict[int, tuple[int, int]] = {}
+        # entity_id -> 登记时的碰撞半径
+        self._radius_of: dict[int, float] = {}
+        # entity_id -> 注册序号
+        self._order: dict[int, int] = {}
+        self._seq = 0
+        # 碰撞半径 -> 实体数，用于维护最大碰撞半径
+        self._radii: dict[float, int] = {}
+        self.max_radius = 0.0
+        self.table = HitTable()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _key(self, x: float, z: float) -> tuple[int, int]:
+        size = self.cell_size
+        return (math.floor(x / size), math.floor(z / size))
+
+    def insert(self, entity: BaseEntity) -> None:
+        eid = entity.entity_id
+        if eid in self._order:
+            return
+        self._seq += 1
+        self._order[eid] = self._seq
+        key = self._key(entity.pos[0], entity.pos[1])
+        self._cells.setdefault(key, []).append(entity)
+        self._cell_of[eid] = key
+        self._add_radius(eid, entity.hitbox[0])
+        self.table.insert(entity, self._seq)
+
+    def remove(self, entity: BaseEntity) -> None:
+        eid = entity.entity_id
+        if self._order.pop(eid, None) is None:
+            return
+        key = self._cell_of.pop(eid)
+        bucket = self._cells[key]
+        bucket.remove(entity)
+        if not bucket:
+            del self._cells[key]
+        self._drop_radius(eid)
+        self.table.remove(entity)
+
+    def resize(self, entity: BaseEntity) -> None:
+        """实体碰撞盒变化后调用：刷新最大碰撞半径。"""
+        eid = entity.entity_id
+        if eid in self._radius_of:
+            self._drop_radius(eid)
+            self._add_radius(eid, entity.hitbox[0])
+            self.table.update(entity)
+
+    def _add_radius(self, eid: int, radius: float) -> None:
+        self._radius_of[eid] = radius
+        self._radii[radius] = self._radii.get(radius, 0) + 1
+        if radius > self.max_radius:
+            self.max_radius = radius
+
+    def _drop_radius(self, eid: int) -> None:
+        radius = self._radius_of.pop(eid)
+        count = self._radii[radius] - 1
+        if count:
+            self._radii[radius] = count
+        else:
+            del self._radii[radius]
+            if radius == self.max_radius:
+                self.max_radius = max(self._radii, default=0.0)
+
+    def move(self, entity: BaseEntity) -> None:
+        """实体坐标变化后调用：仅在跨越网格时迁移。"""
+        eid = entity.entity_id
+        old = self._cell_of.get(eid)
+        if old is None:
+            return
+        self.table.update(entity)
+        key = self._key(entity.pos[0], entity.pos[1])
+        if key == old:
+            return
+        bucket = self._cells[old]
+        bucket.remove(entity)
+        if not bucket:
+            del self._cells[old]
+        self._cells.setdefault(key, []).append(entity)
+        self._cell_of[eid] = key
+
+    def query_aabb(
+        self, min_x: float, min_z: float, max_x: float, max_z: float, ordered: bool = True
+    ) -> list[BaseEntity]:
+        """收集中心落在外扩 max_radius 后的包围盒所覆盖网格内的实体。
+
+        Args:
+            ordered: 是否按注册顺序排列；调用方仅需候选数量时可跳过排序。
+        """
+        pad = self.max_radius
+        x0, z0 = self._key(min_x - pad, min_z - pad)
+        x1, z1 = self._key(max_x + pad, max_z + pad)
+
+        found: list[BaseEntity] = []
+        cells = self._cells
+        if (x1 - x0 + 1) * (z1 - z0 + 1) > len(cells):
+            # 查询范围覆盖的网格多于已占用网格时，直接遍历已占用网格
+            for (cx, cz), bucket in cells.items():
+                if x0 <= cx <= x1 and z0 <= cz <= z1:
+                    found.extend(bucket)
+        else:
+            for cx in range(x0, x1 + 1):
+                for cz in range(z0, z1 + 1):
+                    cell = cells.get((cx, cz))
+                    if cell:
+                        found.extend(cell)
+        if ordered:
+            self.sort(found)
+        return found
+
+    def sort(self, entities: list[BaseEntity]) -> None:
+        """将实体列表原地按注册顺序排列。"""
+        if len(entities) > 1:
+            order = self._order
+            entities.sort(key=lambda e: order[e.entity_id])
+
+    def nearest(self, x: float, z: float) -> BaseEntity | None:
+        """按中心距离查找最近实体，距离相同取注册序号最小者。"""
+        if not self._order:
+            return None
+        cx, cz = self._key(x, z)
+        keys = self._cells.keys()
+        min_cx = min(k[0] for k in keys)
+        max_cx = max(k[0] for k in keys)
+        min_cz = min(k[1] for k in keys)
+        max_cz = max(k[1] for k in keys)
+        max_ring = max(cx - min_cx, max_cx - cx, cz - min_cz, max_cz - cz, 0)
+
+        order = self._order
+        best: BaseEntity | None = None
+        best_key = (math.inf, 0)
+        for ring in range(max_ring + 1):
+            for key in self._ring(cx, cz, ring):
+                for e in self._cells.get(key, ()):
+                    candidate = ((e.pos[0] - x) ** 2 + (e.pos[1] - z) ** 2, order[e.entity_id])
+                    if candidate < best_key:
+                        best_key = candidate
+                        best = e
+            # 下一环内的点与查询点的距离不小于 ring * cell_size
+            reach = ring * self.cell_size
+            if best is not None and best_key[0] < reach * reach:
+                break
+        return best
+
+    @staticmethod
+    def _ring(cx: int, cz: int, ring: int) -> list[tuple[int, int]]:
+        if ring == 0:
+            return [(cx, cz)]
+        keys = []
+        for dx in range(-ring, ring + 1):
+            keys.append((cx + dx, cz - ring))
+            keys.append((cx + dx, cz + ring))
+        for dz in range(-ring + 1, ring):
+            keys.append((cx - ring, cz + dz))
+            keys.append((cx + ring, cz + dz))
+        return keys
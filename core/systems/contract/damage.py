@@ -55,6 +55,22 @@ class Damage:
         """向伤害对象注入额外的运行时上下文数据。"""
         self.data[key] = value
 
+    def fork(self) -> "Damage":
+        """复制出一份尚未命中目标的伤害对象，用于同一次攻击对多个目标分别结算。
+
+        倍率、元素、配置与附加数据沿用原对象，运行时结算状态重置。
+        """
+        clone = Damage(
+            element=self.element,
+            damage_multiplier=self.damage_multiplier,
+            scaling_stat=self.scaling_stat,
+            config=self.config,
+            name=self.name,
+        )
+        clone.source = self.source
+        clone.data = dict(self.data)
+        return clone
+
     def to_dict(self) -> dict[str, Any]:
         """将伤害对象序列化为可持久化的字典。"""
         return {
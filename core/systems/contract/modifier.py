@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ModifierRecord:
     """修饰符记录条目，用于属性或伤害的审计。"""
 
@@ -0,0 +1,65 @@
+"""属性名驻留表。
+
+为每个属性名分配稳定的小整数 ID，供热路径以数组下标代替字符串哈希；
+字符串接口保持不变，仅在缓存与查表处使用 ID。
+"""
+
+from __future__ import annotations
+
+import sys
+
+# 预登记的核心属性 (ID 按此顺序分配，跨运行稳定)
+CORE_STATS: tuple[str, ...] = (
+    "攻击力", "攻击力%", "固定攻击力",
+    "生命值", "生命值%", "固定生命值",
+    "防御力", "防御力%", "固定防御力",
+    "元素精通", "暴击率", "暴击伤害", "元素充能效率",
+    "治疗加成", "受治疗加成", "护盾强效", "伤害加成",
+)
+
+ELEMENT_NAMES: tuple[str, ...] = ("火", "水", "冰", "雷", "草", "风", "岩", "物理")
+
+
+class StatRegistry:
+    """属性名 <-> 整数 ID 的双向映射。新属性名在首次出现时登记。"""
+
+    def __init__(self, names: tuple[str, ...] = ()):
+        self._ids: dict[str, int] = {}
+        self.names: list[str] = []
+        for name in names:
+            self.intern(name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def intern(self, name: str) -> int:
+        """返回属性名的 ID，未登记时分配新 ID。"""
+        sid = self._ids.get(name)
+        if sid is None:
+            sid = len(self.names)
+            name = sys.intern(name)
+            self.names.append(name)
+            self._ids[name] = sid
+        return sid
+
+    def name(self, stat_id: int) -> str:
+        """还原 ID 对应的属性名。"""
+        return self.names[stat_id]
+
+
+STATS = StatRegistry(CORE_STATS + tuple(f"{el}元素抗性" for el in ELEMENT_NAMES))
+
+# 元素 -> 抗性 / 伤害加成属性名 (预先驻留，避免每次命中格式化字符串)
+RES_KEYS: dict[str, str] = {el: STATS.name(STATS.intern(f"{el}元素抗性")) for el in ELEMENT_NAMES}
+DMG_BONUS_KEYS: dict[str, str] = {
+    el: STATS.name(STATS.intern("物理伤害加成" if el == "物理" else f"{el}元素伤害加成"))
+    for el in ELEMENT_NAMES
+}
+
+
+def res_key(element_name: str) -> str:
+    """元素对应的抗性属性名。"""
+    key = RES_KEYS.get(element_name)
+    if key is None:
+        key = RES_KEYS[element_name] = STATS.name(STATS.intern(f"{element_name}元素抗性"))
+    return key
@@ -9,6 +9,36 @@ if TYPE_CHECKING:
     from core.systems.contract.damage import Damage
 
 
+# 审计级别
+# - full: 逐步记录审计链，每条记录分配全局唯一的修饰符 ID
+# - summary: 逐步记录审计链，但不分配修饰符 ID (记录 ID 为 0)
+# - off: 仅更新数值槽位，不生成任何审计记录
+AUDIT_FULL = "full"
+AUDIT_SUMMARY = "summary"
+AUDIT_OFF = "off"
+
+# 核心代数槽位模板 (根据 V2.5 审计规范定义)
+_STAT_SLOTS: dict[str, float] = {
+    "固定伤害值加成": 0.0,
+    "伤害加成": 0.0,
+    "暴击率": 0.0,
+    "暴击伤害": 0.0,
+    "暴击乘数": 1.0,
+    "防御区系数": 1.0,
+    "抗性区系数": 1.0,
+    "反应基础倍率": 1.0,
+    "反应加成系数": 0.0,
+    "元素精通": 0.0,
+    "无视防御%": 0.0,
+    "独立乘区%": 0.0,  # 对应规范 2.2 中的 【独立乘区%】
+    "倍率加值%": 0.0,  # 对应规范 2.2 中的 【倍率加值%】
+    # 月曜伤害专用槽位
+    "基础伤害提升": 0.0,  # 月曜基础伤害提升%
+    "月曜反应伤害提升": 0.0,  # 月曜反应造成的伤害提升%
+    "月曜伤害擢升": 0.0,  # 月曜伤害擢升%（独立乘区）
+}
+
+
 class DamageContext:
     """伤害计算上下文 (V2.5 审计状态机)。"""
 
@@ -18,26 +48,9 @@ class DamageContext:
         self.target = target
         self.config = damage.config
 
-        # 核心代数槽位 (根据 V2.5 审计规范定义)
-        self.stats: dict[str, float] = {
-            "固定伤害值加成": 0.0,
-            "伤害加成": 0.0,
-            "暴击率": 0.0,
-            "暴击伤害": 0.0,
-            "暴击乘数": 1.0,
-            "防御区系数": 1.0,
-            "抗性区系数": 1.0,
-            "反应基础倍率": 1.0,
-            "反应加成系数": 0.0,
-            "元素精通": 0.0,
-            "无视防御%": 0.0,
-            "独立乘区%": 0.0,  # 对应规范 2.2 中的 【独立乘区%】
-            "倍率加值%": 0.0,  # 对应规范 2.2 中的 【倍率加值%】
-            # 月曜伤害专用槽位
-            "基础伤害提升": 0.0,  # 月曜基础伤害提升%
-            "月曜反应伤害提升": 0.0,  # 月曜反应造成的伤害提升%
-            "月曜伤害擢升": 0.0,  # 月曜伤害擢升%（独立乘区）
-        }
+        # 核心代数槽位 (根据 V2.5 审计规范定义)，由模板拷贝得到
+        self.stats: dict[str, float] = _STAT_SLOTS.copy()
+        self.audit_level: str = _current_audit_level()
         self.audit_trail: list[ModifierRecord] = []
         self.final_result: float = 0.0
         self.is_crit: bool = False
@@ -56,14 +69,46 @@ class DamageContext:
         elif op == "SET":
             self.stats[stat] = value
 
-        if not audit:
+        if not audit or self.audit_level == AUDIT_OFF:
             return
 
-        from core.context import get_context
         m_id = 0
-        try:
-            m_id = get_context().get_next_modifier_id()
-        except Exception:
-            pass
+        if self.audit_level == AUDIT_FULL:
+            from core.context import get_context
+            try:
+                m_id = get_context().get_next_modifier_id()
+            except Exception:
+                pass
 
         self.audit_trail.append(ModifierRecord(m_id, source, stat, value, op))
+
+    def fork(self, damage: Damage, target: Any) -> DamageContext:
+        """以当前槽位与审计链为起点，派生针对另一目标的上下文。
+
+        用于多目标结算：攻击者侧阶段只执行一次，各目标从其结果继续。
+        """
+        forked = DamageContext.__new__(DamageContext)
+        forked.damage = damage
+        forked.source = self.source
+        forked.target = target
+        forked.config = damage.config
+        forked.stats = self.stats.copy()
+        forked.audit_level = self.audit_level
+        forked.audit_trail = list(self.audit_trail)
+        forked.final_result = 0.0
+        forked.is_crit = False
+        return forked
+
+    @property
+    def audit_enabled(self) -> bool:
+        """是否记录审计链。"""
+        return self.audit_level != AUDIT_OFF
+
+
+def _current_audit_level() -> str:
+    """读取当前仿真上下文的审计级别，无上下文时默认完整审计。"""
+    from core.context import get_context
+    try:
+        return get_context().audit_level
+    except Exception:
+        return AUDIT_FULL
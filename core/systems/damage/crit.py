@@ -0,0 +1,112 @@
+"""暴击结算模块。
+
+提供两种暴击结算模式（配置项 ``emulation.crit_mode``，仅在 ``emulation.open_critical`` 开启时生效）：
+- random: 按暴击率随机判定（默认）
+- expectation: 解析期望，暴击乘数取 1 + 暴击率 × 暴击伤害；单次运行即得到期望伤害
+"""
+
+from __future__ import annotations
+
+from itertools import product
+from typing import TYPE_CHECKING, Any
+
+from core.config import Config
+from core.rng import CRIT_STREAM
+from core.systems.utils import AttributeCalculator
+from core.tool import get_rng
+
+if TYPE_CHECKING:
+    from .context import DamageContext
+
+CRIT_MODE_RANDOM = "random"
+CRIT_MODE_EXPECTATION = "expectation"
+
+# 多组分期望按暴击组合精确枚举 (2^n)，超过该组分数时退化为逐组分期望加权
+MAX_EXACT_COMPONENTS = 10
+
+
+def resolve_crit(ctx: DamageContext) -> None:
+    """阶段四暴击结算：写入 ctx.stats["暴击乘数"]，并在 damage.data["crit_profile"] 记录暴击参数。"""
+    if not Config.get("emulation.open_critical"):
+        return
+
+    crit_rate = AttributeCalculator.get_final_crit_rate(ctx.source) + ctx.stats.get("暴击率", 0)
+    crit_dmg = AttributeCalculator.get_final_crit_dmg(ctx.source) + ctx.stats.get("暴击伤害", 0)
+    expectation = Config.get("emulation.crit_mode", CRIT_MODE_RANDOM) == CRIT_MODE_EXPECTATION
+
+    # 游戏内暴击率截断在 [0%, 100%]，暴击伤害不设上限
+    rate = min(max(crit_rate, 0.0), 100.0)
+    ctx.damage.data["crit_profile"] = {
+        "mode": CRIT_MODE_EXPECTATION if expectation else CRIT_MODE_RANDOM,
+        "crit_rate": rate,
+        "crit_dmg": crit_dmg,
+    }
+
+    if expectation:
+        # 期望乘数需进入审计链，以便审计回放得到与结算一致的暴击区
+        ctx.add_modifier("[暴击期望]", "暴击乘数", 1 + rate / 100.0 * crit_dmg / 100.0, "SET", audit=True)
+        return
+
+    if get_rng(CRIT_STREAM, ctx.source).uniform(0, 100) <= crit_rate:
+        ctx.is_crit = True
+        crit_mult = 1 + crit_dmg / 100.0
+    else:
+        crit_mult = 1.0
+
+    # 统一入口：通过 add_modifier 写入，但不入库
+    ctx.add_modifier(
+        source="[随机判定]",
+        stat="暴击乘数",
+        value=crit_mult,
+        op="SET",
+        audit=False,  # 暴击乘数不需要审计链记录
+    )
+
+
+def record_crit_outcomes(ctx: DamageContext) -> None:
+    """阶段五之后：由结算伤害反推非暴击 / 暴击两种结果。
+
+    结果写入 crit_profile，供暴击重采样等事后分析使用；
+    期望模式下同时写入审计链。
+    """
+    profile = ctx.damage.data.get("crit_profile")
+    if profile is None:
+        return
+
+    mult = ctx.stats.get("暴击乘数", 1.0)
+    non_crit = ctx.final_result / mult if mult else 0.0
+    crit = non_crit * (1 + profile["crit_dmg"] / 100.0)
+    profile["non_crit"] = non_crit
+    profile["crit"] = crit
+    if profile["mode"] == CRIT_MODE_EXPECTATION:
+        ctx.add_modifier("[暴击期望]", "非暴击伤害值", non_crit, "SET", audit=True)
+        ctx.add_modifier("[暴击期望]", "暴击伤害值", crit, "SET", audit=True)
+
+
+def expected_weighted_damage(
+    outcomes: list[tuple[float, float, float]],
+    weigh: Any,
+) -> float:
+    """计算加权求和伤害的精确期望。
+
+    加权求和按排序取权，对各组分的期望直接加权并不等于期望本身，
+    因此枚举全部暴击组合按概率累加。
+
+    Args:
+        outcomes: 各组分的 (非暴击伤害, 暴击伤害, 暴击率%)
+        weigh: 接收伤害值列表并返回加权结果的函数
+    """
+    if len(outcomes) > MAX_EXACT_COMPONENTS:
+        return weigh([nc + (c - nc) * p / 100.0 for nc, c, p in outcomes])
+
+    total = 0.0
+    for flags in product((False, True), repeat=len(outcomes)):
+        prob = 1.0
+        values = []
+        for hit, (nc, c, p) in zip(flags, outcomes):
+            rate = p / 100.0
+            prob *= rate if hit else 1.0 - rate
+            values.append(c if hit else nc)
+        if prob:
+            total += prob * weigh(values)
+    return total
@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Any
-import random
 
 from core.systems.utils import AttributeCalculator
-from core.event import GameEvent, EventType
+from core.systems.contract.stats import res_key
+from core.event import EventType, get_event_pool
 from core.mechanics.aura import Element
-from core.config import Config
 from core.tool import get_current_time, get_reaction_multiplier
 
 from .context import DamageContext
+from .crit import CRIT_MODE_EXPECTATION, expected_weighted_damage, record_crit_outcomes, resolve_crit
 
 if TYPE_CHECKING:
     from core.context import EventEngine
 
+_BEFORE_CALCULATE_POOL = get_event_pool(EventType.BEFORE_CALCULATE)
+
 
 class LunarDamagePipeline:
     """
@@ -76,11 +78,13 @@ class LunarDamagePipeline:
 
         # 阶段五：月曜伤害计算
         self._stage_5_synthesis(ctx)
+        record_crit_outcomes(ctx)
 
         # 交付结果
         ctx.damage.damage = ctx.final_result
         ctx.damage.is_crit = ctx.is_crit
-        ctx.damage.data["audit_trail"] = ctx.audit_trail
+        if ctx.audit_enabled:
+            ctx.damage.data["audit_trail"] = ctx.audit_trail
 
     def _run_multi_component(self, ctx: DamageContext, source_characters: list[Any]) -> None:
         """
@@ -106,6 +110,7 @@ class LunarDamagePipeline:
 
         damage_components: list[tuple[Any, float, ComponentDamageData]] = []
         contributions: list[CharacterContribution] = []
+        crit_outcomes: list[tuple[float, float, float]] = []
 
         for char in source_characters:
             # 为每个角色创建独立的 Damage 和 Context
@@ -141,6 +146,10 @@ class LunarDamagePipeline:
                 crit_dmg=component_ctx.stats.get("暴击伤害", 0.0),
             )
 
+            profile = dmg.data.get("crit_profile")
+            if profile is not None and profile["mode"] == CRIT_MODE_EXPECTATION:
+                crit_outcomes.append((profile["non_crit"], profile["crit"], profile["crit_rate"]))
+
             damage_components.append((char, dmg.damage, component_data))
             contributions.append(CharacterContribution(
                 character_name=char.name,
@@ -154,6 +163,10 @@ class LunarDamagePipeline:
             [(c, d, comp) for c, d, comp in damage_components]
         )
 
+        # 暴击期望模式：加权求和依赖排序，需对各组分的暴击组合求精确期望
+        if crit_outcomes and len(crit_outcomes) == len(damage_components):
+            final_damage = expected_weighted_damage(crit_outcomes, self._weighted_sum)
+
         # 按伤害值排序，设置权重
         sorted_components = sorted(damage_components, key=lambda x: x[1], reverse=True)
         for i, (char, dmg_val, comp_data) in enumerate(sorted_components):
@@ -187,10 +200,15 @@ class LunarDamagePipeline:
         Args:
             damage_components: 元组列表 (角色对象, 伤害值, 组分数据)
         """
-        if not damage_components:
+        return self._weighted_sum([d[1] for d in damage_components])
+
+    @staticmethod
+    def _weighted_sum(values: list[float]) -> float:
+        """按 最高 + 次高÷2 + 其余之和÷12 对伤害值加权求和。"""
+        if not values:
             return 0.0
 
-        damages = sorted([d[1] for d in damage_components], reverse=True)
+        damages = sorted(values, reverse=True)
 
         if len(damages) == 1:
             return damages[0]
@@ -234,13 +252,8 @@ class LunarDamagePipeline:
     def _stage_3_evolution(self, ctx: DamageContext) -> None:
         """阶段三：允许外部系统注入 Buff。"""
         if self.engine:
-            self.engine.publish(
-                GameEvent(
-                    EventType.BEFORE_CALCULATE,
-                    get_current_time(),
-                    source=ctx.source,
-                    data={"damage_context": ctx},
-                )
+            _BEFORE_CALCULATE_POOL.publish(
+                self.engine, get_current_time(), source=ctx.source, data={"damage_context": ctx}
             )
 
     def _stage_4_resolution(self, ctx: DamageContext) -> None:
@@ -249,28 +262,13 @@ class LunarDamagePipeline:
         self._resolve_resistance(ctx)
 
         # 2. 暴击预判定（月曜伤害可暴击）
-        if Config.get("emulation.open_critical"):
-            final_crit_rate = AttributeCalculator.get_final_crit_rate(ctx.source) + ctx.stats.get("暴击率", 0)
-            if random.uniform(0, 100) <= final_crit_rate:
-                ctx.is_crit = True
-                crit_dmg = AttributeCalculator.get_final_crit_dmg(ctx.source) + ctx.stats.get("暴击伤害", 0)
-                crit_mult = 1 + crit_dmg / 100.0
-            else:
-                crit_mult = 1.0
-
-            ctx.add_modifier(
-                source="[随机判定]",
-                stat="暴击乘数",
-                value=crit_mult,
-                op="SET",
-                audit=False,
-            )
+        resolve_crit(ctx)
 
     def _resolve_resistance(self, ctx: DamageContext) -> None:
         """计算抗性区系数。"""
         el = ctx.damage.element[0]
         el_name = el.value if isinstance(el, Element) else str(el)
-        final_res_val = AttributeCalculator.get_val_by_name(ctx.target, f"{el_name}元素抗性") / 100.0
+        final_res_val = AttributeCalculator.get_val_by_name(ctx.target, res_key(el_name)) / 100.0
 
         if final_res_val < 0:
             coeff_res = 1.0 - final_res_val / 2.0
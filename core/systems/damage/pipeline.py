@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 from typing import Any, cast, TYPE_CHECKING
-import random
 
 from core.systems.utils import AttributeCalculator
-from core.event import GameEvent, EventType
+from core.systems.contract.stats import res_key
+from core.event import EventType, get_event_pool
 from core.mechanics.aura import Element
-from core.config import Config
 from core.tool import get_current_time
 from core.action.attack_tag_resolver import AttackTagResolver
+from core.entities.base_entity import CombatEntity
 
 from .context import DamageContext
+from .crit import record_crit_outcomes, resolve_crit
 
 if TYPE_CHECKING:
     from core.context import EventEngine
 
+_BEFORE_CALCULATE_POOL = get_event_pool(EventType.BEFORE_CALCULATE)
+
 
 class DamagePipeline:
     """[V2.5.5] 严格对齐审计规范的五阶段伤害流水线。"""
@@ -31,6 +34,51 @@ class DamagePipeline:
         # 阶段二：基础面板与契约快照 (Foundation)
         self._stage_2_foundation(ctx)
 
+        self._resolve_target(ctx)
+
+    def run_targets(self, ctx: DamageContext, targets: list[Any]) -> list[DamageContext]:
+        """[V3.3] 同一次攻击对多个目标分别结算。
+
+        攻击者侧的基础面板与契约快照 (阶段二) 只执行一次；首个目标沿用 ctx
+        与其伤害对象，其余目标派生独立的伤害对象与上下文，再各自完成受击、
+        增益注入、环境结算与合算。阶段三仍按目标发布，因为部分增益依赖目标状态
+        (如粉碎之冰)。
+
+        Args:
+            ctx: 待结算的伤害上下文，其伤害对象作为各目标结算的模板。
+            targets: 命中目标列表。
+
+        Returns:
+            list[DamageContext]: 与 targets 一一对应的已结算上下文。
+        """
+        if not targets:
+            return []
+
+        ctx.damage.set_source(ctx.source)
+        self._stage_2_foundation(ctx)
+
+        # 先派生全部上下文，避免首个目标的阶段三修改被后续目标继承
+        results = [ctx] + [ctx.fork(ctx.damage.fork(), target) for target in targets[1:]]
+        ctx.target = targets[0]
+        for target_ctx in results:
+            target = target_ctx.target
+            target_ctx.damage.set_target(target)
+            # 与 broadcast_damage 一致：只有 CombatEntity 才能处理伤害
+            if isinstance(target, CombatEntity):
+                target.handle_damage(target_ctx.damage)
+            self._resolve_target(target_ctx)
+        return results
+
+    def hit_targets(self, ctx: DamageContext) -> list[Any]:
+        """[V3.3] 解析未指定目标的伤害的命中目标 (按判定框与选取策略)。"""
+        from core.context import get_context
+        sim_ctx = get_context()
+        if not sim_ctx.space:
+            return []
+        return sim_ctx.space.resolve_damage_targets(ctx.source, ctx.damage)
+
+    def _resolve_target(self, ctx: DamageContext):
+        """目标侧阶段：增益注入、环境结算、合算与结果交付。"""
         # 阶段三：动态增益注入 (Evolution)
         self._stage_3_evolution(ctx)
 
@@ -39,11 +87,13 @@ class DamagePipeline:
 
         # 阶段五：终期聚合 (Synthesis)
         self._stage_5_synthesis(ctx)
+        record_crit_outcomes(ctx)
 
         # 交付结果
         ctx.damage.damage = ctx.final_result
         ctx.damage.is_crit = ctx.is_crit  # 同步暴击状态
-        ctx.damage.data["audit_trail"] = ctx.audit_trail
+        if ctx.audit_enabled:
+            ctx.damage.data["audit_trail"] = ctx.audit_trail
 
     def _stage_1_preparation(self, ctx: DamageContext) -> bool:
         ctx.damage.set_source(ctx.source)
@@ -93,13 +143,8 @@ class DamagePipeline:
 
     def _stage_3_evolution(self, ctx: DamageContext):
         """阶段三：允许外部系统注入 Buff。"""
-        self.engine.publish(
-            GameEvent(
-                EventType.BEFORE_CALCULATE,
-                get_current_time(),
-                source=ctx.source,
-                data={"damage_context": ctx},
-            )
+        _BEFORE_CALCULATE_POOL.publish(
+            self.engine, get_current_time(), source=ctx.source, data={"damage_context": ctx}
         )
 
     def _stage_4_resolution(self, ctx: DamageContext):
@@ -115,24 +160,8 @@ class DamagePipeline:
         # 2. 防御与抗性
         self._resolve_def_res_coeffs(ctx)
 
-        # 3. 暴击预判定
-        if Config.get("emulation.open_critical"):
-            final_crit_rate = AttributeCalculator.get_final_crit_rate(ctx.source) + ctx.stats.get("暴击率", 0)
-            if random.uniform(0, 100) <= final_crit_rate:
-                ctx.is_crit = True
-                crit_dmg = AttributeCalculator.get_final_crit_dmg(ctx.source) + ctx.stats.get("暴击伤害", 0)
-                crit_mult = 1 + crit_dmg / 100.0
-            else:
-                crit_mult = 1.0
-
-            # 统一入口：通过 add_modifier 写入，但不入库
-            ctx.add_modifier(
-                source="[随机判定]",
-                stat="暴击乘数",
-                value=crit_mult,
-                op="SET",
-                audit=False,  # 暴击乘数不需要审计链记录
-            )
+        # 3. 暴击预判定 (随机判定 / 解析期望)
+        resolve_crit(ctx)
 
     def _resolve_def_res_coeffs(self, ctx: DamageContext):
         # 防御区：统一处理减防和无视防御
@@ -158,7 +187,7 @@ class DamagePipeline:
         # 抗性区：AttributeCalculator 已返回包含减抗效果的最终抗性值
         el = ctx.damage.element[0]
         el_name = el.value if isinstance(el, Element) else str(el)
-        final_res_val = AttributeCalculator.get_val_by_name(ctx.target, f"{el_name}元素抗性") / 100.0
+        final_res_val = AttributeCalculator.get_val_by_name(ctx.target, res_key(el_name)) / 100.0
 
         if final_res_val < 0:
             coeff_res = 1.0 - final_res_val / 2.0
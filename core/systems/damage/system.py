@@ -40,22 +40,7 @@ class DamageSystem(GameSystem):
             # 检查是否跳过计算（已预计算的伤害）
             if dmg.data.get("skip_damage_calculation"):
                 # 只执行日志和后续事件，跳过计算
-                if dmg.target:
-                    get_emulation_logger().log_damage(char, dmg.target, dmg)
-                    if self.engine:
-                        self.engine.publish(
-                            GameEvent(
-                                event_type=EventType.AFTER_DAMAGE,
-                                frame=event.frame,
-                                source=char,
-                                data={
-                                    "character": char,
-                                    "target": dmg.target,
-                                    "target_id": getattr(dmg.target, "entity_id", None),
-                                    "damage": dmg
-                                },
-                            )
-                        )
+                self._deliver(char, dmg, event.frame)
                 return
 
             # 判断使用哪个流水线
@@ -64,25 +49,44 @@ class DamageSystem(GameSystem):
                 dmg.config.extra_attack_tags
             )
 
+            # [V3.3] 多目标 (显式 targets 或范围攻击命中多个目标)：
+            # 攻击者侧快照只结算一次，逐目标交付
+            if not is_lunar and hasattr(self, "pipeline"):
+                targets = event.data.get("targets")
+                if targets is None and target is None:
+                    hits = self.pipeline.hit_targets(ctx)
+                    if len(hits) > 1:
+                        targets = hits
+                    elif hits:
+                        ctx.target = hits[0]
+                if targets:
+                    for target_ctx in self.pipeline.run_targets(ctx, targets):
+                        self._deliver(char, target_ctx.damage, event.frame)
+                    return
+
             if hasattr(self, "pipeline"):
                 if is_lunar:
                     self.lunar_pipeline.run(ctx)
                 else:
                     self.pipeline.run(ctx)
 
-            if dmg.target:
-                get_emulation_logger().log_damage(char, dmg.target, dmg)
-                if self.engine:
-                    self.engine.publish(
-                        GameEvent(
-                            event_type=EventType.AFTER_DAMAGE,
-                            frame=event.frame,
-                            source=char,
-                            data={
-                                "character": char,
-                                "target": dmg.target,
-                                "target_id": getattr(dmg.target, "entity_id", None),
-                                "damage": dmg
-                            },
-                        )
+            self._deliver(char, dmg, event.frame)
+
+    def _deliver(self, char: Any, dmg: Damage, frame: int) -> None:
+        """记录伤害日志并发布 AFTER_DAMAGE。"""
+        if dmg.target:
+            get_emulation_logger().log_damage(char, dmg.target, dmg)
+            if self.engine:
+                self.engine.publish(
+                    GameEvent(
+                        event_type=EventType.AFTER_DAMAGE,
+                        frame=frame,
+                        source=char,
+                        data={
+                            "character": char,
+                            "target": dmg.target,
+                            "target_id": getattr(dmg.target, "entity_id", None),
+                            "damage": dmg
+                        },
                     )
+                )
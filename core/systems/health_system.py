@@ -3,11 +3,14 @@ from typing import Any
 
 from core.systems.contract.healing import Healing
 from core.context import EventEngine
-from core.event import EventType, GameEvent
+from core.event import EventType, GameEvent, get_event_pool
 from core.logger import get_emulation_logger
 from core.systems.base_system import GameSystem
 from core.systems.utils import AttributeCalculator
 
+# 生命值变动事件被帧缓冲区捕获，其 data 字典每次新建，仅复用事件实例
+_HEALTH_CHANGE_POOL = get_event_pool(EventType.AFTER_HEALTH_CHANGE)
+
 
 class HealingCalculator:
     """
@@ -105,13 +108,11 @@ class HealthSystem(GameSystem):
             )
         # 5. 发布生命值变动事件 (V2.5 投影器必需)
         if self.engine:
-            self.engine.publish(
-                GameEvent(
-                    event_type=EventType.AFTER_HEALTH_CHANGE,
-                    frame=event.frame,
-                    source=target,
-                    data={"character": target, "new_hp": getattr(target, "current_hp", 0)}
-                )
+            _HEALTH_CHANGE_POOL.publish(
+                self.engine,
+                event.frame,
+                source=target,
+                data={"character": target, "new_hp": getattr(target, "current_hp", 0)},
             )
 
     def _handle_hurt(self, event: GameEvent) -> None:
@@ -154,11 +155,9 @@ class HealthSystem(GameSystem):
             )
         # 4. 发布生命值变动事件 (V2.5 投影器必需)
         if self.engine:
-            self.engine.publish(
-                GameEvent(
-                    event_type=EventType.AFTER_HEALTH_CHANGE,
-                    frame=event.frame,
-                    source=target,
-                    data={"character": target, "new_hp": getattr(target, "current_hp", 0)}
-                )
+            _HEALTH_CHANGE_POOL.publish(
+                self.engine,
+                event.frame,
+                source=target,
+                data={"character": target, "new_hp": getattr(target, "current_hp", 0)},
             )
@@ -336,6 +336,17 @@ class LunarReactionSystem(GameSystem):
         """每帧更新。"""
         self.update_grass_dew(dt)
 
+    def next_wakeup(self, frame: int) -> float:
+        """[快进协议] 草露恢复为纯累积过程，空闲帧内无需唤醒。"""
+        return float("inf")
+
+    def fast_forward(self, frames: int, dt: float = 1 / 60) -> None:
+        """[快进协议] 逐帧重放草露累积，保证浮点结果与逐帧驱动一致。"""
+        for _ in range(frames):
+            if not self.grass_dew_recovery_active:
+                break
+            self.update_grass_dew(dt)
+
     # ================================
     # 事件回调
     # ================================
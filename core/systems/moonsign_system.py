@@ -10,8 +10,10 @@ from typing import Any
 from core.systems.base_system import GameSystem
 from core.systems.utils import AttributeCalculator
 from core.event import GameEvent, EventType
+from core.effect.store import EffectStore
 from core.effect.common import MoonsignTalent, MoonsignNascentEffect, MoonsignAscendantEffect
 from core.action.attack_tag_resolver import AttackTagResolver
+from core.timer_wheel import TimerHandle
 
 
 class MoonsignSystem(GameSystem):
@@ -41,8 +43,34 @@ class MoonsignSystem(GameSystem):
         # 非月兆角色增益
         self.non_moonsign_bonus: float = 0.0
         self.non_moonsign_source: Any = None
-        self.non_moonsign_timer: int = 0  # 剩余帧数 (20秒 = 1200帧)
-        self.non_moonsign_duration: int = 1200
+        self.non_moonsign_duration: int = 1200  # 20秒 = 1200帧
+        # [V3.3] 增益以到期帧记录并登记到时间轮，不再逐帧递减
+        self.non_moonsign_expire_frame: int = 0
+        self._non_moonsign_handle: TimerHandle | None = None
+
+    @property
+    def non_moonsign_timer(self) -> int:
+        """非月兆增益剩余帧数，由到期帧与当前帧推算。"""
+        return max(0, self.non_moonsign_expire_frame - self._now())
+
+    @non_moonsign_timer.setter
+    def non_moonsign_timer(self, frames: int) -> None:
+        timers = getattr(self.context, "timers", None)
+        if timers is not None:
+            timers.cancel(self._non_moonsign_handle)
+        self._non_moonsign_handle = None
+        self.non_moonsign_expire_frame = self._now() + max(0, frames)
+        if timers is not None and frames > 0:
+            self._non_moonsign_handle = timers.schedule(
+                self.non_moonsign_expire_frame, self._on_non_moonsign_expired
+            )
+
+    def _now(self) -> int:
+        return getattr(self.context, "current_frame", 0)
+
+    def _on_non_moonsign_expired(self) -> None:
+        """[时间轮回调] 非月兆增益到期。"""
+        self._non_moonsign_handle = None
 
     def initialize(self, context: Any) -> None:
         """初始化系统，检测月兆角色并应用效果。"""
@@ -54,7 +82,6 @@ class MoonsignSystem(GameSystem):
         engine.subscribe(EventType.AFTER_SKILL, self)
         engine.subscribe(EventType.AFTER_BURST, self)
         engine.subscribe(EventType.BEFORE_CALCULATE, self)
-        engine.subscribe(EventType.FRAME_END, self)
 
     def handle_event(self, event: GameEvent) -> None:
         """事件处理。"""
@@ -64,8 +91,6 @@ class MoonsignSystem(GameSystem):
             self._on_skill_or_burst(event)
         elif event.event_type == EventType.BEFORE_CALCULATE:
             self._on_before_calculate(event)
-        elif event.event_type == EventType.FRAME_END:
-            self.on_frame_update()
 
     # ================================
     # 月兆等级管理（初始化时确定）
@@ -212,16 +237,6 @@ class MoonsignSystem(GameSystem):
                 audit=True,
             )
 
-    # ================================
-    # 每帧更新
-    # ================================
-
-    def on_frame_update(self, dt: float = 1 / 60) -> None:
-        """每帧更新。"""
-        # 更新非月兆增益计时器
-        if self.non_moonsign_timer > 0:
-            self.non_moonsign_timer -= 1
-
     # ================================
     # 公共查询接口
     # ================================
@@ -237,14 +252,20 @@ class MoonsignSystem(GameSystem):
 
     def has_nascent(self, character: Any) -> bool:
         """检查角色是否拥有月兆·初辉效果。"""
-        for effect in getattr(character, 'active_effects', []):
+        effects = getattr(character, 'active_effects', [])
+        if isinstance(effects, EffectStore):
+            return effects.first_of_type(MoonsignNascentEffect) is not None
+        for effect in effects:
             if isinstance(effect, MoonsignNascentEffect):
                 return True
         return False
 
     def has_ascendant(self, character: Any) -> bool:
         """检查角色是否拥有月兆·满辉效果。"""
-        for effect in getattr(character, 'active_effects', []):
+        effects = getattr(character, 'active_effects', [])
+        if isinstance(effects, EffectStore):
+            return effects.first_of_type(MoonsignAscendantEffect) is not None
+        for effect in effects:
             if isinstance(effect, MoonsignAscendantEffect):
                 return True
         return False
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
 from typing import Any, TYPE_CHECKING
 
 from core.systems.base_system import GameSystem
@@ -12,7 +11,24 @@ from core.registry import RuleTypeMap
 from core.logger import get_emulation_logger
 
 if TYPE_CHECKING:
-    from core.context import EventEngine
+    from core.context import EventEngine, SimulationContext
+
+
+class RuleEventHandler:
+    """
+    订阅模式规则的事件处理器。
+
+    以对象 (而非闭包) 持有规则参数与仿真上下文：检查点深拷贝时随上下文一并复制，
+    分叉出的子模拟器中规则作用于子上下文，而不会回写父模拟器。
+    """
+
+    def __init__(self, rule_type: RuleTypeBase, params: dict[str, Any], context: SimulationContext) -> None:
+        self.rule_type = rule_type
+        self.params = params
+        self.context = context
+
+    def handle_event(self, event: Any) -> None:
+        self.rule_type.on_event(event, self.params, self.context)
 
 
 class RuleSystem(GameSystem):
@@ -27,7 +43,7 @@ class RuleSystem(GameSystem):
         super().__init__()
         self._logger = get_emulation_logger()
         self._instances: list[RuleInstance] = []
-        self._subscriptions: dict[str, Callable] = {}
+        self._subscriptions: dict[str, RuleEventHandler] = {}
         self._applied: bool = False
 
     def register_events(self, engine: EventEngine) -> None:
@@ -122,11 +138,7 @@ class RuleSystem(GameSystem):
         if not event_type:
             return
 
-        ctx = self.context  # 捕获以供闭包使用
-
-        def handler(event: Any) -> None:
-            rule_type.on_event(event, instance.params, ctx)
-
+        handler = RuleEventHandler(rule_type, instance.params, self.context)
         self.engine.subscribe(event_type, handler)
         key = f"{instance.instance_id}:{event_type}"
         self._subscriptions[key] = handler
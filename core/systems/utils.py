@@ -1,6 +1,13 @@
 from __future__ import annotations
 from typing import Any
 
+from core.systems.contract.stats import DMG_BONUS_KEYS, STATS
+
+# 热路径使用的属性 ID
+_ATK, _ATK_PCT, _ATK_FLAT = (STATS.intern(n) for n in ("攻击力", "攻击力%", "固定攻击力"))
+_HP, _HP_PCT, _HP_FLAT = (STATS.intern(n) for n in ("生命值", "生命值%", "固定生命值"))
+_DEF, _DEF_PCT, _DEF_FLAT = (STATS.intern(n) for n in ("防御力", "防御力%", "固定防御力"))
+
 class AttributeCalculator:
     """
     [V2.4] 统一属性合算工具。
@@ -10,20 +17,9 @@ class AttributeCalculator:
     @staticmethod
     def get_val_by_name(entity: Any, stat_name: str) -> float:
         """[V2.5] 根据属性名动态获取合算值"""
-        mapping = {
-            "攻击力": AttributeCalculator.get_final_atk,
-            "生命值": AttributeCalculator.get_final_hp,
-            "防御力": AttributeCalculator.get_final_def,
-            "元素精通": AttributeCalculator.get_final_em,
-            "暴击率": AttributeCalculator.get_final_crit_rate,
-            "暴击伤害": AttributeCalculator.get_final_crit_dmg,
-            "元素充能效率": AttributeCalculator.get_final_er,
-            "治疗加成": AttributeCalculator.get_final_healing_bonus,
-            "受治疗加成": AttributeCalculator.get_final_incoming_healing_bonus,
-            "护盾强效": AttributeCalculator.get_final_shield_strength,
-        }
-        if stat_name in mapping:
-            return mapping[stat_name](entity)
+        getter = _FINAL_GETTERS.get(stat_name)
+        if getter is not None:
+            return getter(entity)
         
         # 针对抗性类属性的动态路由
         if "抗性" in stat_name:
@@ -31,54 +27,79 @@ class AttributeCalculator:
             
         return float(entity.attribute_data.get(stat_name, 0.0))
 
+    @staticmethod
+    def get_stat_modifiers(entity: Any, stat_name: str) -> list[Any]:
+        """获取作用于指定属性的修饰符 (按注入顺序)。优先使用实体的属性索引。"""
+        index = getattr(entity, '_modifiers_by_stat', None)
+        if index is not None:
+            return index.get(stat_name, [])
+        return [m for m in getattr(entity, 'dynamic_modifiers', []) if m.stat == stat_name]
+
+    @staticmethod
+    def get_stat_total(entity: Any, stat: str | int, default: float = 0.0) -> float:
+        """
+        [V3.3] 基础值与该属性全部修饰符之和 (按注入顺序累加)。
+
+        具备属性索引的实体 (CombatEntity) 以 (基础值, 属性版本号) 为键缓存结果，
+        仅在该属性的基础值或修饰符变化时重新累加。
+
+        Args:
+            stat: 属性名或属性 ID (见 core.systems.contract.stats.STATS)。
+        """
+        if isinstance(stat, int):
+            sid, stat_name = stat, STATS.names[stat]
+        else:
+            sid, stat_name = STATS.intern(stat), stat
+
+        base = float(entity.attribute_data.get(stat_name, default))
+        totals = getattr(entity, '_stat_totals', None)
+        if totals is None:
+            val = base
+            for m in getattr(entity, 'dynamic_modifiers', []):
+                if m.stat == stat_name:
+                    val += m.value
+            return val
+
+        if sid >= len(totals):
+            entity.ensure_stat_slots(sid)
+        version = entity._stat_versions[sid]
+        cached = totals[sid]
+        if cached is not None and cached[0] == base and cached[1] == version:
+            return cached[2]
+
+        val = base
+        for m in entity._modifiers_by_stat.get(stat_name, ()):
+            val += m.value
+        totals[sid] = (base, version, val)
+        return val
+
     @staticmethod
     def get_final_atk(entity: Any) -> float:
         """合算最终攻击力"""
-        base = float(entity.attribute_data.get('攻击力', 0.0))
-        percent = float(entity.attribute_data.get('攻击力%', 0.0))
-        flat = float(entity.attribute_data.get('固定攻击力', 0.0))
-        
-        for m in getattr(entity, 'dynamic_modifiers', []):
-            if m.stat == '攻击力%':
-                percent += m.value
-            elif m.stat == '固定攻击力':
-                flat += m.value
-            elif m.stat == '攻击力':
-                base += m.value
-        
+        total = AttributeCalculator.get_stat_total
+        base = total(entity, _ATK)
+        percent = total(entity, _ATK_PCT)
+        flat = total(entity, _ATK_FLAT)
+
         return base * (1 + percent / 100) + flat
 
     @staticmethod
     def get_final_hp(entity: Any) -> float:
         """合算最终生命值"""
-        base = float(entity.attribute_data.get('生命值', 0.0))
-        percent = float(entity.attribute_data.get('生命值%', 0.0))
-        flat = float(entity.attribute_data.get('固定生命值', 0.0))
-        
-        for m in getattr(entity, 'dynamic_modifiers', []):
-            if m.stat == '生命值%':
-                percent += m.value
-            elif m.stat == '固定生命值':
-                flat += m.value
-            elif m.stat == '生命值':
-                base += m.value
-        
+        total = AttributeCalculator.get_stat_total
+        base = total(entity, _HP)
+        percent = total(entity, _HP_PCT)
+        flat = total(entity, _HP_FLAT)
+
         return base * (1 + percent / 100) + flat
 
     @staticmethod
     def get_final_def(entity: Any) -> float:
         """合算最终防御力（含减防效果）"""
-        base = float(entity.attribute_data.get('防御力', 0.0))
-        percent = float(entity.attribute_data.get('防御力%', 0.0))
-        flat = float(entity.attribute_data.get('固定防御力', 0.0))
-
-        for m in getattr(entity, 'dynamic_modifiers', []):
-            if m.stat == '防御力%':
-                percent += m.value
-            elif m.stat == '固定防御力':
-                flat += m.value
-            elif m.stat == '防御力':
-                base += m.value
+        total = AttributeCalculator.get_stat_total
+        base = total(entity, _DEF)
+        percent = total(entity, _DEF_PCT)
+        flat = total(entity, _DEF_FLAT)
 
         return base * (1 + percent / 100) + flat
 
@@ -92,24 +113,19 @@ class AttributeCalculator:
             - 面板防御力：base * (1 + 正值防御力%/100) + flat
             - 减防百分比：所有负值防御力%的绝对值之和
         """
-        base = float(entity.attribute_data.get('防御力', 0.0))
+        base = AttributeCalculator.get_stat_total(entity, _DEF)
         percent = float(entity.attribute_data.get('防御力%', 0.0))
-        flat = float(entity.attribute_data.get('固定防御力', 0.0))
+        flat = AttributeCalculator.get_stat_total(entity, _DEF_FLAT)
 
         # 分离正值（面板加成）和负值（减防）
         positive_percent = max(0, percent)
         reduction_pct = 0.0
 
-        for m in getattr(entity, 'dynamic_modifiers', []):
-            if m.stat == '防御力%':
-                if m.value >= 0:
-                    positive_percent += m.value
-                else:
-                    reduction_pct += abs(m.value)
-            elif m.stat == '固定防御力':
-                flat += m.value
-            elif m.stat == '防御力':
-                base += m.value
+        for m in AttributeCalculator.get_stat_modifiers(entity, '防御力%'):
+            if m.value >= 0:
+                positive_percent += m.value
+            else:
+                reduction_pct += abs(m.value)
 
         panel_def = base * (1 + positive_percent / 100) + flat
         return panel_def, reduction_pct
@@ -117,96 +133,73 @@ class AttributeCalculator:
     @staticmethod
     def get_final_em(entity: Any) -> float:
         """合算最终元素精通"""
-        val = float(entity.attribute_data.get('元素精通', 0.0))
-        for m in getattr(entity, 'dynamic_modifiers', []):
-            if m.stat == '元素精通':
-                val += m.value
-        return val
+        return AttributeCalculator.get_stat_total(entity, '元素精通', 0.0)
 
     @staticmethod
     def get_final_crit_rate(entity: Any) -> float:
         """合算最终暴击率 (%)"""
-        val = float(entity.attribute_data.get('暴击率', 5.0))
-        for m in getattr(entity, 'dynamic_modifiers', []):
-            if m.stat == '暴击率':
-                val += m.value
-        return val
+        return AttributeCalculator.get_stat_total(entity, '暴击率', 5.0)
 
     @staticmethod
     def get_final_crit_dmg(entity: Any) -> float:
         """合算最终暴击伤害 (%)"""
-        val = float(entity.attribute_data.get('暴击伤害', 50.0))
-        for m in getattr(entity, 'dynamic_modifiers', []):
-            if m.stat == '暴击伤害':
-                val += m.value
-        return val
+        return AttributeCalculator.get_stat_total(entity, '暴击伤害', 50.0)
 
     @staticmethod
     def get_final_er(entity: Any) -> float:
         """合算最终元素充能效率 (%)"""
-        val = float(entity.attribute_data.get('元素充能效率', 100.0))
-        for m in getattr(entity, 'dynamic_modifiers', []):
-            if m.stat == '元素充能效率':
-                val += m.value
-        return val
+        return AttributeCalculator.get_stat_total(entity, '元素充能效率', 100.0)
 
     @staticmethod
     def get_final_healing_bonus(entity: Any) -> float:
         """合算最终治疗加成 (%)"""
-        val = float(entity.attribute_data.get('治疗加成', 0.0))
-        for m in getattr(entity, 'dynamic_modifiers', []):
-            if m.stat == '治疗加成':
-                val += m.value
-        return val
+        return AttributeCalculator.get_stat_total(entity, '治疗加成', 0.0)
 
     @staticmethod
     def get_final_incoming_healing_bonus(entity: Any) -> float:
         """合算最终受治疗加成 (%)"""
-        val = float(entity.attribute_data.get('受治疗加成', 0.0))
-        for m in getattr(entity, 'dynamic_modifiers', []):
-            if m.stat == '受治疗加成':
-                val += m.value
-        return val
+        return AttributeCalculator.get_stat_total(entity, '受治疗加成', 0.0)
 
     @staticmethod
     def get_final_shield_strength(entity: Any) -> float:
         """合算最终护盾强效 (%)"""
-        val = float(entity.attribute_data.get('护盾强效', 0.0))
-        for m in getattr(entity, 'dynamic_modifiers', []):
-            if m.stat == '护盾强效':
-                val += m.value
-        return val
+        return AttributeCalculator.get_stat_total(entity, '护盾强效', 0.0)
 
     @staticmethod
     def get_final_res(entity: Any, stat_name: str) -> float:
         """合算最终抗性 (%)"""
-        val = float(entity.attribute_data.get(stat_name, 10.0))
-        for m in getattr(entity, 'dynamic_modifiers', []):
-            if m.stat == stat_name:
-                val += m.value
-        return val
+        return AttributeCalculator.get_stat_total(entity, stat_name, 10.0)
 
     @staticmethod
     def get_final_damage_bonus(entity: Any, element_name: str | None = None) -> float:
         """
         合算最终伤害加成 (%)。
         """
-        bonus = float(entity.attribute_data.get('伤害加成', 0.0))
-        for m in getattr(entity, 'dynamic_modifiers', []):
-            if m.stat == '伤害加成':
-                bonus += m.value
+        bonus = AttributeCalculator.get_stat_total(entity, '伤害加成')
 
-        if element_name and element_name not in ("无", "物理"):
-            key = f"{element_name}元素伤害加成"
-            bonus += float(entity.attribute_data.get(key, 0.0))
-            for m in getattr(entity, 'dynamic_modifiers', []):
-                if m.stat == key:
-                    bonus += m.value
-        elif element_name == "物理":
-            key = "物理伤害加成"
+        key = None
+        if element_name and element_name != "无":
+            key = DMG_BONUS_KEYS.get(element_name) or f"{element_name}元素伤害加成"
+
+        if key is not None:
+            # 逐项累加到总加成上 (保持与逐条合算一致的浮点结果)
             bonus += float(entity.attribute_data.get(key, 0.0))
-            for m in getattr(entity, 'dynamic_modifiers', []):
-                if m.stat == key:
-                    bonus += m.value
+            for m in AttributeCalculator.get_stat_modifiers(entity, key):
+                bonus += m.value
 
         return bonus
+
+
+# 属性名 -> 合算函数 (get_val_by_name 的分派表)
+_FINAL_GETTERS = {
+    "攻击力": AttributeCalculator.get_final_atk,
+    "生命值": AttributeCalculator.get_final_hp,
+    "防御力": AttributeCalculator.get_final_def,
+    "元素精通": AttributeCalculator.get_final_em,
+    "暴击率": AttributeCalculator.get_final_crit_rate,
+    "暴击伤害": AttributeCalculator.get_final_crit_dmg,
+    "元素充能效率": AttributeCalculator.get_final_er,
+    "治疗加成": AttributeCalculator.get_final_healing_bonus,
+    "受治疗加成": AttributeCalculator.get_final_incoming_healing_bonus,
+    "护盾强效": AttributeCalculator.get_final_shield_strength,
+}
@@ -74,6 +74,10 @@ class Target(CombatEntity):
         })
         return data
 
+    def _state_signature(self) -> tuple:
+        """扩展等级签名 (抗性已包含在属性面板签名中)。"""
+        return super()._state_signature() + (self.level,)
+
     def export_state(self) -> dict[str, Any]:
         """导出目标的实时仿真状态快照。
 
@@ -2,6 +2,7 @@ from typing import Any
 
 from character.character import Character
 from core.event import GameEvent, EventType
+from core.timer_wheel import TimerHandle
 from core.tool import get_current_time
 
 
@@ -25,7 +26,9 @@ class Team:
         self.active_index: int = 0
 
         self.swap_cd: int = 60
-        self.swap_cd_timer: int = 0
+        # [V3.3] 切换 CD 以就绪帧记录并登记到时间轮，不再逐帧递减
+        self.swap_ready_frame: int = 0
+        self._swap_cd_handle: TimerHandle | None = None
 
         # 初始化状态
         for char in self.members:
@@ -41,6 +44,28 @@ class Team:
             return self.members[self.active_index]
         return None
 
+    @property
+    def swap_cd_timer(self) -> int:
+        """切换 CD 剩余帧数，由就绪帧与当前帧推算。"""
+        return max(0, self.swap_ready_frame - self._now())
+
+    @swap_cd_timer.setter
+    def swap_cd_timer(self, frames: int) -> None:
+        timers = self.ctx.timers if self.ctx else None
+        if timers is not None:
+            timers.cancel(self._swap_cd_handle)
+        self._swap_cd_handle = None
+        self.swap_ready_frame = self._now() + max(0, frames)
+        if timers is not None and frames > 0:
+            self._swap_cd_handle = timers.schedule(self.swap_ready_frame, self._on_swap_ready)
+
+    def _now(self) -> int:
+        return self.ctx.current_frame if self.ctx else 0
+
+    def _on_swap_ready(self) -> None:
+        """[时间轮回调] 切换 CD 结束，同时作为指令调度的唤醒点。"""
+        self._swap_cd_handle = None
+
     def get_members(self) -> list[Character]:
         """获取全队成员 (包含后台)。"""
         return self.members
@@ -96,16 +121,35 @@ class Team:
         )
 
     def on_frame_update(self) -> None:
-        """驱动编队相关的每帧逻辑，并同步驱动所有队员。"""
-        # 1. 驱动队伍自身状态 (如切换 CD)
-        if self.swap_cd_timer > 0:
-            self.swap_cd_timer -= 1
-
-        # 2. 统一驱动所有队员 (场上/场下角色)
+        """驱动全体队员的每帧逻辑 (切换 CD 由时间轮计时)。"""
+        # 统一驱动所有队员 (场上/场下角色)
         for char in self.members:
             # 使用 on_frame_update() 确保基类中的生命周期与帧数自增逻辑被执行
             char.on_frame_update()
 
+    def next_wakeup(self, frame: int) -> float:
+        """[快进协议] 汇总全体队员的下一唤醒帧 (切换 CD 由调度方单独处理)。"""
+        from core.tool import get_next_wakeup
+
+        wake = float("inf")
+        for char in self.members:
+            wake = min(wake, get_next_wakeup(char, frame, "on_frame_update", "_perform_tick"))
+            if wake <= frame + 1:
+                break
+        return wake
+
+    def next_action_wakeup(self, frame: int) -> float:
+        """[快进协议] 仅汇总各队员动作状态机的唤醒帧，作为完整查询前的廉价预检。"""
+        wake = float("inf")
+        for char in self.members:
+            wake = min(wake, char.action_manager.next_wakeup(frame))
+        return wake
+
+    def fast_forward(self, frames: int) -> None:
+        """[快进协议] 推进全体队员的空闲帧。"""
+        for char in self.members:
+            char.fast_forward(frames)
+
     @property
     def is_any_character_busy(self) -> bool:
         """检查是否有角色正在执行动作。"""
@@ -0,0 +1,240 @@
+"""[V3.3] 分层时间轮调度服务。
+
+为帧倒计时提供统一的唤醒登记：组件登记到期帧与回调，主循环每帧只处理
+实际到期的定时器，开销与到期事件数相关，而与存活定时器数量无关。
+
+结构 (以帧为单位):
+- 第 0 层：当前 256 帧区块内的逐帧槽位；
+- 第 1 层：其后 64 个区块 (约 273 秒) 的区块槽位，进入区块时下放到第 0 层；
+- 溢出堆：更远的定时器，进入第 1 层范围时迁入。
+各层以位图记录非空槽位，查询下一到期帧无需扫描空槽。
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable
+
+_L0_BITS = 8
+_L0_SIZE = 1 << _L0_BITS  # 256 帧
+_L0_MASK = _L0_SIZE - 1
+_L1_SIZE = 64
+
+
+class TimerHandle:
+    """定时器句柄，用于取消或查询到期帧。"""
+
+    __slots__ = ("due", "seq", "callback", "cancelled", "_slot")
+
+    def __init__(self, due: int, seq: int, callback: Callable[[], None]):
+        self.due = due
+        self.seq = seq
+        self.callback = callback
+        self.cancelled = False
+        # 所在槽位：0~255 为第 0 层，256 起为第 1 层，-1 表示 ready 队列或溢出堆
+        self._slot: int = -1
+
+    def __lt__(self, other: TimerHandle) -> bool:
+        return (self.due, self.seq) < (other.due, other.seq)
+
+
+class TimerWheel:
+    """分层时间轮。
+
+    到期帧 ``due`` 为绝对帧号。``advance(frame)`` 按 (到期帧, 登记顺序) 触发
+    所有 ``due <= frame`` 的定时器；登记时已到期的定时器在下一次 advance 时触发。
+    回调应使用绑定方法而非闭包，以便检查点深拷贝时随宿主对象一并复制。
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        """将时钟与全部槽位恢复为初始状态。"""
+        self.now: int = 0
+        self._seq: int = 0
+        self._count: int = 0
+        self._ready: list[TimerHandle] = []
+        self._l0: list[list[TimerHandle]] = [[] for _ in range(_L0_SIZE)]
+        self._l0_bits: int = 0
+        self._l1: list[list[TimerHandle]] = [[] for _ in range(_L1_SIZE)]
+        self._l1_bits: int = 0
+        self._overflow: list[TimerHandle] = []
+
+    def __len__(self) -> int:
+        return self._count
+
+    # -----------------------------------------------------
+    # 登记 / 取消
+    # -----------------------------------------------------
+
+    def schedule(self, due: int, callback: Callable[[], None]) -> TimerHandle:
+        """登记在绝对帧 due 触发的回调。"""
+        self._seq += 1
+        handle = TimerHandle(int(due), self._seq, callback)
+        self._count += 1
+        self._place(handle)
+        return handle
+
+    def schedule_in(self, delay: int, callback: Callable[[], None]) -> TimerHandle:
+        """登记在 delay 帧后触发的回调。"""
+        return self.schedule(self.now + delay, callback)
+
+    def cancel(self, handle: TimerHandle | None) -> None:
+        """取消定时器 (重复取消无副作用)。"""
+        if handle is None or handle.cancelled:
+            return
+        handle.cancelled = True
+        self._count -= 1
+        slot = handle._slot
+        if slot < 0:
+            # ready 队列与溢出堆惰性剔除
+            return
+        handle._slot = -1
+        if slot < _L0_SIZE:
+            bucket = self._l0[slot]
+            bucket.remove(handle)
+            if not bucket:
+                self._l0_bits &= ~(1 << slot)
+        else:
+            slot -= _L0_SIZE
+            bucket = self._l1[slot]
+            bucket.remove(handle)
+            if not bucket:
+                self._l1_bits &= ~(1 << slot)
+
+    def reschedule(self, handle: TimerHandle | None, due: int) -> TimerHandle:
+        """改期：取消原定时器并以相同回调重新登记。"""
+        if handle is None:
+            raise ValueError("reschedule 需要有效的定时器句柄")
+        self.cancel(handle)
+        return self.schedule(due, handle.callback)
+
+    def clear(self) -> None:
+        """清空全部定时器并将时钟归零，已登记的句柄一并标记为取消。"""
+        for bucket in (self._ready, self._overflow, *self._l0, *self._l1):
+            for handle in bucket:
+                handle.cancelled = True
+                handle._slot = -1
+        self._reset()
+
+    # -----------------------------------------------------
+    # 推进
+    # -----------------------------------------------------
+
+    def next_due(self) -> float:
+        """[快进协议] 返回最早的到期帧，无定时器时为 inf。"""
+        if self._ready:
+            self._ready = [h for h in self._ready if not h.cancelled]
+            if self._ready:
+                return self.now + 1
+        if self._l0_bits:
+            bits = self._l0_bits
+            return (self.now & ~_L0_MASK) | ((bits & -bits).bit_length() - 1)
+        if self._l1_bits:
+            # 最近的非空区块中取最早的到期帧
+            cur = (self.now >> _L0_BITS) + 1
+            for block in range(cur, cur + _L1_SIZE):
+                bucket = self._l1[block % _L1_SIZE]
+                if bucket:
+                    return min(h.due for h in bucket)
+        while self._overflow and self._overflow[0].cancelled:
+            heapq.heappop(self._overflow)
+        if self._overflow:
+            return self._overflow[0].due
+        return float("inf")
+
+    def advance(self, frame: int) -> None:
+        """推进时钟至 frame，并触发期间到期的全部定时器。"""
+        if self._ready:
+            ready, self._ready = self._ready, []
+            for handle in ready:
+                self._fire(handle)
+
+        while self.now < frame:
+            block_end = self.now | _L0_MASK
+            upto = frame if frame < block_end else block_end
+            self._fire_l0(upto)
+            self.now = upto
+            if upto == frame:
+                break
+            # 跨入下一区块：下放第 1 层槽位，并迁入进入范围的溢出定时器
+            self.now = block_end + 1
+            self._cascade(self.now >> _L0_BITS)
+            self._fire_l0(self.now, inclusive_start=True)
+
+    # -----------------------------------------------------
+    # 内部实现
+    # -----------------------------------------------------
+
+    def _place(self, handle: TimerHandle) -> None:
+        due = handle.due
+        handle._slot = -1
+        if due <= self.now:
+            self._ready.append(handle)
+            return
+        block = due >> _L0_BITS
+        distance = block - (self.now >> _L0_BITS)
+        if distance == 0:
+            slot = due & _L0_MASK
+            self._l0[slot].append(handle)
+            self._l0_bits |= 1 << slot
+            handle._slot = slot
+        elif distance <= _L1_SIZE:
+            slot = block % _L1_SIZE
+            self._l1[slot].append(handle)
+            self._l1_bits |= 1 << slot
+            handle._slot = _L0_SIZE + slot
+        else:
+            heapq.heappush(self._overflow, handle)
+
+    def _cascade(self, block: int) -> None:
+        """进入 block 区块 (此时 now 为区块首帧)：下放第 1 层槽位并迁入溢出定时器。"""
+        slot = block % _L1_SIZE
+        bucket = self._l1[slot]
+        if bucket:
+            self._l1[slot] = []
+            self._l1_bits &= ~(1 << slot)
+            for handle in bucket:
+                self._place_l0(handle)
+        horizon = (block + _L1_SIZE + 1) << _L0_BITS
+        while self._overflow and self._overflow[0].due < horizon:
+            handle = heapq.heappop(self._overflow)
+            if handle.cancelled:
+                continue
+            if handle.due >> _L0_BITS == block:
+                self._place_l0(handle)
+            else:
+                self._place(handle)
+
+    def _place_l0(self, handle: TimerHandle) -> None:
+        # 区块内的定时器 (含区块首帧) 直接落入第 0 层，由随后的 _fire_l0 触发
+        slot = handle.due & _L0_MASK
+        self._l0[slot].append(handle)
+        self._l0_bits |= 1 << slot
+        handle._slot = slot
+
+    def _fire_l0(self, upto: int, inclusive_start: bool = False) -> None:
+        start = (self.now & _L0_MASK) + (0 if inclusive_start else 1)
+        end = upto & _L0_MASK
+        if start > end:
+            return
+        window = ((1 << (end + 1)) - 1) & ~((1 << start) - 1)
+        while self._l0_bits & window:
+            bits = self._l0_bits & window
+            slot = (bits & -bits).bit_length() - 1
+            bucket = self._l0[slot]
+            self._l0[slot] = []
+            self._l0_bits &= ~(1 << slot)
+            # 回调内登记的同帧定时器进入 ready，下一帧触发
+            self.now = (self.now & ~_L0_MASK) | slot
+            for handle in sorted(bucket, key=lambda h: h.seq):
+                handle._slot = -1
+                self._fire(handle)
+
+    def _fire(self, handle: TimerHandle) -> None:
+        if handle.cancelled:
+            return
+        handle.cancelled = True
+        self._count -= 1
+        handle.callback()
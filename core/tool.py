@@ -1,3 +1,5 @@
+import random
+from typing import Any
 
 
 def get_ascension_index(level: int) -> int:
@@ -43,6 +45,31 @@ def get_attribute_name(attr_id: int) -> str:
     return attribute_map.get(attr_id, "未知属性")
 
 
+# 无活跃上下文时的后备随机源 (如脱离仿真的单元测试)
+_FALLBACK_RNG = random.Random()
+
+
+def get_rng(stream: str, entity: Any | None = None) -> random.Random:
+    """获取当前上下文的命名随机流。
+
+    Args:
+        stream: 随机流名称 (见 core.rng)。
+        entity: 若指定，则返回该实体独立的随机流。
+
+    Returns:
+        random.Random: 随机流实例，若无活跃上下文则返回进程级后备实例。
+    """
+    from core.context import get_context
+
+    try:
+        streams = get_context().rng
+    except RuntimeError:
+        return _FALLBACK_RNG
+    if entity is not None:
+        return streams.entity_stream(stream, entity)
+    return streams.stream(stream)
+
+
 def get_current_time() -> int:
     """获取当前模拟器的全局帧数。
 
@@ -164,3 +191,77 @@ def get_reaction_multiplier(level: int) -> float:
         float: 该等级对应的反应系数值。
     """
     return REACTION_COEFFICIENTS.get(level, 0.0)
+
+
+def _defining_class(cls: type, attr: str) -> type | None:
+    """沿 MRO 查找首个直接定义了 attr 的类。"""
+    for klass in cls.__mro__:
+        if attr in klass.__dict__:
+            return klass
+    return None
+
+
+_DECLARATION_COVERAGE: dict[tuple[type, str, tuple[str, ...]], bool] = {}
+
+
+def _declaration_covers(cls: type, declared: str, hooks: tuple[str, ...]) -> bool:
+    """判断类的 declared 声明是否覆盖了所有实际生效的 hooks 重写 (按类缓存)。
+
+    若某个钩子在更派生的类中被重写，而 declared 仍停留在基类，则声明不再可信。
+    """
+    key = (cls, declared, hooks)
+    covered = _DECLARATION_COVERAGE.get(key)
+    if covered is None:
+        covered = _DECLARATION_COVERAGE[key] = _check_declaration(cls, declared, hooks)
+    return covered
+
+
+def _check_declaration(cls: type, declared: str, hooks: tuple[str, ...]) -> bool:
+    declared_owner = _defining_class(cls, declared)
+    if declared_owner is None:
+        return False
+
+    for hook in hooks:
+        hook_owner = _defining_class(cls, hook)
+        if hook_owner is not None and not issubclass(declared_owner, hook_owner):
+            return False
+    return True
+
+
+def get_next_wakeup(component: object, frame: int, *tick_hooks: str) -> float:
+    """查询组件的下一唤醒帧 (空闲帧快进协议)。
+
+    组件通过 ``next_wakeup(frame)`` 声明下一个必须逐帧执行的绝对帧号，
+    并通过 ``fast_forward(frames)`` 等效推进空闲帧内的计数器。
+    若子类重写了逐帧钩子却未同步重写 ``next_wakeup``，其声明不再可信，
+    此时保守地返回 ``frame + 1`` (即不允许跳帧)。
+
+    Args:
+        component: 待查询的组件 (实体、效果、技能、系统等)。
+        frame: 当前已结算完毕的帧号。
+        *tick_hooks: 需要被唤醒声明覆盖的逐帧钩子名称，默认为 on_frame_update。
+
+    Returns:
+        float: 下一唤醒帧，永不需要唤醒时为 inf。
+    """
+    if not _declaration_covers(type(component), "next_wakeup", tick_hooks or ("on_frame_update",)):
+        return frame + 1
+    return component.next_wakeup(frame)  # type: ignore[attr-defined]
+
+
+def get_state_version(entity: object) -> int:
+    """查询实体的状态版本号 (增量快照协议)。
+
+    实体通过 ``_state_signature()`` 声明其导出状态所依赖的字段，
+    签名变化即视为状态变更。若子类重写了 ``export_state`` 却未同步重写
+    ``_state_signature``，则其签名不可信，每次查询都视为已变更。
+
+    Args:
+        entity: 待查询的实体。
+
+    Returns:
+        int: 单调递增的状态版本号。
+    """
+    if not _declaration_covers(type(entity), "_state_signature", ("export_state",)):
+        return entity.mark_state_dirty()  # type: ignore[attr-defined]
+    return entity.poll_state_version()  # type: ignore[attr-defined]
@@ -0,0 +1,76 @@
+"""EventEngine 分发吞吐量微基准。
+
+运行 ``pytest tests/benchmarks -s`` 可查看每秒事件数；
+下限取值宽松，仅用于暴露数量级上的性能回退。
+"""
+
+import time
+
+from core.context import EventEngine
+from core.event import EventType, GameEvent
+
+EVENTS = 50_000
+MIN_EVENTS_PER_SECOND = 100_000
+
+
+class CountingHandler:
+    def __init__(self):
+        self.count = 0
+
+    def handle_event(self, event):
+        self.count += 1
+
+
+def measure(engine, event_type, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        event = GameEvent(event_type, 0)
+        start = time.perf_counter()
+        for _ in range(EVENTS):
+            engine.publish(event)
+        best = min(best, time.perf_counter() - start)
+        engine.clear_frame_events()
+    return EVENTS / best
+
+
+def test_publish_throughput():
+    parent = EventEngine()
+    engine = EventEngine(parent=parent)
+    handlers = [CountingHandler() for _ in range(4)]
+    for h in handlers:
+        engine.subscribe(EventType.FRAME_END, h)
+    parent.subscribe(EventType.FRAME_END, CountingHandler())
+
+    dispatch_rate = measure(engine, EventType.FRAME_END)
+    # 审计事件需额外写入帧缓冲区
+    engine.subscribe(EventType.AFTER_DAMAGE, handlers[0])
+    capture_rate = measure(engine, EventType.AFTER_DAMAGE)
+
+    print(f"\n[EventEngine] dispatch {dispatch_rate:,.0f} ev/s, capture {capture_rate:,.0f} ev/s")
+    assert handlers[1].count == EVENTS * 3
+    assert dispatch_rate > MIN_EVENTS_PER_SECOND
+    assert capture_rate > MIN_EVENTS_PER_SECOND
+
+
+def test_priority_orders_dispatch():
+    engine = EventEngine()
+    order = []
+
+    class Recorder:
+        def __init__(self, tag):
+            self.tag = tag
+
+        def handle_event(self, event):
+            order.append(self.tag)
+
+    low, default, high = Recorder("low"), Recorder("default"), Recorder("high")
+    engine.subscribe(EventType.FRAME_END, low, priority=-1)
+    engine.subscribe(EventType.FRAME_END, default)
+    engine.subscribe(EventType.FRAME_END, high, priority=10)
+    engine.subscribe(EventType.FRAME_END, default)  # 重复订阅被忽略
+
+    engine.publish(GameEvent(EventType.FRAME_END, 0))
+    assert order == ["high", "default", "low"]
+
+    engine.unsubscribe(EventType.FRAME_END, high)
+    assert engine.handlers(EventType.FRAME_END) == [default, low]
@@ -0,0 +1,151 @@
+"""ResultDatabase 写入吞吐量基准 (芙宁娜 / 哥伦比娅 真实会话回放)。
+
+先运行一次完整仿真录制逐帧快照，再分别回放至逐条执行的旧写入器与
+批量写入器 (相邻同构语句 executemany + 按行数/时长分批提交)。
+运行 ``pytest tests/benchmarks -s`` 可查看每秒写入行数与快照数；
+下限取值宽松，仅用于暴露数量级上的性能回退。
+"""
+
+import asyncio
+import sqlite3
+import time
+
+import aiosqlite
+import pytest
+
+from core.config import Config
+from core.data.repository import MockDataRepository
+from core.factory.assembler import SimulationAssembler
+from core.persistence.database import ResultDatabase, group_statements
+
+MIN_SNAPSHOTS_PER_SECOND = 200
+MIN_BATCH_SPEEDUP = 1.5
+DEFAULT_COMMIT_ROWS = ResultDatabase.COMMIT_ROWS
+
+CHAR_DATA = {
+    75: {"name": "芙宁娜", "element": "水", "type": "单手剑", "base_hp": 15307, "base_atk": 244, "base_def": 696},
+    103: {"name": "哥伦比娅", "element": "水", "type": "法器", "base_hp": 14000, "base_atk": 200, "base_def": 600},
+    1: {"name": "Test", "element": "雷", "type": "法器", "base_hp": 12000, "base_atk": 800, "base_def": 600},
+}
+
+ROTATION = [
+    {"character_name": "芙宁娜", "action_key": "elemental_skill"},
+    {"character_name": "芙宁娜", "action_key": "normal_attack", "params": {"count": 4}},
+    {"character_name": "哥伦比娅", "action_key": "charged_attack"},
+    {"character_name": "哥伦比娅", "action_key": "normal_attack", "params": {"count": 3}},
+    {"character_name": "Test", "action_key": "elemental_skill"},
+    {"character_name": "Test", "action_key": "normal_attack", "params": {"count": 3}},
+    {"character_name": "芙宁娜", "action_key": "skip", "params": {"frames": 120}},
+]
+
+
+class SnapshotRecorder:
+    """仅录制快照的持久化目标。"""
+
+    def __init__(self):
+        self.snapshots = []
+
+    def record_snapshot(self, snapshot):
+        self.snapshots.append(snapshot)
+
+
+class LegacyResultDatabase(ResultDatabase):
+    """旧写入器：逐条 execute，队列排空或每 60 帧提交一次。"""
+
+    async def _worker(self):
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("PRAGMA foreign_keys=ON")
+            await db.execute("PRAGMA journal_mode=WAL")
+            while True:
+                item = await self._queue.get()
+                if item is None:
+                    break
+                commands = []
+                commands.extend(self.projector.project_static_meta(item))
+                commands.extend(self.projector.project_pulse(item))
+                commands.extend(self.projector.project_metrics(item))
+                commands.extend(self.projector.project_events(item))
+                for sql, params in commands:
+                    await db.execute(sql, params)
+                if self._queue.empty() or item.get("frame", 0) % 60 == 0:
+                    await db.commit()
+                self._queue.task_done()
+            await db.commit()
+
+
+def record_session():
+    Config.set("emulation.open_critical", False)
+    config = {
+        "context_config": {
+            "team": [
+                {"character": {"id": 75, "level": 90, "talents": "10/10/10", "constellation": 2}},
+                {"character": {"id": 103, "level": 90, "talents": "10/10/10", "constellation": 2}},
+                {"character": {"id": 1, "level": 90, "talents": "10/10/10"}},
+            ],
+            "targets": [
+                {"name": f"T{i}", "level": 100, "position": {"x": float(i), "z": 2.0}} for i in range(3)
+            ],
+        },
+        "sequence_config": [{"repeat": 3, "sequence": ROTATION}],
+    }
+    recorder = SnapshotRecorder()
+    simulator, _ = SimulationAssembler(MockDataRepository(char_data=CHAR_DATA)).assemble(
+        config, persistence_db=recorder
+    )
+    asyncio.run(simulator.run())
+    return recorder.snapshots
+
+
+async def replay(db_class, db_path, snapshots):
+    db = db_class(db_path)
+    await db.initialize()
+    await db.create_session("PersistenceBenchmark")
+    for snapshot in snapshots:
+        db.record_snapshot(snapshot)
+    start = time.perf_counter()
+    await db.start_session()
+    await db.stop_session()
+    return time.perf_counter() - start
+
+
+def dump_tables(db_path):
+    with sqlite3.connect(db_path) as conn:
+        tables = [
+            name for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' "
+                "AND name != 'simulation_sessions' ORDER BY name"
+            )
+        ]
+        return {table: conn.execute(f"SELECT * FROM {table} ORDER BY rowid").fetchall() for table in tables}
+
+
+def test_grouping_keeps_statement_order():
+    commands = [("A", 1), ("A", 2), ("B", 3), ("A", 4), ("A", 5), ("A", 6)]
+    assert group_statements(commands) == [("A", [1, 2]), ("B", [3]), ("A", [4, 5, 6])]
+    assert group_statements([]) == []
+
+
+@pytest.mark.parametrize("commit_rows", [DEFAULT_COMMIT_ROWS, 7])
+def test_batched_writer_throughput(tmp_path, monkeypatch, commit_rows):
+    monkeypatch.setattr(ResultDatabase, "COMMIT_ROWS", commit_rows)
+    snapshots = record_session()
+
+    legacy_path, batched_path = str(tmp_path / "legacy.db"), str(tmp_path / "batched.db")
+    legacy = asyncio.run(replay(LegacyResultDatabase, legacy_path, snapshots))
+    batched = asyncio.run(replay(ResultDatabase, batched_path, snapshots))
+
+    # 批量写入与逐条写入的表内容完全一致
+    tables = dump_tables(batched_path)
+    assert tables == dump_tables(legacy_path)
+    rows = sum(len(content) for content in tables.values())
+    assert tables["simulation_event_log"] and tables["event_damage_data"]
+
+    print(
+        f"\n[ResultDatabase] {len(snapshots)} snapshots, {rows} rows (COMMIT_ROWS={commit_rows})"
+        f"\n  legacy : {rows / legacy:,.0f} rows/s, {len(snapshots) / legacy:,.0f} snapshots/s"
+        f"\n  batched: {rows / batched:,.0f} rows/s, {len(snapshots) / batched:,.0f} snapshots/s"
+        f" (x{legacy / batched:.2f})"
+    )
+    assert len(snapshots) / batched > MIN_SNAPSHOTS_PER_SECOND
+    if commit_rows == DEFAULT_COMMIT_ROWS:
+        assert legacy / batched > MIN_BATCH_SPEEDUP
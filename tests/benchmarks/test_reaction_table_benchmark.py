@@ -0,0 +1,144 @@
+"""AuraManager.apply_element 吞吐量微基准 (反应查表)。
+
+运行 ``pytest tests/benchmarks -s`` 可查看每秒元素附着次数，以及查表与
+逐次构建映射 (旧实现) 的耗时对比；下限取值宽松，仅用于暴露数量级上的性能回退。
+"""
+
+import random
+import time
+
+from core.mechanics.aura import (
+    AMP_MULT_TABLE,
+    REACTION_TABLE,
+    TAX_TABLE,
+    AuraManager,
+    Element,
+)
+from core.systems.contract.reaction import ElementalReactionType
+
+APPLICATIONS = 20_000
+MIN_APPLICATIONS_PER_SECOND = 20_000
+MIN_LOOKUP_SPEEDUP = 2.0
+
+STREAM_ELEMENTS = [
+    Element.PYRO, Element.HYDRO, Element.CRYO, Element.ELECTRO,
+    Element.DENDRO, Element.ANEMO, Element.GEO, Element.PHYSICAL,
+]
+
+
+def legacy_map_reaction(atk, target):
+    """旧实现：每次调用重新构建映射。"""
+    table = {
+        (Element.HYDRO, Element.PYRO): ElementalReactionType.VAPORIZE,
+        (Element.PYRO, Element.HYDRO): ElementalReactionType.VAPORIZE,
+        (Element.PYRO, Element.CRYO): ElementalReactionType.MELT,
+        (Element.CRYO, Element.PYRO): ElementalReactionType.MELT,
+        (Element.ELECTRO, Element.PYRO): ElementalReactionType.OVERLOAD,
+        (Element.PYRO, Element.ELECTRO): ElementalReactionType.OVERLOAD,
+        (Element.ELECTRO, Element.HYDRO): ElementalReactionType.ELECTRO_CHARGED,
+        (Element.HYDRO, Element.ELECTRO): ElementalReactionType.ELECTRO_CHARGED,
+        (Element.CRYO, Element.ELECTRO): ElementalReactionType.SUPERCONDUCT,
+        (Element.ELECTRO, Element.CRYO): ElementalReactionType.SUPERCONDUCT,
+        (Element.HYDRO, Element.DENDRO): ElementalReactionType.BLOOM,
+        (Element.DENDRO, Element.HYDRO): ElementalReactionType.BLOOM,
+        (Element.ANEMO, Element.PYRO): ElementalReactionType.SWIRL,
+        (Element.ANEMO, Element.HYDRO): ElementalReactionType.SWIRL,
+        (Element.ANEMO, Element.CRYO): ElementalReactionType.SWIRL,
+        (Element.ANEMO, Element.ELECTRO): ElementalReactionType.SWIRL,
+        (Element.GEO, Element.PYRO): ElementalReactionType.CRYSTALLIZE,
+        (Element.GEO, Element.HYDRO): ElementalReactionType.CRYSTALLIZE,
+        (Element.GEO, Element.CRYO): ElementalReactionType.CRYSTALLIZE,
+        (Element.GEO, Element.ELECTRO): ElementalReactionType.CRYSTALLIZE,
+    }
+    return table.get((atk, target), table.get((target, atk), ElementalReactionType.VAPORIZE))
+
+
+def legacy_get_tax(attack, target):
+    """旧实现：每次调用重新构建映射。"""
+    if attack in [Element.ANEMO, Element.GEO] and target == Element.QUICKEN:
+        return 0.0
+    table = {
+        (Element.HYDRO, Element.PYRO): 2.0,
+        (Element.PYRO, Element.HYDRO): 0.5,
+        (Element.PYRO, Element.CRYO): 2.0,
+        (Element.CRYO, Element.PYRO): 0.5,
+        (Element.PYRO, Element.FROZEN): 2.0,
+        (Element.PYRO, Element.QUICKEN): 0.5,
+        (Element.HYDRO, Element.DENDRO): 1.0,
+        (Element.DENDRO, Element.HYDRO): 1.0,
+        (Element.HYDRO, Element.QUICKEN): 1.0,
+        (Element.ELECTRO, Element.PYRO): 1.0,
+        (Element.PYRO, Element.ELECTRO): 1.0,
+        (Element.CRYO, Element.ELECTRO): 1.0,
+        (Element.ELECTRO, Element.CRYO): 1.0,
+        (Element.GEO, Element.FROZEN): 0.5,
+        (Element.ANEMO, Element.FROZEN): 0.5,
+    }
+    if (attack, target) in table:
+        return table[(attack, target)]
+    if attack in [Element.ANEMO, Element.GEO]:
+        return 0.5
+    return 0.0
+
+
+def legacy_get_mult(a, b):
+    target = Element.CRYO if b == Element.FROZEN else b
+    return {
+        (Element.HYDRO, Element.PYRO): 2.0,
+        (Element.PYRO, Element.HYDRO): 1.5,
+        (Element.PYRO, Element.CRYO): 2.0,
+        (Element.CRYO, Element.PYRO): 1.5,
+    }.get((a, target), 1.0)
+
+
+def random_stream(seed=11):
+    rng = random.Random(seed)
+    stream = []
+    for _ in range(APPLICATIONS):
+        el = rng.choice(STREAM_ELEMENTS)
+        # 混入字符串形式的元素，覆盖转换路径
+        stream.append((el.value if rng.random() < 0.3 else el, rng.choice([1.0, 1.0, 2.0, 4.0])))
+    return stream
+
+
+def test_tables_match_legacy_derivation():
+    for a in Element:
+        for t in Element:
+            assert REACTION_TABLE[a.ordinal][t.ordinal] is legacy_map_reaction(a, t)
+            assert TAX_TABLE[a.ordinal][t.ordinal] == legacy_get_tax(a, t)
+            assert AMP_MULT_TABLE[a.ordinal][t.ordinal] == legacy_get_mult(a, t)
+
+
+def test_lookup_speedup():
+    pairs = [(a, t) for a in Element for t in Element] * 50
+
+    def run(get_reaction, get_tax):
+        start = time.perf_counter()
+        for a, t in pairs:
+            get_reaction(a, t)
+            get_tax(a, t)
+        return time.perf_counter() - start
+
+    manager = AuraManager()
+    table = run(manager._map_reaction, manager._get_tax)
+    legacy = run(legacy_map_reaction, legacy_get_tax)
+    print(f"\n[AuraManager] {len(pairs)} lookups: table {table * 1e3:.1f} ms, "
+          f"legacy {legacy * 1e3:.1f} ms, x{legacy / table:.1f}")
+    assert legacy / table > MIN_LOOKUP_SPEEDUP
+
+
+def test_application_throughput():
+    stream = random_stream()
+    best = float("inf")
+    for _ in range(3):
+        manager = AuraManager()
+        start = time.perf_counter()
+        for i, (el, u) in enumerate(stream):
+            manager.apply_element(el, u)
+            if i % 8 == 0:
+                manager.update(None, 0.5)
+        best = min(best, time.perf_counter() - start)
+
+    rate = APPLICATIONS / best
+    print(f"\n[AuraManager] {rate:,.0f} applications/s")
+    assert rate > MIN_APPLICATIONS_PER_SECOND
@@ -0,0 +1,160 @@
+"""CombatSpace 空间检索微基准 (网格索引 / NumPy 批量判定)。
+
+运行 ``pytest tests/benchmarks -s`` 可查看两条路径与线性扫描的耗时对比；
+加速比下限取值宽松，仅用于暴露数量级上的性能回退。
+"""
+
+import math
+import random
+import time
+
+import pytest
+
+import core.combat_space as combat_space
+from core.context import create_context
+from core.entities.base_entity import BaseEntity, Faction
+
+TARGETS = 240
+QUERIES = 2_000
+# 稀疏场景以网格粗筛为主，密集场景 (深渊多目标) 候选数多，走批量判定
+ARENAS = {"sparse": 120.0, "dense": 12.0}
+MIN_SPEEDUP = 3.0
+
+
+def linear_in_range(entities, origin, radius):
+    ox, oz = origin
+    return [
+        e for e in entities
+        if (e.pos[0] - ox) ** 2 + (e.pos[1] - oz) ** 2 <= (radius + e.hitbox[0]) ** 2
+    ]
+
+
+def linear_in_box(entities, origin, length, width, facing):
+    ox, oz = origin
+    rad = math.radians(-facing)
+    cos_f, sin_f = math.cos(rad), math.sin(rad)
+    results = []
+    for e in entities:
+        dx, dz = e.pos[0] - ox, e.pos[1] - oz
+        rx = dx * cos_f - dz * sin_f
+        rz = dx * sin_f + dz * cos_f
+        cx = max(0.0, min(rx, length))
+        cz = max(-width / 2.0, min(rz, width / 2.0))
+        if (rx - cx) ** 2 + (rz - cz) ** 2 <= e.hitbox[0] ** 2:
+            results.append(e)
+    return results
+
+
+def linear_closest(entities, origin):
+    best, best_d = None, float("inf")
+    for e in entities:
+        d = (e.pos[0] - origin[0]) ** 2 + (e.pos[1] - origin[1]) ** 2
+        if d < best_d:
+            best, best_d = e, d
+    return best
+
+
+@pytest.fixture(params=list(ARENAS.values()), ids=list(ARENAS))
+def populated_space(request):
+    arena = request.param
+    ctx = create_context()
+    rng = random.Random(7)
+    for i in range(TARGETS):
+        e = BaseEntity(
+            f"目标{i}",
+            pos=(rng.uniform(-arena, arena), rng.uniform(-arena, arena), 0.0),
+            hitbox=(rng.choice([0.5, 1.0, 2.0, 8.0]), 2.0),
+            faction=Faction.ENEMY,
+            context=ctx,
+        )
+        ctx.space.register(e)
+    return ctx.space, rng, arena
+
+
+def random_queries(rng, arena):
+    return [
+        (
+            (rng.uniform(-arena, arena), rng.uniform(-arena, arena)),
+            rng.uniform(1.0, 12.0),
+            rng.uniform(0.0, 360.0),
+        )
+        for _ in range(QUERIES)
+    ]
+
+
+@pytest.mark.parametrize("batch_min", [combat_space.BATCH_MIN_TARGETS, 10**9], ids=["batch", "grid"])
+def test_queries_match_linear_scan(populated_space, monkeypatch, batch_min):
+    monkeypatch.setattr(combat_space, "BATCH_MIN_TARGETS", batch_min)
+    space, rng, arena = populated_space
+    entities = list(space._entities[Faction.ENEMY])
+
+    # 增量维护：原地修改、整体赋值、set_position、碰撞盒变化与注销
+    for e in rng.sample(entities, 60):
+        e.pos[0] += rng.uniform(-30.0, 30.0)
+        e.set_position(e.pos[0], rng.uniform(-arena, arena))
+    for e in rng.sample(entities, 20):
+        e.pos = [rng.uniform(-arena, arena), rng.uniform(-arena, arena), 0.0]
+    entities[0].hitbox = (15.0, 2.0)
+    for e in entities[1:11]:
+        space.unregister(e)
+    space.on_frame_update()
+    entities = list(space._entities[Faction.ENEMY])
+
+    for origin, size, facing in random_queries(rng, arena)[:500]:
+        assert space.get_entities_in_range(origin, size, Faction.ENEMY) == linear_in_range(
+            entities, origin, size
+        )
+        assert space.get_entities_in_box(
+            origin, size, size / 2, facing, Faction.ENEMY
+        ) == linear_in_box(entities, origin, size, size / 2, facing)
+        assert space._find_closest(origin, Faction.ENEMY) is linear_closest(entities, origin)
+
+
+def test_closest_selection_matches_sort(populated_space):
+    space, rng, arena = populated_space
+    entities = list(space._entities[Faction.ENEMY])
+    # 制造同距目标，验证取舍顺序与稳定排序一致
+    for e in entities[:40]:
+        e.set_position(3.0, 4.0)
+
+    for k in (1, 5, 30, 60, len(entities), 999):
+        origin = (0.0, 0.0) if k == 30 else (rng.uniform(-arena, arena), rng.uniform(-arena, arena))
+        expected = sorted(
+            entities, key=lambda e: (e.pos[0] - origin[0]) ** 2 + (e.pos[1] - origin[1]) ** 2
+        )[:k]
+        data = {"selection_way": "CLOSEST", "max_targets": k}
+        assert space._apply_selection_strategy(entities, data, origin) == expected
+
+
+def test_query_speedup(populated_space, monkeypatch):
+    space, rng, arena = populated_space
+    entities = list(space._entities[Faction.ENEMY])
+    queries = random_queries(rng, arena)
+
+    def run(in_range, in_box, closest):
+        start = time.perf_counter()
+        for origin, size, facing in queries:
+            in_range(origin, size)
+            in_box(origin, size, facing)
+            closest(origin)
+        return time.perf_counter() - start
+
+    def run_space():
+        return run(
+            lambda o, r: space.get_entities_in_range(o, r, Faction.ENEMY),
+            lambda o, s, f: space.get_entities_in_box(o, s, s / 2, f, Faction.ENEMY),
+            lambda o: space._find_closest(o, Faction.ENEMY),
+        )
+
+    indexed = run_space()
+    linear = run(
+        lambda o, r: linear_in_range(entities, o, r),
+        lambda o, s, f: linear_in_box(entities, o, s, s / 2, f),
+        lambda o: linear_closest(entities, o),
+    )
+    monkeypatch.setattr(combat_space, "BATCH_MIN_TARGETS", 10**9)
+    grid_only = run_space()
+
+    print(f"\n[CombatSpace] {TARGETS} targets in {2 * arena:.0f}m: indexed {indexed * 1e3:.1f} ms "
+          f"(grid only {grid_only * 1e3:.1f} ms), linear {linear * 1e3:.1f} ms, x{linear / indexed:.1f}")
+    assert linear / indexed > MIN_SPEEDUP
@@ -1,5 +1,6 @@
 import pytest
 from typing import Any
+from collections.abc import Callable, Iterable
 from unittest.mock import MagicMock
 from core.context import EventEngine
 from core.mechanics.aura import AuraManager
@@ -137,3 +138,54 @@ def target_entity():
 @pytest.fixture
 def event_engine():
     return EventEngine()
+
+
+# ---------------------------------------------------------
+# 最小仿真场景：单个测试角色 + 木桩
+# ---------------------------------------------------------
+@pytest.fixture
+def build_simulator() -> Callable[..., Any]:
+    """
+    返回最小仿真场景的构造函数：TestChar (10/10/10) + 木桩，暴击关闭。
+
+    构造函数参数:
+        steps: 动作步骤 [(action_type, params), ...]，按角色名生成 ActionCommand。
+        persistence_db: 持久化目标。
+        targets: 木桩数量；多个时命名为 木桩0、木桩1 ... 并沿 x 轴排列。
+        seed: 随机数种子。
+        **simulator_kwargs: 透传给 Simulator (如 fast_forward、profile_events)。
+
+    角色可通过 ``sim.ctx.space.team.members[0]`` 取得。
+    """
+    from character.OTHER.test_char.char import TestChar
+    from core.action.action_data import ActionCommand
+    from core.config import Config
+    from core.context import create_context
+    from core.simulator import Simulator
+    from core.target import Target
+    from core.team import Team
+
+    def build(
+        steps: Iterable[tuple[str, dict[str, Any]]],
+        persistence_db: Any = None,
+        *,
+        targets: int = 1,
+        seed: int | None = None,
+        **simulator_kwargs: Any,
+    ) -> Simulator:
+        Config.set("emulation.open_critical", False)
+        ctx = create_context(seed=seed)
+        space = ctx.space
+        assert space is not None
+        char = TestChar(skill_params=[10, 10, 10])
+        char.initialize_gear()
+        space.set_team(Team([char], context=ctx))
+        for i in range(targets):
+            target = Target({"name": "木桩" if targets == 1 else f"木桩{i}", "level": 90})
+            target.set_position(float(i), 2.0)
+            space.register(target)
+
+        sequence = [ActionCommand(char.name, key, dict(params)) for key, params in steps]
+        return Simulator(ctx, sequence, persistence_db=persistence_db, **simulator_kwargs)
+
+    return build
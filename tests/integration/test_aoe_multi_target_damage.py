@@ -0,0 +1,43 @@
+import pytest
+
+from core.event import EventType
+from core.mechanics.aura import Element
+from core.systems.damage.pipeline import DamagePipeline
+
+
+class DamageRecorder:
+    def __init__(self):
+        self.damages = []
+
+    def handle_event(self, event):
+        self.damages.append(event.data["damage"])
+
+
+@pytest.mark.asyncio
+async def test_aoe_skill_resolves_every_hit_target(build_simulator, monkeypatch):
+    """范围战技命中 3 个目标：攻击者侧快照只结算一次，每个目标各自结算并交付伤害"""
+    foundation_calls = []
+    original = DamagePipeline._stage_2_foundation
+    monkeypatch.setattr(
+        DamagePipeline, "_stage_2_foundation",
+        lambda self, ctx: (foundation_calls.append(ctx.damage.name), original(self, ctx)),
+    )
+
+    sim = build_simulator([("elemental_skill", {"element_type": "雷"})], targets=3)
+    recorder = DamageRecorder()
+    sim.ctx.event_engine.subscribe(EventType.AFTER_DAMAGE, recorder)
+    await sim.run()
+
+    targets = sim.ctx.space.get_registered_entities()
+    hits = [d for d in recorder.damages if d.name == "战技伤害(雷)"]
+    assert len(targets) == 3
+    assert [d.target for d in hits] == targets
+    assert len({id(d) for d in hits}) == 3
+    assert foundation_calls.count("战技伤害(雷)") == 1
+
+    # 三个目标属性一致，结算结果相同且均附着了雷元素
+    assert hits[0].damage > 0
+    assert hits[1].damage == pytest.approx(hits[0].damage)
+    assert hits[2].damage == pytest.approx(hits[0].damage)
+    for target in targets:
+        assert any(aura.element == Element.ELECTRO for aura in target.aura.auras)
@@ -4,6 +4,7 @@ from core.batch.models import (
     BatchNode,
     BatchNodeKind,
     BatchProject,
+    BatchRunRequest,
     MutationRule,
     RangeMutationConfig,
 )
@@ -129,3 +130,71 @@ def test_compile_invalid_path_raises_batch_compile_error():
         assert "无效列表索引" in str(exc)
     else:
         raise AssertionError("expected BatchCompileError")
+
+
+def test_compile_groups_builds_prefix_sharing_tree():
+    def action(key: str) -> dict:
+        return {"character_name": "A", "action_key": key}
+
+    prefix = [action("elemental_skill"), action("normal_attack")]
+    project = _base_project()
+    project.base_config["sequence_config"] = prefix + [action("skip")]
+    variants = {
+        "tail_burst": prefix + [action("elemental_burst")],
+        "tail_charge_a": prefix + [action("charged_attack"), action("dash")],
+        "tail_charge_b": prefix + [action("charged_attack"), action("jump")],
+    }
+    for node_id, sequence in variants.items():
+        project.root.children.append(
+            BatchNode(
+                id=node_id,
+                name=node_id,
+                kind=BatchNodeKind.RULE,
+                rule=MutationRule(target_path=["sequence_config"], value=sequence),
+            )
+        )
+    # 队伍配置不同的叶子无法共享前缀
+    project.root.children.append(
+        BatchNode(
+            id="other_team",
+            name="other_team",
+            kind=BatchNodeKind.RULE,
+            rule=MutationRule(
+                target_path=["context_config", "team", 0, "character", "level"],
+                value=90,
+            ),
+        )
+    )
+
+    groups = BatchProjectCompiler.compile_groups(project)
+
+    assert len(groups) == 2
+    shared, independent = groups
+    assert shared.branch_point == 2
+    assert [r.node_id for r in shared.requests] == ["tail_burst"]
+    assert len(shared.subgroups) == 1
+    assert shared.subgroups[0].branch_point == 3
+    assert [r.node_id for r in shared.subgroups[0].requests] == ["tail_charge_a", "tail_charge_b"]
+    assert [r.node_id for r in independent.all_requests()] == ["other_team"]
+    assert independent.branch_point == 0
+
+
+def test_group_requests_stops_prefix_at_subsequence_call():
+    def action(key: str) -> dict:
+        return {"character_name": "A", "action_key": key}
+
+    common = [action("elemental_skill"), {"call": "X"}, {"define": "X", "sequence": [action("dash")]}]
+    requests = [
+        BatchRunRequest(name, name, name, {"sequence_config": common + tail})
+        for name, tail in {"a": [action("jump")], "b": [action("skip")]}.items()
+    ]
+    (group,) = BatchProjectCompiler.group_requests(requests)
+    assert group.branch_point == 1
+    assert [r.node_id for r in group.requests] == ["a", "b"]
+
+    # 前缀达到上限 (序列互为前缀) 时不再递归分叉
+    short = BatchRunRequest("s", "s", "s", {"sequence_config": [action("dash"), action("jump")]})
+    long = BatchRunRequest("l", "l", "l", {"sequence_config": [action("dash"), action("jump"), action("skip")]})
+    (group,) = BatchProjectCompiler.group_requests([short, long])
+    assert group.branch_point == 1
+    assert [r.node_id for r in group.requests] == ["s", "l"]
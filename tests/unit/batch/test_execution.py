@@ -64,3 +64,47 @@ async def test_execution_service_records_worker_errors():
     assert summary.completed_runs == 1
     assert summary.failed_runs == 1
     assert summary.errors == ["boom"]
+
+
+def test_group_worker_handles_forward_defined_subsequence(monkeypatch):
+    from core.batch.compiler import BatchProjectCompiler
+    from core.batch.execution import _default_batch_worker, _default_group_worker
+    from core.config import Config
+    from core.data import repository
+
+    char_data = {1: {"name": "Test", "element": "雷", "type": "法器", "base_hp": 12000, "base_atk": 800, "base_def": 600}}
+    monkeypatch.setattr(repository, "MySQLDataRepository", lambda: repository.MockDataRepository(char_data=char_data))
+    Config.set("emulation.open_critical", False)
+
+    def action(key: str, **params) -> dict:
+        return {"character_name": "Test", "action_key": key, "params": params}
+
+    # 先调用后定义的子序列：共享前缀只能截止到调用之前
+    common = [
+        action("elemental_skill"),
+        action("skip", frames=30),
+        {"call": "A"},
+        action("skip", frames=30),
+        {"define": "A", "sequence": [action("normal_attack", count=2)]},
+    ]
+    base = {
+        "rng_seed": 7,
+        "context_config": {
+            "team": [{"character": {"id": 1, "level": 90, "talents": "10/10/10"}}],
+            "targets": [{"name": "木桩", "level": 90, "position": {"x": 0.0, "z": 2.0}}],
+        },
+    }
+    tails = {"na": [action("normal_attack", count=3)], "ca": [action("charged_attack")]}
+    requests = [
+        BatchRunRequest(name, name, name, {**base, "sequence_config": common + tail}, audit=False)
+        for name, tail in tails.items()
+    ]
+
+    (group,) = BatchProjectCompiler.group_requests(requests)
+    assert group.branch_point == 2
+    grouped = {r.node_id: r for r in _default_group_worker(group)}
+    for request in requests:
+        solo = _default_batch_worker(request)
+        assert grouped[request.node_id].total_damage == pytest.approx(solo.total_damage)
+        assert grouped[request.node_id].simulation_duration == solo.simulation_duration
+        assert solo.total_damage > 0
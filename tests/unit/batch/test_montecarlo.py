@@ -0,0 +1,72 @@
+import random
+
+import numpy as np
+import pytest
+
+from core.batch.models import BatchRunRequest, BatchRunResult, BatchRunSummary
+from core.batch.montecarlo import MonteCarloService, RunningStats
+
+
+def noisy_worker(request: BatchRunRequest) -> BatchRunResult:
+    rng = random.Random(request.config["rng_seed"])
+    return BatchRunResult(
+        request_id=request.request_id,
+        node_id=request.node_id,
+        node_name=request.node_name,
+        total_damage=1000,
+        dps=rng.gauss(1000.0, 50.0),
+        simulation_duration=120,
+        rng_seed=request.config["rng_seed"],
+    )
+
+
+def test_running_stats_matches_batch_statistics():
+    rng = random.Random(3)
+    values = [rng.lognormvariate(7, 0.3) for _ in range(5000)]
+
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+
+    assert stats.mean == pytest.approx(np.mean(values))
+    assert stats.std_dev == pytest.approx(np.std(values, ddof=1))
+    for q in RunningStats.QUANTILES:
+        assert stats.quantile(q) == pytest.approx(np.percentile(values, q * 100), rel=0.02)
+
+
+@pytest.mark.asyncio
+async def test_monte_carlo_stops_once_interval_is_narrow_enough():
+    """置信区间半宽满足容差即停止，种子可复现，分布随结果与摘要一起序列化"""
+    progress = []
+    service = MonteCarloService(
+        max_workers=4, worker_func=noisy_worker, tolerance=10.0, relative_tolerance=None, max_samples=500
+    )
+    request = BatchRunRequest("mc", "mc", "MC", {"rng_seed": 11})
+
+    summary = await service.run(request, on_progress=lambda done, total, _: progress.append(done))
+
+    dist = summary.distribution
+    assert dist.converged
+    assert dist.ci_half_width <= 10.0
+    # 理论所需样本数约 (1.96 * 50 / 10)^2 ≈ 96，远小于上限
+    assert 50 < dist.samples < 200
+    assert summary.completed_runs == dist.samples
+    assert dist.mean == pytest.approx(1000.0, abs=15.0)
+    assert summary.results[0].distribution == dist
+    assert summary.results[0].rng_seed == 11
+    assert progress[-1] == summary.total_runs
+
+    restored = BatchRunSummary.from_dict(summary.to_dict())
+    assert restored.distribution == dist
+    assert restored.results[0].distribution == dist
+
+
+@pytest.mark.asyncio
+async def test_monte_carlo_respects_sample_cap():
+    service = MonteCarloService(
+        max_workers=2, worker_func=noisy_worker, tolerance=0.001, relative_tolerance=None, max_samples=20
+    )
+    summary = await service.run(BatchRunRequest("mc", "mc", "MC", {"rng_seed": 5}))
+
+    assert summary.total_runs == 20
+    assert not summary.distribution.converged
@@ -0,0 +1,117 @@
+import copy
+import random
+
+from core.context import create_context
+from core.effect.base import BaseEffect, StackingRule
+from core.effect.common import StatModifierEffect
+from core.effect.store import EffectStore
+from core.entities.base_entity import CombatEntity, Faction
+
+
+class Marker(BaseEffect):
+    pass
+
+
+class SubMarker(Marker):
+    pass
+
+
+class Stacking(BaseEffect):
+    def __init__(self, owner, name, rule):
+        super().__init__(owner, name, 600)
+        self.stacking_rule = rule
+        self.stacks = 1
+
+    def on_stack_added(self, other):
+        self.stacks += 1
+
+
+class TestEffectStore:
+    def test_queries_match_linear_scan(self):
+        rng = random.Random(5)
+        store, reference = EffectStore(), []
+        names = ["芙宁娜·万众", "芙宁娜·狂欢", "芙宁", "哥伦比娅", "月兆·初辉", "月兆·满辉", "月"]
+        classes = [Marker, SubMarker]
+        for _ in range(600):
+            if reference and rng.random() < 0.45:
+                effect = reference.pop(rng.randrange(len(reference)))
+                assert store.remove(effect)
+                assert not store.remove(effect)
+            else:
+                effect = rng.choice(classes)(None, rng.choice(names), 60)
+                assert store.add(effect)
+                assert not store.add(effect)
+                reference.append(effect)
+
+            assert list(store) == reference and len(store) == len(reference)
+            for name in names:
+                assert store.get(name) is next((e for e in reference if e.name == name), None)
+                assert store.has(name) == any(e.name == name for e in reference)
+                assert store.find(name, SubMarker) is next(
+                    (e for e in reference if e.name == name and isinstance(e, SubMarker)), None
+                )
+            for prefix in ("", "芙", "芙宁娜", "芙宁娜·万众", "月兆", "月", "不存在"):
+                assert store.with_prefix(prefix) == [e for e in reference if e.name.startswith(prefix)]
+            assert store.of_type(Marker) == reference
+            assert store.of_type(SubMarker) == [e for e in reference if isinstance(e, SubMarker)]
+            assert store.first_of_type(SubMarker) is next(
+                (e for e in reference if isinstance(e, SubMarker)), None
+            )
+
+        # 全部移除后前缀树完全剪枝
+        for effect in reference:
+            store.remove(effect)
+        assert store._trie.children == {} and store._trie.count == 0
+
+    def test_iteration_is_snapshot_and_sliceable(self):
+        store = EffectStore()
+        effects = [Marker(None, f"效果{i}", 60) for i in range(4)]
+        for e in effects:
+            store.add(e)
+        for e in store:
+            store.remove(e)
+        assert len(store) == 0 and not store
+
+        for e in effects:
+            store.add(e)
+        assert store[:] == effects
+        assert store[::-1] == effects[::-1]
+        assert store[1] is effects[1]
+
+
+class TestEntityEffects:
+    def setup_method(self):
+        self.ctx = create_context()
+        self.entity = CombatEntity("目标", faction=Faction.ENEMY, context=self.ctx)
+
+    def test_stacking_rules(self):
+        entity = self.entity
+        first = Stacking(entity, "层数", StackingRule.ADD).apply()
+        assert Stacking(entity, "层数", StackingRule.ADD).apply() is first
+        assert first.stacks == 2
+
+        refreshed = StatModifierEffect(entity, "增益", {"攻击力%": 10.0}, 30).apply()
+        assert StatModifierEffect(entity, "增益", {"攻击力%": 10.0}, 90).apply() is refreshed
+        assert refreshed.duration == 90
+
+        a = Stacking(entity, "独立", StackingRule.INDEPENDENT).apply()
+        b = Stacking(entity, "独立", StackingRule.INDEPENDENT).apply()
+        assert a is not b
+        assert entity.get_effect("独立") is a
+        assert entity.get_effects_by_prefix("独") == [a, b]
+
+        a.remove()
+        assert entity.get_effect("独立") is b
+        assert entity.has_effect("层数") and not entity.has_effect("不存在")
+        assert list(entity.active_effects) == [first, refreshed, b]
+
+    def test_deepcopy_rebuilds_identity_index(self):
+        entity = self.entity
+        effect = StatModifierEffect(entity, "增益", {"攻击力%": 10.0}, float("inf")).apply()
+        clone = copy.deepcopy(entity)
+
+        copied = clone.get_effect("增益")
+        assert copied is not effect and copied in clone.active_effects
+        copied.remove()
+        assert not clone.has_effect("增益")
+        assert entity.get_effect("增益") is effect
@@ -0,0 +1,97 @@
+import time
+
+from core.context import create_context
+from core.entities.base_entity import BaseEntity, EntityState, Faction
+
+
+class Spawner(BaseEntity):
+    """首帧生成一个子实体的测试实体。"""
+
+    def __init__(self, ctx, child_name):
+        super().__init__("生成器", faction=Faction.NEUTRAL, context=ctx)
+        self.child_name = child_name
+        self.child = None
+
+    def _perform_tick(self):
+        if self.child is None:
+            self.child = BaseEntity(self.child_name, faction=Faction.NEUTRAL, context=self.ctx)
+            self.ctx.space.register(self.child)
+
+
+class TestEntityRegistry:
+    def test_register_is_idempotent_and_ordered(self):
+        ctx = create_context()
+        space = ctx.space
+        entities = [BaseEntity(f"实体{i}", faction=Faction.ENEMY, context=ctx) for i in range(5)]
+        for e in entities + entities:
+            space.register(e)
+
+        registry = space._entities[Faction.ENEMY]
+        assert len(registry) == 5
+        assert list(registry) == entities
+        assert entities[3] in registry
+
+    def test_unregister_applies_at_frame_end(self):
+        ctx = create_context()
+        space = ctx.space
+        entities = [BaseEntity(f"实体{i}", faction=Faction.ENEMY, context=ctx) for i in range(5)]
+        for e in entities:
+            space.register(e)
+
+        space.unregister(entities[1])
+        space.unregister(entities[1])
+        entities[3].finish()
+        assert entities[1] in space._entities[Faction.ENEMY]
+
+        space.on_frame_update()
+        assert list(space._entities[Faction.ENEMY]) == [entities[0], entities[2], entities[4]]
+        # 注销后同时退出空间索引
+        assert space.get_entities_in_range((0.0, 0.0), 1.0, Faction.ENEMY) == [
+            entities[0], entities[2], entities[4]
+        ]
+        assert entities[1]._spatial_index is None
+
+    def test_entities_registered_mid_frame_are_driven(self):
+        ctx = create_context()
+        spawner = Spawner(ctx, "子实体")
+        ctx.space.register(spawner)
+
+        ctx.space.on_frame_update()
+        assert spawner.child is not None
+        # 与列表追加语义一致：本帧新注册的实体在同一轮驱动中完成首帧
+        assert spawner.child.current_frame == 1
+
+    def test_active_view_and_snapshot(self):
+        ctx = create_context()
+        with ctx:
+            alive = BaseEntity("存活", faction=Faction.ENEMY)
+            dead = BaseEntity("销毁", faction=Faction.ENEMY)
+            ctx.space.register(alive)
+            ctx.space.register(dead)
+            dead.finish()
+
+            assert ctx.space.get_registered_entities(active_only=True) == [alive]
+            # 快照仍导出本帧销毁的实体，以便闭合其生命周期
+            names = {e["name"] for e in ctx.take_snapshot()["entities"]}
+            assert names == {"存活", "销毁"}
+            assert dead.state == EntityState.DESTROYED
+
+    def test_churn_is_linear(self):
+        """大量短生命周期实体反复注册/注销时，单帧开销不随存量增长。"""
+        ctx = create_context()
+        space = ctx.space
+        for i in range(2000):
+            space.register(BaseEntity(f"常驻{i}", faction=Faction.ENEMY, context=ctx))
+
+        start = time.perf_counter()
+        for _ in range(20):
+            batch = [BaseEntity("弹体", life_frame=1, faction=Faction.PLAYER, context=ctx) for _ in range(200)]
+            for e in batch:
+                space.register(e)
+            for e in batch:
+                space.unregister(e)
+            space.on_frame_update()
+        elapsed = time.perf_counter() - start
+
+        assert len(space._entities[Faction.PLAYER]) == 0
+        assert elapsed < 2.0
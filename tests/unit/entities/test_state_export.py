@@ -70,3 +70,48 @@ class TestStateExport:
             assert snapshot["frame"] == 0
             assert len(snapshot["entities"]) >= 1
             assert any(e["name"] == "靶子" for e in snapshot["entities"])
+
+    def test_incremental_snapshot(self):
+        """验证增量快照仅携带状态发生变化的实体，关键帧携带全部实体"""
+        from core.context import create_context
+
+        ctx = create_context()
+        with ctx:
+            idle = CombatEntity(name="静止靶", faction=Faction.ENEMY)
+            moving = CombatEntity(name="移动靶", faction=Faction.ENEMY)
+            ctx.space.register(idle)
+            ctx.space.register(moving)
+
+            first = ctx.take_snapshot()
+            assert {e["name"] for e in first["entities"]} == {"静止靶", "移动靶"}
+
+            # 无变化时不导出任何实体
+            assert ctx.take_snapshot()["entities"] == []
+
+            moving.set_position(5.0, 0.0)
+            moving.attribute_data["攻击力"] = 100.0
+            assert [e["name"] for e in ctx.take_snapshot()["entities"]] == ["移动靶"]
+
+            # 字典原地修改同样能被检出
+            idle.custom_metrics["层数"] = 1
+            assert [e["name"] for e in ctx.take_snapshot()["entities"]] == ["静止靶"]
+
+            keyframe = ctx.take_snapshot(keyframe=True)
+            assert keyframe["keyframe"] is True
+            assert len(keyframe["entities"]) == 2
+
+    def test_undeclared_export_override_always_dirty(self):
+        """重写 export_state 但未声明状态签名的子类每次都会被导出"""
+        from core.context import create_context
+
+        class CustomEntity(CombatEntity):
+            def export_state(self):
+                state = super().export_state()
+                state["custom"] = True
+                return state
+
+        ctx = create_context()
+        with ctx:
+            ctx.space.register(CustomEntity(name="自定义", faction=Faction.ENEMY))
+            ctx.take_snapshot()
+            assert len(ctx.take_snapshot()["entities"]) == 1
@@ -157,3 +157,65 @@ class TestAuraTheoryRigorous:
         manager.auras[0].current_gauge = 0.00001
         manager.update(1 / 60)
         assert len(manager.auras) == 0
+
+
+class TestLazyGaugeDecay:
+    """闭式惰性衰减与逐帧扣减的等价性"""
+
+    class Owner:
+        def __init__(self):
+            self.ticks = []
+            self.frame = 0
+            self.event_engine = self
+
+        def publish(self, event):
+            self.ticks.append(self.frame)
+
+    def test_decay_matches_per_frame_subtraction(self):
+        manager = AuraManager()
+        manager.apply_element(Element.PYRO, 1.0)
+        gauge = manager.auras[0]
+        reference = 0.8
+        for frame in range(1, 600):
+            manager.update(None, 1 / 60)
+            reference = max(0.0, reference - gauge.decay_rate / 60)
+            if not manager.auras:
+                break
+            assert gauge.current_gauge == pytest.approx(reference, abs=1e-9)
+        # 1U 附着持续 9.5 秒
+        assert frame in (570, 571)
+
+    def test_consume_reschedules_expiry(self):
+        manager = AuraManager()
+        manager.apply_element(Element.CRYO, 2.0)
+        manager.update(None, 1.0)
+        manager.auras[0].consume(manager.auras[0].current_gauge - 0.01)
+        # 剩余 0.01U 在不到 0.1 秒内衰减完毕
+        for _ in range(6):
+            manager.update(None, 1 / 60)
+        assert not manager.has_aura("冰")
+
+    def test_fast_forward_matches_frame_stepping_with_electro_charged(self):
+        stepped, skipped = AuraManager(), AuraManager()
+        owners = (self.Owner(), self.Owner())
+        for manager in (stepped, skipped):
+            manager.apply_element(Element.HYDRO, 2.0)
+            manager.apply_element(Element.ELECTRO, 2.0)
+            assert manager.is_electro_charged
+
+        for frame in range(1, 900):
+            owners[0].frame = frame
+            stepped.update(owners[0])
+
+        frame = 0
+        while frame < 899:
+            wake = min(skipped.next_wakeup(frame), 899)
+            if wake > frame + 1:
+                skipped.fast_forward(owners[1], wake - frame - 1)
+                frame = wake - 1
+            frame += 1
+            owners[1].frame = frame
+            skipped.update(owners[1])
+
+        assert owners[0].ticks and owners[0].ticks == owners[1].ticks
+        assert stepped.state_signature() == skipped.state_signature()
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from character.OTHER.test_char.char import TestChar as SampleChar
+from core.action.action_data import ActionCommand
+from core.config import Config
+from core.context import create_context
+from core.persistence.ledger import DamageLedger
+from core.persistence.processors.crit_resample import CritResampleProcessor
+from core.simulator import Simulator
+from core.target import Target
+from core.team import Team
+
+
+async def run_ledger(crit_mode):
+    Config.set("emulation.open_critical", True)
+    Config.set("emulation.crit_mode", crit_mode)
+    try:
+        ctx = create_context(seed=3)
+        char = SampleChar(skill_params=[10, 10, 10])
+        char.initialize_gear()
+        char.attribute_data["暴击率"] = 40.0
+        team = Team([char], context=ctx)
+        ctx.space.set_team(team)
+        target = Target({"name": "木桩", "level": 90})
+        target.set_position(0.0, 2.0)
+        ctx.space.register(target)
+
+        sequence = [ActionCommand(char.name, "normal_attack") for _ in range(8)]
+        ledger = DamageLedger()
+        await Simulator(ctx, sequence, persistence_db=ledger).run()
+        return ledger
+    finally:
+        Config.set("emulation.open_critical", False)
+        Config.set("emulation.crit_mode", "random")
+
+
+@pytest.mark.asyncio
+async def test_resampled_distribution_centres_on_analytic_expectation():
+    """由一次随机运行重采样得到的 DPS 均值应与暴击期望模式的单次结果一致"""
+    sampled = await run_ledger("random")
+    analytic = await run_ledger("expectation")
+
+    result = CritResampleProcessor.from_ledger(sampled, runs=20000, seed=1)
+
+    assert result["expected_dps"] == pytest.approx(analytic.avg_dps)
+    assert result["avg_dps"] == pytest.approx(analytic.avg_dps, rel=0.01)
+    assert result["min_dps"] <= result["percentiles"][5] <= result["percentiles"][50] <= result["p95_dps"]
+    assert sum(result["histogram"]["counts"]) == 20000
+
+    # 非暴击伤害按暴击结果还原
+    crits = sampled.hits.column("is_crit")
+    damage = sampled.hits.column("damage")
+    non_crit = sampled.hits.column("non_crit_damage")
+    assert crits.any()
+    assert np.allclose(damage[~crits], non_crit[~crits])
+    assert np.all(damage[crits] > non_crit[crits])
+
+
+def test_resample_uses_batch_statistics_percentile_rule():
+    """无可暴击命中时分布退化为单点；p95 取位口径与批处理统计一致"""
+    flat = CritResampleProcessor.resample(
+        np.array([600.0]), np.array([0.0]), np.array([0.0]), duration_frames=60, runs=10
+    )
+    assert flat["min_dps"] == flat["max_dps"] == flat["p95_dps"] == 600.0
+
+    coin = CritResampleProcessor.resample(
+        np.array([100.0]), np.array([50.0]), np.array([100.0]), duration_frames=60, runs=1000, seed=0
+    )
+    assert (coin["min_dps"], coin["max_dps"]) == (100.0, 200.0)
+    assert coin["p95_dps"] == 200.0
@@ -0,0 +1,92 @@
+import random
+
+from core.context import create_context
+from core.entities.base_entity import CombatEntity, Faction
+from core.systems.contract.stats import STATS, res_key
+from core.systems.utils import AttributeCalculator
+
+
+def reference_atk(entity):
+    """逐条遍历修饰符的原始合算口径。"""
+    base = float(entity.attribute_data.get("攻击力", 0.0))
+    percent = float(entity.attribute_data.get("攻击力%", 0.0))
+    flat = float(entity.attribute_data.get("固定攻击力", 0.0))
+    for m in entity.dynamic_modifiers:
+        if m.stat == "攻击力%":
+            percent += m.value
+        elif m.stat == "固定攻击力":
+            flat += m.value
+        elif m.stat == "攻击力":
+            base += m.value
+    return base * (1 + percent / 100) + flat
+
+
+class TestAttributeCalculatorCache:
+    def setup_method(self):
+        self.ctx = create_context()
+        self.entity = CombatEntity("测试", faction=Faction.PLAYER, context=self.ctx)
+        self.entity.attribute_data = {"攻击力": 800.0, "攻击力%": 46.6, "固定攻击力": 311.0, "暴击率": 30.0}
+
+    def test_matches_linear_scan_bitwise(self):
+        rng = random.Random(3)
+        entity = self.entity
+        live = []
+        for _ in range(300):
+            if live and rng.random() < 0.4:
+                entity.remove_modifier(live.pop(rng.randrange(len(live))))
+            else:
+                stat = rng.choice(["攻击力", "攻击力%", "固定攻击力", "暴击率"])
+                live.append(entity.add_modifier("测试", stat, rng.uniform(-20.0, 80.0)))
+            assert AttributeCalculator.get_final_atk(entity) == reference_atk(entity)
+
+    def test_cache_invalidated_per_stat(self):
+        entity = self.entity
+        entity.add_modifier("测试", "攻击力%", 20.0)
+        atk = AttributeCalculator.get_final_atk(entity)
+        version = entity.get_stat_version("攻击力%")
+
+        # 其他属性变化不影响攻击力相关版本号
+        entity.add_modifier("测试", "暴击率", 10.0)
+        assert entity.get_stat_version("攻击力%") == version
+        assert AttributeCalculator.get_final_atk(entity) == atk
+        assert AttributeCalculator.get_final_crit_rate(entity) == 40.0
+
+        # 基础面板直接改写同样生效
+        entity.attribute_data["攻击力"] = 1000.0
+        assert AttributeCalculator.get_final_atk(entity) == reference_atk(entity)
+
+    def test_reassigning_modifier_list_rebuilds_index(self):
+        entity = self.entity
+        entity.add_modifier("保留", "攻击力%", 20.0)
+        entity.add_modifier("剔除", "攻击力%", 30.0)
+        AttributeCalculator.get_final_atk(entity)
+
+        entity.dynamic_modifiers = [m for m in entity.dynamic_modifiers if m.source != "剔除"]
+        assert AttributeCalculator.get_final_atk(entity) == reference_atk(entity)
+        assert [m.source for m in AttributeCalculator.get_stat_modifiers(entity, "攻击力%")] == ["保留"]
+
+
+class TestStatRegistry:
+    def test_ids_are_stable_and_reversible(self):
+        sid = STATS.intern("攻击力%")
+        assert STATS.intern("攻击力%") == sid
+        assert STATS.name(sid) == "攻击力%"
+
+        new_id = STATS.intern("测试专用属性")
+        assert new_id == len(STATS) - 1
+        assert STATS.name(new_id) == "测试专用属性"
+
+    def test_res_key_is_interned(self):
+        assert res_key("火") == "火元素抗性"
+        assert res_key("火") is res_key("火")
+        assert res_key("无") is res_key("无")
+
+    def test_stat_total_accepts_id_or_name(self):
+        ctx = create_context()
+        entity = CombatEntity("测试", faction=Faction.ENEMY, context=ctx)
+        entity.attribute_data = {"火元素抗性": 10.0}
+        entity.add_modifier("减抗", "火元素抗性", -40.0)
+
+        by_name = AttributeCalculator.get_stat_total(entity, "火元素抗性", 10.0)
+        by_id = AttributeCalculator.get_stat_total(entity, STATS.intern("火元素抗性"), 10.0)
+        assert by_name == by_id == -30.0
@@ -113,3 +113,152 @@ class TestDamagePipelineUnit:
         # 4. 抗性区 = 1 - 0.1 = 0.9
         # 预期 = 80000 * 1.5 * 0.5 * 0.9 = 54000
         assert dmg.damage == pytest.approx(54000.0, abs=1.0)
+
+    def test_run_targets_shares_attacker_snapshot(self, event_engine, source_entity, monkeypatch):
+        """多目标结算：攻击者侧快照只执行一次，各目标结果与逐个结算一致"""
+        from core.config import Config
+        from tests.conftest import MockAttributeEntity
+
+        Config.set("emulation.open_critical", False)
+
+        targets = [MockAttributeEntity() for _ in range(3)]
+        for i, t in enumerate(targets):
+            t.attribute_data["防御力"] = 500.0 + 300.0 * i
+
+        seen = []
+
+        class TargetAwareBuff:
+            def handle_event(self, event):
+                dmg_ctx = event.data["damage_context"]
+                seen.append(dmg_ctx.target)
+                if dmg_ctx.target is targets[1]:
+                    dmg_ctx.add_modifier(source="目标增益", stat="伤害加成", value=50.0)
+
+        event_engine.subscribe(EventType.BEFORE_CALCULATE, TargetAwareBuff())
+        pipeline = DamagePipeline(event_engine)
+
+        def make_damage():
+            return Damage(
+                element=(Element.PYRO, 1.0),
+                damage_multiplier=(150.0,),
+                scaling_stat=("攻击力",),
+                config=AttackConfig(attack_tag="元素爆发"),
+                name="Broadcast",
+            )
+
+        expected = []
+        for t in targets:
+            dmg = make_damage()
+            pipeline.run(DamageContext(dmg, source_entity, t))
+            expected.append(dmg.damage)
+
+        foundation_calls = []
+        original = pipeline._stage_2_foundation
+        monkeypatch.setattr(
+            pipeline, "_stage_2_foundation", lambda c: (foundation_calls.append(c), original(c))
+        )
+        seen.clear()
+        results = pipeline.run_targets(DamageContext(make_damage(), source_entity), targets)
+
+        assert len(foundation_calls) == 1
+        assert seen == targets
+        assert [r.damage.target for r in results] == targets
+        assert [r.damage.damage for r in results] == expected
+        assert len({id(r.damage) for r in results}) == 3
+        # 审计链各自独立
+        assert "目标增益" in [m.source for m in results[1].damage.data["audit_trail"]]
+        assert "目标增益" not in [m.source for m in results[0].damage.data["audit_trail"]]
+
+    @pytest.mark.parametrize("level", ["full", "summary", "off"])
+    def test_audit_levels(self, event_engine, source_entity, target_entity, level):
+        """审计级别只影响审计链与修饰符 ID 分配，不影响伤害数值"""
+        from core.config import Config
+        from core.context import create_context
+
+        Config.set("emulation.open_critical", False)
+
+        sim_ctx = create_context()
+        sim_ctx.audit_level = level
+        try:
+            pipeline = DamagePipeline(event_engine)
+            dmg = Damage(
+                element=(Element.HYDRO, 1.0),
+                damage_multiplier=(200.0,),
+                scaling_stat=("生命值",),
+                config=AttackConfig(attack_tag="元素战技"),
+                name="AuditLevel",
+            )
+            source_entity.attribute_data["生命值"] = 40000
+            source_entity.level = 90
+            target_entity.attribute_data["防御力"] = 950
+            pipeline.run(DamageContext(dmg, source_entity, target_entity))
+        finally:
+            # create_context 会将上下文设为全局活跃，避免审计级别泄漏到后续用例
+            sim_ctx.audit_level = "full"
+
+        assert dmg.damage == pytest.approx(80000 * 0.5 * 0.9, abs=1.0)
+        if level == "off":
+            assert "audit_trail" not in dmg.data
+            assert sim_ctx._modifier_id_counter == 0
+            return
+
+        trail = dmg.data["audit_trail"]
+        assert "[技能契约]" in [record.source for record in trail]
+        ids = [record.modifier_id for record in trail]
+        if level == "summary":
+            assert set(ids) == {0}
+            assert sim_ctx._modifier_id_counter == 0
+        else:
+            assert ids == list(range(1, len(trail) + 1))
+
+    @pytest.mark.parametrize("crit_rate, expected_rate", [(60.0, 60.0), (150.0, 100.0), (-20.0, 0.0)])
+    def test_crit_expectation_mode(
+        self, event_engine, source_entity, target_entity, crit_rate, expected_rate
+    ):
+        """暴击期望模式：乘数为 1 + CR×CD（暴击率截断到 [0, 100]），审计链同时记录暴击/非暴击值"""
+        from core.config import Config
+
+        Config.set("emulation.open_critical", True)
+        Config.set("emulation.crit_mode", "expectation")
+        try:
+            pipeline = DamagePipeline(event_engine)
+            dmg = Damage(
+                element=(Element.PYRO, 1.0),
+                damage_multiplier=(100.0,),
+                scaling_stat=("攻击力",),
+                config=AttackConfig(attack_tag="普通攻击1"),
+                name="Expect",
+            )
+            ctx = DamageContext(dmg, source_entity, target_entity)
+            source_entity.attribute_data["攻击力"] = 1000
+            source_entity.attribute_data["暴击率"] = crit_rate
+            source_entity.attribute_data["暴击伤害"] = 100.0
+
+            pipeline.run(ctx)
+        finally:
+            Config.set("emulation.open_critical", False)
+            Config.set("emulation.crit_mode", "random")
+
+        info = dmg.data["crit_profile"]
+        assert info["crit_rate"] == expected_rate
+        assert info["crit"] == pytest.approx(info["non_crit"] * 2.0)
+        assert dmg.damage == pytest.approx(info["non_crit"] * (1 + expected_rate / 100.0))
+        assert not dmg.is_crit
+
+        trail = {record.stat: record.value for record in dmg.data["audit_trail"]}
+        assert trail["暴击乘数"] == pytest.approx(1 + expected_rate / 100.0)
+        assert trail["非暴击伤害值"] == pytest.approx(info["non_crit"])
+        assert trail["暴击伤害值"] == pytest.approx(info["crit"])
+
+    def test_weighted_sum_expectation_enumerates_crit_outcomes(self):
+        """多组分加权求和的期望按暴击组合枚举，而非对组分期望直接加权"""
+        from core.systems.damage.crit import expected_weighted_damage
+        from core.systems.damage.lunar_pipeline import LunarDamagePipeline
+
+        weigh = LunarDamagePipeline._weighted_sum
+        outcomes = [(100.0, 200.0, 50.0), (150.0, 300.0, 50.0)]
+
+        # 四种组合等概率：(100,150) (200,150) (100,300) (200,300)
+        expected = (weigh([100, 150]) + weigh([200, 150]) + weigh([100, 300]) + weigh([200, 300])) / 4
+        assert expected_weighted_damage(outcomes, weigh) == pytest.approx(expected)
+        assert expected_weighted_damage([(100.0, 200.0, 100.0)], weigh) == pytest.approx(200.0)
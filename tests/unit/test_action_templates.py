@@ -0,0 +1,75 @@
+import copy
+
+from character.OTHER.test_char.char import TestChar as SampleChar
+from core.action.action_data import ActionFrameData
+from core.action.action_manager import ActionInstance
+from core.context import create_context
+from core.skills.base import _ACTION_TEMPLATES, warm_up_action_templates
+
+
+def make_char():
+    create_context()
+    char = SampleChar(skill_params=[10, 10, 10])
+    char.initialize_gear()
+    return char
+
+
+def test_templates_are_compiled_once_and_bound_per_skill():
+    first, second = make_char(), make_char()
+    warm_up_action_templates([first])
+    skill = first.skills["elemental_skill"]
+    template = _ACTION_TEMPLATES[(type(skill), skill.lv, "草")]
+    assert template.compiled and template.origin_skill is None
+    assert isinstance(template.hit_frames, tuple)
+    assert template.sorted_hits == tuple(sorted(template.hit_frames))
+
+    a = first._get_action_data("elemental_skill", {"element_type": "草"})
+    assert a is first._get_action_data("elemental_skill", {"element_type": "草", "其他": 1})
+    assert a.origin_skill is skill
+    assert a.tags == ("草",)
+
+    # 其他实例共享模板的只读字段，仅绑定到各自的技能
+    b = second._get_action_data("elemental_skill", {"element_type": "草"})
+    assert b is not a and b.origin_skill is second.skills["elemental_skill"]
+    assert b.attack_config is a.attack_config and b.sorted_hits is a.sorted_hits
+
+    rebuilt = skill.build_action("草")
+    assert rebuilt.compile() == template
+
+
+def test_normal_attack_combo_variants_and_instance_reuse():
+    char = make_char()
+    manager = char.action_manager
+    seen = []
+    for _ in range(char.max_combo * 2):
+        data = char._get_action_data("normal_attack", None)
+        seen.append(data)
+        instance = ActionInstance(data)
+        assert instance.hits is data.sorted_hits
+        manager.combo_counter = manager.combo_counter % char.max_combo + 1
+
+    assert [d.combo_index for d in seen[: char.max_combo]] == list(range(1, char.max_combo + 1))
+    assert seen[: char.max_combo] == seen[char.max_combo:]
+    assert all(a is b for a, b in zip(seen[: char.max_combo], seen[char.max_combo:]))
+
+
+def test_combo_index_assignment_does_not_mutate_bound_template():
+    char = make_char()
+    manager = char.action_manager
+    template = ActionFrameData(name="追击", total_frames=30, hit_frames=[20, 10]).compile()
+    bound = template.bind(char.skills["normal_attack"])
+
+    manager.combo_counter = 2
+    assert manager.request_action(bound)
+    started = manager.current_action.data
+    assert started is not bound and started.combo_index == 2
+    assert bound.combo_index == 0
+
+    # 命中帧按升序触发，且检查点深拷贝后状态独立
+    fired = []
+    char.skills["normal_attack"].on_execute_hit = lambda target, idx: fired.append(idx)
+    clone = copy.deepcopy(manager.current_action)
+    for _ in range(30):
+        manager.on_frame_update()
+    assert fired == [0, 1]
+    assert clone.hit_cursor == 0 and clone.next_hit == 10
@@ -0,0 +1,135 @@
+import random
+
+import pytest
+
+from core.factory.action_parser import ActionParser
+
+
+def expand(entries, definitions=None):
+    """展开为扁平的 (角色, 动作, 参数) 列表，作为编译结果的对照。"""
+    definitions = dict(definitions or {})
+    for entry in entries:
+        if "define" in entry:
+            definitions[entry["define"]] = entry["sequence"]
+    flat = []
+    for entry in entries:
+        if "define" in entry:
+            continue
+        if "call" in entry:
+            flat += expand(definitions[entry["call"]], definitions) * int(entry.get("repeat", 1))
+        elif "sequence" in entry:
+            flat += expand(entry["sequence"], definitions) * int(entry.get("repeat", 1))
+        else:
+            action = ActionParser.ACTION_NAME_MAP.get(entry["action_key"], entry["action_key"])
+            params = dict(entry.get("params", {}))
+            count = params.pop("count", None) if action == "normal_attack" else None
+            if count is None:
+                flat.append((entry["character_name"], action, entry.get("params", {})))
+            else:
+                flat += [(entry["character_name"], action, params)] * int(count)
+    return flat
+
+
+def action(char, key, **params):
+    return {"character_name": char, "action_key": key, "params": params}
+
+
+ROTATION = [
+    {"define": "芙宁娜轴", "sequence": [
+        action("芙宁娜", "元素战技"),
+        action("芙宁娜", "普通攻击", count=3),
+    ]},
+    {"call": "芙宁娜轴"},
+    {"repeat": 4, "sequence": [
+        {"call": "哥伦比娅轴", "repeat": 2},
+        action("Test", "跳过", frames=30),
+        {"repeat": 0, "sequence": [action("Test", "冲刺")]},
+    ]},
+    {"define": "哥伦比娅轴", "sequence": [
+        action("哥伦比娅", "重击"),
+        action("哥伦比娅", "普通攻击", count=2),
+        {"call": "芙宁娜轴"},
+    ]},
+    action("Test", "元素爆发", element_type="草"),
+]
+
+
+def as_tuples(commands):
+    return [(c.character_name, c.action_type, c.params) for c in commands]
+
+
+def test_matches_expanded_sequence():
+    timeline = ActionParser().parse_sequence(ROTATION)
+    expected = expand(ROTATION)
+    assert len(timeline) == len(expected) == 65
+    assert as_tuples(timeline) == expected
+
+    # 乱序与重复随机访问均与展开结果一致
+    rng = random.Random(2)
+    for i in [rng.randrange(len(expected)) for _ in range(200)] + [0, 0, -1, 64, 64]:
+        command = timeline[i]
+        assert (command.character_name, command.action_type, command.params) == expected[i]
+    assert as_tuples(timeline[5:12]) == expected[5:12]
+    with pytest.raises(IndexError):
+        timeline[65]
+
+    # 子序列各次调用共享指令对象
+    assert len(timeline.unique_commands()) == 6
+    assert timeline[1] is timeline[2] is timeline[8]
+
+
+def test_legacy_count_expansion_and_invalid_count():
+    config = [
+        action("芙宁娜", "普通攻击", count=3, note="x"),
+        action("芙宁娜", "normal_attack", count="abc"),
+        action("芙宁娜", "普通攻击", count=0),
+    ]
+    timeline = ActionParser().parse_sequence(config)
+    assert [c.params for c in timeline] == [{"note": "x"}] * 3 + [{"count": "abc"}]
+    assert "count" in config[0]["params"]
+
+
+def test_invalid_subsequences():
+    parser = ActionParser()
+    with pytest.raises(ValueError, match="未定义"):
+        parser.parse_sequence([{"call": "不存在"}])
+    with pytest.raises(ValueError, match="循环引用"):
+        parser.parse_sequence([
+            {"define": "A", "sequence": [{"call": "B"}]},
+            {"define": "B", "sequence": [{"call": "A"}]},
+            {"call": "A"},
+        ])
+    with pytest.raises(ValueError, match="重复次数"):
+        parser.parse_sequence([{"repeat": -1, "sequence": []}])
+    # 嵌套块内同名重新定义不会被静默忽略
+    with pytest.raises(ValueError, match="重复定义"):
+        parser.parse_sequence([
+            {"define": "a", "sequence": [action("Test", "元素战技")]},
+            {"call": "a"},
+            {"sequence": [
+                {"define": "a", "sequence": [action("Test", "元素爆发")]},
+                {"call": "a"},
+            ]},
+        ])
+    with pytest.raises(ValueError, match="重复定义"):
+        parser.parse_sequence(
+            [{"define": "a", "sequence": []}, {"call": "a"}],
+            subsequences={"a": [action("Test", "冲刺")]},
+        )
+
+    # 通过参数传入的子序列
+    timeline = parser.parse_sequence(
+        [{"call": "循环", "repeat": 3}], subsequences={"循环": [action("Test", "冲刺")]}
+    )
+    assert [c.action_type for c in timeline] == ["dash"] * 3
+
+
+def test_long_rotation_compiles_in_constant_space():
+    """300 秒耐久轴：编译结果只持有不同的指令对象，而不随展开长度增长。"""
+    cycle = [action("芙宁娜", "元素战技"), action("芙宁娜", "普通攻击", count=4), action("Test", "跳过", frames=5)]
+    config = [{"repeat": 200_000, "sequence": cycle}]
+    timeline = ActionParser().parse_sequence(config)
+
+    assert len(timeline) == 1_200_000
+    assert len(timeline.unique_commands()) == 3
+    assert timeline[1_199_999].action_type == "skip"
@@ -0,0 +1,111 @@
+import sys
+import threading
+import time
+import tracemalloc
+
+import pytest
+
+from core.action.action_manager import ActionInstance
+from core.context import EventEngine
+from core.event import EventPool, EventType, GameEvent
+from core.mechanics.aura import Element, Gauge
+from core.persistence.ledger import DamageLedger
+from core.systems.contract.modifier import ModifierRecord
+
+# 每模拟秒的峰值内存增量预算 (字节)
+PEAK_BYTES_PER_SECOND = 4096
+
+
+def test_hot_objects_are_slotted():
+    """高频对象不再携带实例 __dict__"""
+    for obj in (
+        GameEvent(EventType.FRAME_END, 0),
+        ModifierRecord(1, "src", "攻击力", 1.0),
+        Gauge.create(Element.PYRO, 1.0),
+    ):
+        assert not hasattr(obj, "__dict__")
+    assert "__dict__" not in dir(ActionInstance)
+
+
+def test_event_pool_reuses_instances_and_isolates_nested_publish():
+    pool = EventPool(EventType.BEFORE_CALCULATE)
+    engine = EventEngine()
+    seen = []
+
+    class Nested:
+        def handle_event(self, event):
+            seen.append(event)
+            if len(seen) == 1:
+                pool.publish(engine, event.frame + 1, data={"depth": 1})
+            assert event.data == ({"depth": 0} if event is seen[0] else {"depth": 1})
+
+    engine.subscribe(EventType.BEFORE_CALCULATE, Nested())
+    pool.publish(engine, 0, data={"depth": 0})
+
+    assert seen[0] is not seen[1]
+    first = pool.acquire(5)
+    assert first in seen and first.frame == 5 and first.data == {} and not first.cancelled
+
+
+def test_event_pool_release_drops_source_and_data():
+    """归还后的实例不再引用 source 与 data，调用方传入的字典不被清空"""
+    pool = EventPool(EventType.BEFORE_CALCULATE)
+    source = object()
+    payload = {"k": 1}
+    event = pool.acquire(3, source, payload)
+    pool.release(event)
+
+    assert event.source is None
+    assert event.data == {} and event.data is not payload
+    assert payload == {"k": 1}
+    assert pool.acquire(4).data == {}
+
+
+def test_event_pool_concurrent_acquire_hands_out_distinct_instances():
+    """多线程共享同一个池时，同一实例不会同时交给两个持有者，空池竞争时回退为新建实例"""
+    pool = EventPool(EventType.BEFORE_CALCULATE)
+    errors = []
+
+    def worker(marker: int) -> None:
+        try:
+            for _ in range(2000):
+                event = pool.acquire(marker, marker)
+                time.sleep(0)
+                if event.source != marker:
+                    errors.append(f"instance shared by {marker} and {event.source}")
+                pool.release(event)
+        except Exception as exc:  # 线程内异常不会传回主线程，记录后统一断言
+            errors.append(repr(exc))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(previous)
+
+    assert not errors
+    assert len(pool._free) <= len(threads)
+
+
+@pytest.mark.asyncio
+async def test_peak_allocation_per_simulated_second_within_budget(build_simulator):
+    steps = ([("normal_attack", {})] * 4 + [("elemental_skill", {"element_type": "火"})]) * 10
+    simulator = build_simulator(steps, DamageLedger(capacity=4096), seed=1)
+    ctx = simulator.ctx
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        await simulator.run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    seconds = ctx.current_frame / 60
+    assert seconds > 10
+    assert (peak - baseline) / seconds < PEAK_BYTES_PER_SECOND
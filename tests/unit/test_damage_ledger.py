@@ -0,0 +1,75 @@
+import pytest
+
+from core.persistence.ledger import DamageLedger
+from core.persistence.projector import DataProjector
+from core.persistence.target import create_persistence_target
+from core.systems.contract.modifier import ModifierRecord
+
+
+class ProjectorDB:
+    """逐帧快照目标：仅驱动 DataProjector 的事件投影，用作账本的对照组"""
+
+    def __init__(self):
+        self.projector = DataProjector(session_id=1)
+
+    def record_snapshot(self, snapshot):
+        self.projector.project_events(snapshot)
+
+
+STEPS = [
+    ("elemental_skill", {"element_type": "雷"}),
+    ("normal_attack", {}),
+    ("normal_attack", {}),
+    ("skip", {"frames": 90}),
+    ("normal_attack", {}),
+]
+
+
+@pytest.mark.asyncio
+async def test_ledger_matches_projector_metrics(build_simulator):
+    """账本的总伤害与峰值 DPS 口径应与 DataProjector 一致"""
+    reference = ProjectorDB()
+    await build_simulator(STEPS, reference).run()
+
+    ledger = DamageLedger(capacity=2)
+    await build_simulator(STEPS, ledger).run()
+
+    assert ledger.hits.size > 2  # 触发过扩容
+    assert ledger.total_damage == pytest.approx(reference.projector.total_damage)
+    assert ledger.max_frame == reference.projector.max_frame
+    assert ledger.peak_dps == pytest.approx(reference.projector.peak_dps)
+    assert sum(ledger.damage_by_source().values()) == pytest.approx(ledger.total_damage)
+
+
+@pytest.mark.asyncio
+async def test_persistence_targets_share_session_protocol(build_simulator, tmp_path, monkeypatch):
+    """审计数据库与内存账本经同一协议驱动，汇总总伤害一致"""
+    monkeypatch.chdir(tmp_path)
+    totals = []
+    for audit in (True, False):
+        db = create_persistence_target(audit)
+        await db.start("Protocol", {"steps": len(STEPS)})
+        await build_simulator(STEPS, db).run()
+        await db.stop()
+        totals.append(db.total_damage)
+
+    assert totals[0] > 0
+    assert totals[0] == pytest.approx(totals[1])
+
+
+@pytest.mark.asyncio
+async def test_ledger_modifier_lifecycle():
+    """修饰符在添加时开启、移除时闭合生命周期"""
+    ledger = DamageLedger()
+    static = ModifierRecord(modifier_id=1, source="武器", stat="攻击力%", value=20.0)
+    buff = ModifierRecord(modifier_id=2, source="增益", stat="暴击率", value=10.0)
+
+    await ledger.record_static_modifiers(101, [static])
+    ledger.record_events(5, [{"type": "ON_MODIFIER_ADDED", "source_id": 101, "payload": {"modifier": buff}}])
+    ledger.record_events(30, [{"type": "ON_MODIFIER_REMOVED", "source_id": 101, "payload": {"modifier": buff}}])
+
+    mods = ledger.modifiers
+    assert list(mods.column("modifier_id")) == [1, 2]
+    assert list(mods.column("start_frame")) == [0, 5]
+    assert list(mods.column("end_frame")) == [-1, 30]
+    assert ledger.decode(int(mods.column("stat")[1])) == "暴击率"
@@ -0,0 +1,68 @@
+import json
+from typing import Any
+
+import pytest
+
+from core.context import EventEngine
+from core.event import EventType, GameEvent
+from core.persistence.database import ResultDatabase
+from core.persistence.ledger import DamageLedger
+
+
+def test_profiler_counts_calls_cancellations_and_closures():
+    engine = EventEngine()
+    profiler = engine.enable_profiling()
+
+    class Canceller:
+        def handle_event(self, event):
+            event.cancel()
+
+    class Never:
+        def handle_event(self, event):
+            raise AssertionError("取消后不应继续分发")
+
+    calls = []
+    engine.subscribe(EventType.FRAME_END, lambda event: calls.append(event.frame), priority=1)
+    engine.subscribe(EventType.BEFORE_DAMAGE, Canceller(), priority=1)
+    engine.subscribe(EventType.BEFORE_DAMAGE, Never())
+
+    for frame in range(3):
+        engine.publish(GameEvent(EventType.FRAME_END, frame))
+    engine.publish(GameEvent(EventType.BEFORE_DAMAGE, 0))
+
+    assert calls == [0, 1, 2]
+    assert profiler.event_counts == {"FRAME_END": 3, "BEFORE_DAMAGE": 1}
+    stats = {(etype, label): s for etype, label, s in profiler.ranked()}
+    closure = next(s for (etype, label), s in stats.items() if etype == "FRAME_END")
+    assert closure.calls == 3 and sum(closure.histogram) == 3
+    cancel = stats[("BEFORE_DAMAGE", "test_profiler_counts_calls_cancellations_and_closures.<locals>.Canceller")]
+    assert cancel.calls == 1 and cancel.cancellations == 1
+    assert not any("Never" in label for _, label in stats)
+
+
+NORMAL_ATTACKS: list[tuple[str, dict[str, Any]]] = [("normal_attack", {})] * 4
+
+
+@pytest.mark.asyncio
+async def test_simulator_exports_profile_next_to_session(tmp_path, build_simulator):
+    ledger = DamageLedger()
+    await build_simulator(NORMAL_ATTACKS, ledger, seed=1, profile_events=True).run()
+    assert ledger.event_profile["event_counts"]["FRAME_END"] > 0
+
+    db = ResultDatabase(str(tmp_path / "audit.db"))
+    await db.initialize()
+    await db.create_session("Profile")
+    await db.start_session()
+    await build_simulator(NORMAL_ATTACKS, db, seed=1, profile_events=True).run()
+    await db.stop_session()
+
+    assert db.event_profile_path == str(tmp_path / f"audit_session{db.session_id}_events.json")
+    with open(db.event_profile_path, encoding="utf-8") as f:
+        exported = json.load(f)
+    top = exported["handlers"][0]
+    assert top["total_ms"] >= exported["handlers"][-1]["total_ms"]
+    assert {"event_type", "handler", "calls", "max_us", "cancellations", "histogram_us"} <= set(top)
+
+
+def test_profiling_is_off_by_default():
+    assert EventEngine().profiler is None
@@ -1,5 +1,6 @@
 import pytest
 import os
+import asyncio
 import aiosqlite
 from core.persistence.database import ResultDatabase
 from core.persistence.adapter import ReviewDataAdapter
@@ -153,5 +154,68 @@ async def test_persistence_full_flow():
         if os.path.exists(db_path):
             pass # 暂时保留用于手动检查
 
+
+@pytest.mark.asyncio
+async def test_failed_snapshot_in_batch_is_skipped_alone(tmp_path):
+    """批量写入中某个快照违反外键约束时，仅跳过该快照，同批其余快照照常落盘。"""
+    db_path = str(tmp_path / "batch.db")
+    db = ResultDatabase(db_path)
+    await db.initialize()
+    session_id = await db.create_session("Batch_Test_Session")
+
+    meta = {
+        "entity_id": 101, "entity_type": "CHARACTER", "name": "测试角色",
+        "level": 90, "constellation": 0, "spawn_x": 0, "spawn_y": 0, "spawn_z": 0,
+        "hitbox_radius": 0.3, "hitbox_height": 1.8,
+        "base_attributes": {}, "weapon_data": {}, "artifact_sets": [], "skill_levels": {}
+    }
+    # 全部快照在 Worker 启动前入队，合并为同一批次写入
+    db.record_snapshot({"frame": 1, "entities_meta": [meta], "team": [{"entity_id": 101, "on_field": True}]})
+    db.record_snapshot({"frame": 2, "team": [{"entity_id": 999, "on_field": True}]})
+    db.record_snapshot({"frame": 3, "team": [{"entity_id": 101, "on_field": False}]})
+    await db.start_session()
+    await db.stop_session()
+
+    async with aiosqlite.connect(db_path) as conn:
+        async with conn.execute(
+            "SELECT frame_id, entity_id FROM character_pulses WHERE session_id=? ORDER BY frame_id", (session_id,)
+        ) as cur:
+            assert await cur.fetchall() == [(1, 101), (3, 101)]
+
+
+@pytest.mark.asyncio
+async def test_idle_worker_commits_after_interval(tmp_path, monkeypatch):
+    """队列空闲时 Worker 在提交时限到达后提交，不会一直持有未提交的写事务。"""
+    monkeypatch.setattr(ResultDatabase, "COMMIT_INTERVAL", 0.05)
+    db_path = str(tmp_path / "idle.db")
+    db = ResultDatabase(db_path)
+    await db.initialize()
+    session_id = await db.create_session("Idle_Test_Session")
+
+    meta = {
+        "entity_id": 101, "entity_type": "CHARACTER", "name": "测试角色",
+        "level": 90, "constellation": 0, "spawn_x": 0, "spawn_y": 0, "spawn_z": 0,
+        "hitbox_radius": 0.3, "hitbox_height": 1.8,
+        "base_attributes": {}, "weapon_data": {}, "artifact_sets": [], "skill_levels": {}
+    }
+    await db.start_session()
+    db.record_snapshot({"frame": 1, "entities_meta": [meta], "team": [{"entity_id": 101, "on_field": True}]})
+    try:
+        # 不再有后续快照：其他连接应能读到已提交的数据
+        rows = []
+        for _ in range(50):
+            await asyncio.sleep(0.02)
+            async with aiosqlite.connect(db_path) as conn:
+                async with conn.execute(
+                    "SELECT frame_id FROM character_pulses WHERE session_id=?", (session_id,)
+                ) as cur:
+                    rows = await cur.fetchall()
+            if rows:
+                break
+        assert rows == [(1,)]
+    finally:
+        await db.stop_session()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
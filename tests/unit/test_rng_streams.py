@@ -0,0 +1,59 @@
+import pytest
+
+from character.OTHER.test_char.char import TestChar as SampleChar
+from core.action.action_data import ActionCommand
+from core.config import Config
+from core.context import create_context
+from core.persistence.ledger import DamageLedger
+from core.rng import CRIT_STREAM, TARGETING_STREAM, RandomStreams
+from core.simulator import Simulator
+from core.target import Target
+from core.team import Team
+
+
+def test_named_streams_are_independent_and_reproducible():
+    """同名流可复现，且一条流的消耗不影响其他流"""
+    a = RandomStreams(seed=42)
+    b = RandomStreams(seed=42)
+
+    # 先在 a 上大量消耗索敌流
+    for _ in range(100):
+        a.stream(TARGETING_STREAM).random()
+
+    assert [a.stream(CRIT_STREAM).random() for _ in range(5)] == [
+        b.stream(CRIT_STREAM).random() for _ in range(5)
+    ]
+    assert a.entity_stream(CRIT_STREAM, "芙宁娜").random() != a.entity_stream(CRIT_STREAM, "哥伦比娅").random()
+    assert RandomStreams().seed != RandomStreams().seed
+
+
+async def run_with_crit(seed):
+    Config.set("emulation.open_critical", True)
+    try:
+        ctx = create_context(seed=seed)
+        char = SampleChar(skill_params=[10, 10, 10])
+        char.initialize_gear()
+        char.attribute_data["暴击率"] = 50.0
+        team = Team([char], context=ctx)
+        ctx.space.set_team(team)
+        target = Target({"name": "木桩", "level": 90})
+        target.set_position(0.0, 2.0)
+        ctx.space.register(target)
+
+        sequence = [ActionCommand(char.name, "normal_attack") for _ in range(8)]
+        ledger = DamageLedger()
+        await Simulator(ctx, sequence, persistence_db=ledger).run()
+        return ledger
+    finally:
+        Config.set("emulation.open_critical", False)
+
+
+@pytest.mark.asyncio
+async def test_seeded_runs_are_reproducible():
+    """相同种子下暴击序列完全一致，种子随运行结果记录"""
+    first = await run_with_crit(seed=7)
+    second = await run_with_crit(seed=7)
+
+    assert first.rng_seed == 7
+    assert list(first.hits.column("is_crit")) == list(second.hits.column("is_crit"))
+    assert first.total_damage == second.total_damage
@@ -0,0 +1,125 @@
+from typing import Any
+
+import pytest
+
+from core.action.action_data import ActionCommand
+from core.event import EventType
+from core.persistence.ledger import DamageLedger
+from core.rules.base import ApplyMode, RuleTypeBase
+from core.rules.instance import RuleInstance
+from core.systems.rule_system import RuleSystem
+
+PREFIX = [
+    ("elemental_skill", {"element_type": "雷"}),
+    ("normal_attack", {}),
+    ("skip", {"frames": 120}),
+]
+TAILS = {
+    "skill": [("elemental_skill", {"element_type": "火"}), ("normal_attack", {})],
+    "attack": [("normal_attack", {}), ("skip", {"frames": 60}), ("normal_attack", {})],
+}
+
+
+def make_sequence(name, steps):
+    return [ActionCommand(name, key, dict(params)) for key, params in steps]
+
+
+def summarize(sim):
+    db = sim.db
+    return (
+        sim.ctx.current_frame,
+        db.total_damage,
+        list(db.hits.column("frame")),
+        list(db.hits.column("damage")),
+        list(db.energy.column("new_value")),
+    )
+
+
+@pytest.mark.asyncio
+async def test_forked_children_match_full_runs(build_simulator):
+    """从分叉点 fork 出的子模拟器，其结算结果应与从第 0 帧完整运行一致"""
+    expected = {}
+    for name, tail in TAILS.items():
+        sim = build_simulator(PREFIX + tail, DamageLedger())
+        await sim.run()
+        expected[name] = summarize(sim)
+
+    root = build_simulator(PREFIX + TAILS["skill"], DamageLedger())
+    root.stop_at_action = len(PREFIX)
+    await root.run()
+    assert root.paused
+    checkpoint = root.checkpoint()
+
+    char_name = root.ctx.space.team.members[0].name
+    for name, tail in TAILS.items():
+        child = checkpoint.fork(make_sequence(char_name, PREFIX + tail))
+        await child.run()
+        assert not child.paused
+        assert summarize(child) == expected[name]
+
+    # 检查点本身不受子模拟器运行影响
+    assert checkpoint.frame == root.ctx.current_frame
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_rejects_unforkable_persistence(build_simulator):
+    """写入外部存储的持久化目标无法随检查点分叉"""
+
+    class DenseDB:
+        def record_snapshot(self, snapshot):
+            pass
+
+    sim = build_simulator(PREFIX + TAILS["skill"], DenseDB())
+    sim.stop_at_action = 1
+    await sim.run()
+
+    with pytest.raises(ValueError):
+        sim.checkpoint()
+
+
+class DamageCountingRule(RuleTypeBase):
+    """订阅模式规则：记录每次伤害事件所作用的上下文"""
+
+    rule_type_id = "test_damage_counter"
+    display_name = "伤害计数"
+    apply_mode = ApplyMode.SUBSCRIBE
+
+    def __init__(self):
+        self.seen = []
+
+    def apply(self, params, ctx):
+        pass
+
+    def get_event_filter(self) -> Any:
+        return EventType.AFTER_DAMAGE
+
+    def on_event(self, event, params, ctx):
+        self.seen.append(ctx)
+        params["hits"] = params.get("hits", 0) + 1
+
+
+@pytest.mark.asyncio
+async def test_forked_rule_handlers_act_on_child_context(build_simulator):
+    """订阅规则随检查点复制：子模拟器中的规则只作用于子上下文，父模拟器保持不变"""
+    root = build_simulator(PREFIX + TAILS["skill"], DamageLedger())
+    rule_system = root.ctx.get_system(RuleSystem)
+    rule = DamageCountingRule()
+    instance = RuleInstance(rule_type_id=rule.rule_type_id, _rule_type=rule)
+    rule_system.add_instance(instance)
+    root.stop_at_action = len(PREFIX)
+    await root.run()
+    assert instance.params["hits"] > 0
+    assert {id(ctx) for ctx in rule.seen} == {id(root.ctx)}
+
+    parent_hits = instance.params["hits"]
+    parent_frame = root.ctx.current_frame
+    child = root.checkpoint().fork()
+    await child.run()
+
+    child_system = child.ctx.get_system(RuleSystem)
+    child_params = child_system.get_instances()[0].params
+    assert child_params["hits"] > parent_hits
+    assert instance.params["hits"] == parent_hits
+    assert root.ctx.current_frame == parent_frame
+    # 父规则对象未收到子模拟器的事件
+    assert {id(ctx) for ctx in rule.seen} == {id(root.ctx)}
@@ -0,0 +1,115 @@
+import pytest
+
+from character.OTHER.test_char.char import TestChar as SampleChar
+from core.config import Config
+from core.context import create_context
+from core.effect.base import BaseEffect
+from core.event import EventType
+from core.tool import get_next_wakeup
+
+
+class DamageRecorder:
+    def __init__(self):
+        self.records = []
+
+    def handle_event(self, event):
+        dmg = event.data["damage"]
+        self.records.append((event.frame, dmg.name, dmg.target.name, dmg.damage))
+
+
+STEPS = [
+    ("elemental_skill", {"element_type": "雷"}),
+    ("normal_attack", {}),
+    ("skip", {"frames": 300}),
+    ("normal_attack", {}),
+]
+
+
+def with_recorder(sim):
+    recorder = DamageRecorder()
+    sim.ctx.event_engine.subscribe(EventType.AFTER_DAMAGE, recorder)
+    return sim, sim.ctx.space.team.members[0], recorder
+
+
+@pytest.mark.asyncio
+async def test_fast_forward_matches_frame_by_frame(build_simulator):
+    """快进模式的伤害轨迹、终止帧与实体状态应与逐帧驱动完全一致"""
+    base_sim, base_char, base_rec = with_recorder(build_simulator(STEPS, targets=2, fast_forward=False))
+    await base_sim.run()
+
+    ff_sim, ff_char, ff_rec = with_recorder(build_simulator(STEPS, targets=2, fast_forward=True))
+    await ff_sim.run()
+
+    assert base_rec.records
+    assert ff_rec.records == base_rec.records
+    assert ff_sim.ctx.current_frame == base_sim.ctx.current_frame
+    assert ff_char.current_frame == base_char.current_frame
+    assert ff_char.action_manager.combo_counter == base_char.action_manager.combo_counter
+    assert ff_sim.ctx.global_move_dist == base_sim.ctx.global_move_dist
+    assert ff_sim.skipped_frames > 0
+    assert base_sim.skipped_frames == 0
+
+
+@pytest.mark.asyncio
+async def test_fast_forward_disabled_for_dense_persistence(build_simulator):
+    """需要逐帧快照的持久化目标会自动禁用快进"""
+
+    class DenseDB:
+        def __init__(self):
+            self.frames = []
+
+        def record_snapshot(self, snapshot):
+            self.frames.append(snapshot["frame"])
+
+    db = DenseDB()
+    sim = build_simulator(STEPS, db, targets=2, fast_forward=True)
+    await sim.run()
+
+    assert sim.skipped_frames == 0
+    assert db.frames[:3] == [0, 1, 2]
+
+
+def test_undeclared_tick_override_blocks_skipping():
+    """子类重写逐帧钩子但未声明唤醒帧时，应保守地逐帧驱动"""
+    create_context()
+    owner = SampleChar(skill_params=[1, 1, 1])
+
+    class TimedEffect(BaseEffect):
+        pass
+
+    class TickingEffect(BaseEffect):
+        def on_tick(self, target):
+            pass
+
+    timed = TimedEffect(owner, "计时", duration=90)
+    timed.is_active = True
+    ticking = TickingEffect(owner, "逐帧", duration=90)
+    ticking.is_active = True
+
+    assert get_next_wakeup(timed, 10, "on_frame_update", "on_tick") == 100
+    assert get_next_wakeup(ticking, 10, "on_frame_update", "on_tick") == 11
+
+
+def test_assembler_passes_fast_forward_option():
+    """组装器按请求配置或全局配置 emulation.fast_forward 开启快进"""
+    from core.data.repository import MockDataRepository
+    from core.factory.assembler import SimulationAssembler
+
+    assembler = SimulationAssembler(MockDataRepository(char_data={
+        1: {"name": "Test", "element": "雷", "type": "法器", "base_hp": 12000, "base_atk": 800, "base_def": 600},
+    }))
+    config = {
+        "context_config": {"team": [{"character": {"id": 1, "level": 90, "talents": "1/1/1"}}]},
+        "sequence_config": [],
+    }
+
+    assert not assembler.assemble(config)[0].fast_forward
+    assert assembler.assemble({**config, "fast_forward": True})[0].fast_forward
+
+    original = Config.get("emulation.fast_forward")
+    Config.set("emulation.fast_forward", True)
+    try:
+        assert assembler.assemble(config)[0].fast_forward
+        assert not assembler.assemble({**config, "fast_forward": False})[0].fast_forward
+    finally:
+        Config.set("emulation.fast_forward", original)
@@ -0,0 +1,280 @@
+import random
+
+import pytest
+
+import core.effect.base as effect_base
+from core.context import create_context
+from core.effect.base import BaseEffect
+from core.effect.common import StatModifierEffect
+from core.entities.base_entity import BaseEntity, CombatEntity, Faction
+from core.timer_wheel import TimerWheel
+
+
+class TestTimerWheel:
+    def test_fires_in_due_order_across_levels(self):
+        wheel = TimerWheel()
+        fired = []
+        # 覆盖第 0 层、第 1 层与溢出堆，并包含同帧多个定时器
+        dues = [1, 5, 5, 255, 256, 257, 600, 1000, 256 * 64, 256 * 70 + 3, 256 * 200]
+        for i, due in enumerate(dues):
+            wheel.schedule(due, lambda d=due, i=i: fired.append((wheel.now, d, i)))
+        assert len(wheel) == len(dues)
+
+        wheel.advance(256 * 200)
+        assert [(d, i) for _, d, i in fired] == sorted((d, i) for i, d in enumerate(dues))
+        # 回调执行时时钟停在到期帧
+        assert all(now == due for now, due, _ in fired)
+        assert len(wheel) == 0
+
+    def test_cancel_and_reschedule(self):
+        wheel = TimerWheel()
+        fired = []
+        a = wheel.schedule(10, lambda: fired.append("a"))
+        b = wheel.schedule(20_000, lambda: fired.append("b"))
+        c = wheel.schedule(300, lambda: fired.append("c"))
+        wheel.cancel(a)
+        wheel.cancel(a)
+        c = wheel.reschedule(c, 12)
+        assert wheel.next_due() == 12
+        assert len(wheel) == 2
+
+        wheel.advance(100)
+        assert fired == ["c"]
+        wheel.cancel(b)
+        assert wheel.next_due() == float("inf")
+        with pytest.raises(ValueError):
+            wheel.reschedule(None, 5)
+
+    def test_overdue_timer_fires_on_next_advance(self):
+        wheel = TimerWheel()
+        wheel.advance(50)
+        fired = []
+        wheel.schedule(40, lambda: fired.append(40))
+        assert wheel.next_due() == 51
+        wheel.advance(51)
+        assert fired == [40]
+        assert wheel.next_due() == float("inf")
+
+    def test_matches_sorted_reference(self):
+        rng = random.Random(11)
+        wheel = TimerWheel()
+        fired, pending, handles = [], {}, []
+        for step in range(400):
+            for _ in range(rng.randrange(4)):
+                due = wheel.now + rng.choice([1, 2, rng.randrange(300), rng.randrange(40_000)])
+                key = len(handles)
+                handles.append(wheel.schedule(due, lambda k=key: fired.append(k)))
+                pending[key] = due
+            if pending and rng.random() < 0.3:
+                key = rng.choice(list(pending))
+                wheel.cancel(handles[key])
+                del pending[key]
+            target = wheel.now + rng.choice([1, 1, 7, 300])
+            assert wheel.next_due() == min(pending.values(), default=float("inf"))
+            expected = sorted((d, k) for k, d in pending.items() if d <= target)
+            fired.clear()
+            wheel.advance(target)
+            assert fired == [k for _, k in expected]
+            for _, k in expected:
+                del pending[k]
+
+
+class PassiveBuff(StatModifierEffect):
+    pass
+
+
+class Applier(BaseEntity):
+    """先于目标逐帧的实体：在目标本帧逐帧之前执行脚本中的挂载/刷新。"""
+
+    def __init__(self, ctx, target, script):
+        super().__init__("施加者", faction=Faction.ENEMY, context=ctx)
+        self.target = target
+        self.script = script
+        self.effects = {}
+
+    def _perform_tick(self):
+        for when, action, name, duration in self.script:
+            if when != self.ctx.current_frame:
+                continue
+            if action == "apply":
+                eff = PassiveBuff(self.target, name, {"攻击力%": 10.0}, duration)
+                self.effects[name] = eff.apply()
+            else:
+                self.effects[name].duration = duration
+
+
+def run_expiry_trace(scheduled, monkeypatch, script):
+    """按脚本挂载/刷新效果并逐帧推进，返回每个效果被移除的帧号。"""
+    if not scheduled:
+        monkeypatch.setattr(BaseEffect, "_can_schedule", lambda self: False)
+    ctx = create_context()
+    entity = CombatEntity("目标", faction=Faction.ENEMY, context=ctx)
+    applier = Applier(ctx, entity, script)
+    ctx.space.register(applier)
+    ctx.space.register(entity)
+    removed = {}
+    for _ in range(400):
+        ctx.advance_frame()
+        frame = ctx.current_frame
+        if frame % 37 == 0:
+            # 目标已完成本帧逐帧后的刷新与挂载
+            for name, eff in applier.effects.items():
+                if eff.is_active and name.startswith("帧后"):
+                    eff.duration = eff.duration + 5
+            PassiveBuff(entity, f"帧末{frame}", {"攻击力%": 1.0}, frame % 11 + 1).apply()
+        for name, eff in list(applier.effects.items()) + [
+            (e.name, e) for e in entity.active_effects if e.name.startswith("帧末")
+        ]:
+            if name not in removed and not eff.is_active:
+                removed[name] = frame
+        for eff in entity.active_effects:
+            if eff.name.startswith("帧末"):
+                applier.effects.setdefault(eff.name, eff)
+    return removed, entity
+
+
+class TestPassiveEffectExpiry:
+    SCRIPT = [
+        (1, "apply", "短", 1),
+        (1, "apply", "小数", 2.5),
+        (2, "apply", "长", 300),
+        (3, "apply", "帧后A", 60),
+        (5, "apply", "负", -1),
+        (10, "refresh", "长", 20),
+        (12, "apply", "永久", float("inf")),
+        (40, "refresh", "永久", 15),
+        (50, "apply", "帧后B", 90),
+    ]
+
+    def test_removal_frames_match_per_frame_countdown(self, monkeypatch):
+        scheduled, entity = run_expiry_trace(True, monkeypatch, self.SCRIPT)
+        assert entity._ticking_effects == []
+        monkeypatch.undo()
+        legacy, _ = run_expiry_trace(False, monkeypatch, self.SCRIPT)
+        assert scheduled == legacy
+        assert {name for _, action, name, _ in self.SCRIPT if action == "apply"} <= set(scheduled)
+        assert sum(name.startswith("帧末") for name in scheduled) == 10
+
+    def test_ticking_effects_keep_per_frame_path(self):
+        class Ticking(BaseEffect):
+            def __init__(self, owner):
+                super().__init__(owner, "逐帧", 3)
+                self.ticks = 0
+
+            def on_tick(self, target):
+                self.ticks += 1
+
+        assert not Ticking.is_passive()
+        assert PassiveBuff.is_passive()
+        assert effect_base._PASSIVE_CLASSES[PassiveBuff] is True
+
+        ctx = create_context()
+        entity = CombatEntity("目标", faction=Faction.ENEMY, context=ctx)
+        ctx.space.register(entity)
+        eff = Ticking(entity).apply()
+        assert entity._ticking_effects == [eff]
+        for _ in range(3):
+            ctx.advance_frame()
+        assert eff.ticks == 2 and not eff.is_active
+        assert entity._ticking_effects == []
+
+    def test_remove_cancels_timer_and_freezes_duration(self):
+        ctx = create_context()
+        entity = CombatEntity("目标", faction=Faction.ENEMY, context=ctx)
+        ctx.space.register(entity)
+        eff = PassiveBuff(entity, "增益", {"攻击力%": 10.0}, 30).apply()
+        assert len(ctx.timers) == 1
+        for _ in range(10):
+            ctx.advance_frame()
+        assert eff.duration == 20
+        # 登记的是最早可能的到期帧 (帧 0 挂载时持有者本帧不再逐帧)
+        assert ctx.current_frame < ctx.next_wakeup() <= ctx.current_frame + 20
+
+        eff.remove()
+        assert len(ctx.timers) == 0
+        ctx.advance_frame()
+        assert eff.duration == 20
+
+
+class TestCountdownsOnWheel:
+    @staticmethod
+    def make_team(ctx, count=1):
+        from character.OTHER.test_char.char import TestChar
+        from core.team import Team
+
+        members = []
+        for i in range(count):
+            char = TestChar(skill_params=[1, 1, 1])
+            char.name = f"Test{i}"
+            members.append(char)
+        team = Team(members, context=ctx)
+        ctx.space.set_team(team)
+        return team
+
+    def test_swap_cd_counts_down_on_wheel(self):
+        ctx = create_context()
+        team = self.make_team(ctx, count=2)
+        assert team.swap("Test1")
+        assert team.swap_cd_timer == 60 and len(ctx.timers) == 1
+        for _ in range(59):
+            ctx.advance_frame()
+        assert team.swap_cd_timer == 1
+        assert not team.swap("Test0")
+        ctx.advance_frame()
+        assert team.swap_cd_timer == 0 and len(ctx.timers) == 0
+        assert team.swap("Test0")
+
+    def test_combo_resets_after_idle_frames(self):
+        from core.action.action_data import ActionFrameData
+
+        ctx = create_context()
+        manager = self.make_team(ctx).members[0].action_manager
+        attack = ActionFrameData(name="普攻", total_frames=10)
+
+        assert manager.request_action(attack)
+        for _ in range(10):
+            ctx.advance_frame()
+        assert manager.current_action is None and manager.combo_counter == 2
+        # 动作结束于第 10 帧，空闲 120 帧后重置
+        assert ctx.timers.next_due() == 130
+        ctx.fast_forward(119)
+        assert manager.combo_counter == 2
+        ctx.advance_frame()
+        assert manager.combo_counter == 1
+
+        # 空闲期间的新动作取消重置，并在其结束后重新计时
+        assert manager.request_action(attack)
+        for _ in range(5):
+            ctx.advance_frame()
+        assert manager.request_action(attack) is False
+        for _ in range(5):
+            ctx.advance_frame()
+        assert manager.combo_counter == 2 and len(ctx.timers) == 1
+        assert ctx.timers.next_due() == ctx.current_frame + 120
+
+    def test_non_moonsign_bonus_expires_on_wheel(self):
+        from core.systems.moonsign_system import MoonsignSystem
+
+        ctx = create_context()
+        system = MoonsignSystem()
+        system.context = ctx
+        system.non_moonsign_bonus = 18.0
+        system.non_moonsign_timer = 1200
+        ctx.fast_forward(600)
+        # 覆盖增益时取消旧的到期定时器
+        system.non_moonsign_timer = 1200
+        assert len(ctx.timers) == 1
+        ctx.fast_forward(1199)
+        assert system.non_moonsign_timer == 1
+        assert system.get_non_moonsign_bonus() == 18.0
+        ctx.advance_frame()
+        assert system.non_moonsign_timer == 0 and len(ctx.timers) == 0
+        assert system.get_non_moonsign_bonus() == 0.0
+
+    def test_clear_cancels_registered_handles(self):
+        wheel = TimerWheel()
+        handle = wheel.schedule(5, lambda: None)
+        wheel.clear()
+        assert handle.cancelled
+        wheel.cancel(handle)
+        assert len(wheel) == 0
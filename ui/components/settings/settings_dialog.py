@@ -38,6 +38,18 @@ def _build_emulation_section(state: SettingsState) -> ft.Control:
                 value=bool(state.get_value("emulation.open_critical", True)),
                 on_change=lambda v: state.set_value("emulation.open_critical", v),
             ),
+            ConfigSwitchItem(
+                label="暴击期望模式",
+                description="以 1 + 暴击率 × 暴击伤害 结算期望伤害，单次运行即得期望 DPS",
+                value=state.get_value("emulation.crit_mode", "random") == "expectation",
+                on_change=lambda v: state.set_value("emulation.crit_mode", "expectation" if v else "random"),
+            ),
+            ConfigSwitchItem(
+                label="空闲帧快进",
+                description="跳过无事发生的空闲帧，结果与逐帧驱动一致 (需逐帧快照的审计运行自动禁用)",
+                value=bool(state.get_value("emulation.fast_forward", False)),
+                on_change=lambda v: state.set_value("emulation.fast_forward", v),
+            ),
         ],
         spacing=8,
     )
@@ -1,7 +1,7 @@
 import time
 from typing import Dict, Any, Optional, Callable
 from core.factory.assembler import SimulationAssembler
-from core.persistence.database import ResultDatabase
+from core.persistence.target import create_persistence_target
 from core.batch.models import SimulationMetrics
 from core.logger import get_ui_logger
 
@@ -16,23 +16,24 @@ class SimulationService:
     async def run_single(
         self,
         config: Dict[str, Any],
-        on_progress: Callable[[str, float], None]
+        on_progress: Callable[[str, float], None],
+        audit: bool = True
     ) -> Optional[SimulationMetrics]:
-        """执行单次仿真任务"""
+        """执行单次仿真任务
+
+        audit 为 False 时使用内存账本 (DamageLedger)，不写入结果数据库，
+        适用于只关心汇总指标、无需审计下钻的场景。
+        """
         if self.is_simulating:
             return None
 
         self.is_simulating = True
-        db = ResultDatabase()
+        db = create_persistence_target(audit)
 
         try:
             on_progress("INITIALIZING DB...", 0.1)
-            await db.initialize()
-
             # 1. 创建会话
-            config_name = f"仿真_{int(time.time())}"
-            await db.create_session(config_name, config_snapshot=config)
-            await db.start_session()
+            await db.start(f"仿真_{int(time.time())}", config)
 
             on_progress("BUILDING SIMULATION...", 0.2)
             # 2. 组装仿真器（使用完整版以获取静态修饰符数据）
@@ -41,20 +42,17 @@ class SimulationService:
 
             # 2.1 持久化静态修饰符（武器/圣遗物）
             for data in static_modifiers_data:
-                await db.record_static_modifiers(
-                    data["entity_id"],
-                    data["modifiers"]
-                )
+                await db.record_static_modifiers(data["entity_id"], data["modifiers"])
 
             on_progress("RUNNING SIMULATION...", 0.3)
             # 3. 运行仿真
             await simulator.run()
 
             on_progress("FINALIZING DATA...", 0.9)
-            await db.stop_session()
+            await db.stop()
+            total_dmg = db.total_damage
 
             # 4. 合算结果
-            total_dmg = db.projector.total_damage if db.projector else 0.0
             duration = simulator.ctx.current_frame
             dps = (total_dmg / duration * 60) if duration > 0 else 0.0
 
@@ -66,7 +64,7 @@ class SimulationService:
             get_ui_logger().log_error(f"SimulationService: Single run failed: {e}")
             on_progress(f"FAILED: {str(e)[:20]}", 0.0)
             try:
-                await db.stop_session()
+                await db.stop()
             except Exception:
                 pass
             raise e
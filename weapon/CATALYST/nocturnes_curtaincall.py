@@ -238,3 +238,7 @@ class NocturnesCurtainCall(Weapon):
     def on_frame_update(self) -> None:
         """每帧更新（用于调试或扩展）。"""
         pass
+
+    def next_wakeup(self, frame: int) -> float:
+        """无逐帧逻辑，无需唤醒。"""
+        return float("inf")
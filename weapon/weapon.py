@@ -74,6 +74,14 @@ class Weapon:
         """统一每帧逻辑更新接口"""
         pass
 
+    def next_wakeup(self, frame: int) -> float:
+        """[快进协议] 返回下一唤醒帧。重写 on_frame_update 的子类需同步重写。"""
+        return float("inf")
+
+    def fast_forward(self, frames: int) -> None:
+        """[快进协议] 跳过 frames 个空闲帧。"""
+        pass
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,